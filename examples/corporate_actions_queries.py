@@ -9,6 +9,12 @@ The silver layer is partitioned by ticker/event_type for optimal query performan
 - Single ticker queries only read 1 file
 - Portfolio queries only read relevant ticker partitions
 - Event-type filtering skips irrelevant partitions
+
+Partition files are resolved from silver/corporate_actions/_index.parquet
+(rebuilt by the silver transformation, or by
+scripts/transformation/build_silver_index.py) rather than by reading
+every partition. Without an index the partition directories are globbed
+instead.
 """
 
 import sys
@@ -21,6 +27,44 @@ import polars as pl
 from src.utils.paths import get_quantlake_root
 
 
+def silver_files(silver_path: Path, predicate: pl.Expr) -> list:
+    """
+    Resolve silver partition files matching predicate from _index.parquet
+
+    The predicate can use the index columns: ticker, event_type, n_rows,
+    event_date_min and event_date_max. The index is rebuilt by the silver
+    transformation after every write, so it is trusted as-is; only when it
+    is missing are the partitions globbed, with null n_rows and
+    event_date range.
+    """
+    index_file = silver_path / '_index.parquet'
+
+    if index_file.exists():
+        index = pl.read_parquet(index_file)
+    else:
+        print(
+            f"⚠️  {index_file} not found, globbing partitions. Build it with: "
+            "python scripts/transformation/build_silver_index.py"
+        )
+        partition_files = sorted(silver_path.glob('ticker=*/event_type=*/*.parquet'))
+        index = pl.DataFrame({
+            'ticker': [f.parent.parent.name.split('=', 1)[1] for f in partition_files],
+            'event_type': [f.parent.name.split('=', 1)[1] for f in partition_files],
+            'file_path': [str(f.relative_to(silver_path)) for f in partition_files],
+        }, schema={
+            'ticker': pl.String,
+            'event_type': pl.String,
+            'file_path': pl.String,
+        }).with_columns(
+            pl.lit(None, dtype=pl.Int64).alias('n_rows'),
+            pl.lit(None, dtype=pl.Date).alias('event_date_min'),
+            pl.lit(None, dtype=pl.Date).alias('event_date_max'),
+        )
+
+    index = index.filter(predicate)
+    return [str(silver_path / file_path) for file_path in index['file_path']]
+
+
 def example_1_single_ticker_dividends():
     """
     Example 1: Get all dividend history for a single ticker
@@ -34,19 +78,26 @@ def example_1_single_ticker_dividends():
     silver_path = get_quantlake_root() / 'silver' / 'corporate_actions'
 
     # Ticker-first partitioning means we only read 1 file!
-    df = pl.scan_parquet(
-        str(silver_path / 'ticker=AAPL' / 'event_type=dividend' / '*.parquet')
-    ).collect()
+    files = silver_files(
+        silver_path,
+        (pl.col('ticker') == 'AAPL') & (pl.col('event_type') == 'dividend')
+    )
+    if not files:
+        print("\nNo matching silver partitions found")
+        return
 
-    print(f"\nTotal dividends: {len(df)}")
-    print(f"\nMost recent dividends:")
-    print(df.select([
+    # Selecting before collect() lets the reader skip all other columns.
+    df = pl.scan_parquet(files).select([
         'event_date',
         'div_cash_amount',
         'div_currency',
         'div_frequency',
         'div_annualized_amount'
-    ]).head(10))
+    ]).collect(engine='streaming')
+
+    print(f"\nTotal dividends: {len(df)}")
+    print(f"\nMost recent dividends:")
+    print(df.head(10))
 
     # Calculate total dividends paid in last year
     one_year_ago = datetime.now().date() - timedelta(days=365)
@@ -70,23 +121,18 @@ def example_2_portfolio_screening():
     portfolio = ['AAPL', 'MSFT', 'GOOGL', 'NVDA', 'META', 'ABBV', 'ABT']
     silver_path = get_quantlake_root() / 'silver' / 'corporate_actions'
 
-    # Build paths for each ticker's dividend partition
-    paths = [
-        str(silver_path / f'ticker={ticker}' / 'event_type=dividend' / '*.parquet')
-        for ticker in portfolio
-    ]
-
-    # Read only the relevant partitions
-    df = pl.scan_parquet(paths).collect()
-
-    print(f"\nPortfolio: {', '.join(portfolio)}")
-    print(f"Total dividend records: {len(df)}")
+    # The ticker/event_type filter is evaluated against the index, so only
+    # the matching partitions are opened
+    files = silver_files(
+        silver_path,
+        pl.col('ticker').is_in(portfolio) & (pl.col('event_type') == 'dividend')
+    )
+    if not files:
+        print("\nNo matching silver partitions found")
+        return
 
-    # Get most recent dividend for each ticker
-    recent_divs = (
-        df.sort('event_date', descending=True)
-          .group_by('ticker')
-          .first()
+    dividends = (
+        pl.scan_parquet(files)
           .select([
               'ticker',
               'event_date',
@@ -94,9 +140,25 @@ def example_2_portfolio_screening():
               'div_annualized_amount',
               'div_frequency'
           ])
+    )
+
+    # Most recent dividend for each ticker: take the row at the per-group
+    # arg_max of event_date, a hash aggregation instead of a full sort.
+    # Grouping on Categorical hashes u32 codes rather than strings; ticker is
+    # cast back to String for display.
+    latest = (
+        dividends.with_columns(pl.col('ticker').cast(pl.Categorical))
+          .group_by('ticker')
+          .agg(pl.all().get(pl.col('event_date').arg_max()))
+          .with_columns(pl.col('ticker').cast(pl.String))
           .sort('ticker')
     )
 
+    df, recent_divs = pl.collect_all([dividends, latest], engine='streaming')
+
+    print(f"\nPortfolio: {', '.join(portfolio)}")
+    print(f"Total dividend records: {len(df)}")
+
     print(f"\nMost recent dividend for each ticker:")
     print(recent_divs)
     print(f"\nFiles read: {len(portfolio)} (one per ticker)")
@@ -106,7 +168,9 @@ def example_3_recent_stock_splits():
     """
     Example 3: Find all stock splits in the last 5 years
 
-    Performance: Reads all ticker=*/event_type=split partitions, but filters by date
+    Performance: Only opens split partitions whose event_date range overlaps
+    the window (from the index), and the date filter is pushed into the
+    Parquet reader so rows outside the window are never materialized
     """
     print("\n" + "="*80)
     print("EXAMPLE 3: Recent Stock Splits (Last 5 Years)")
@@ -115,27 +179,48 @@ def example_3_recent_stock_splits():
     silver_path = get_quantlake_root() / 'silver' / 'corporate_actions'
     five_years_ago = datetime.now().date() - timedelta(days=365*5)
 
-    # Read all split partitions, filter by date
-    df = (
-        pl.scan_parquet(str(silver_path / '*/event_type=split/*.parquet'))
-          .filter(pl.col('event_date') >= five_years_ago)
-          .collect()
+    # Files whose newest split predates the window are dropped using the
+    # index's event_date_max, so their footers are never opened. The filter
+    # also sits directly on the scan so Polars pushes it into the Parquet
+    # reader for the remaining files. Both frames share one lazy scan and are
+    # collected together on the streaming engine.
+    files = silver_files(
+        silver_path,
+        (pl.col('event_type') == 'split') &
+        # Files without date statistics have a null range and are kept
+        (pl.col('event_date_max') >= five_years_ago).fill_null(True)
     )
+    if not files:
+        print(f"\nNo split partitions with events since {five_years_ago}")
+        return
 
-    print(f"\nTotal splits since {five_years_ago}: {len(df)}")
-    print(f"\nRecent splits:")
-    print(df.select([
+    splits = pl.scan_parquet(files).filter(
+        pl.col('event_date') >= five_years_ago
+    )
+
+    recent = splits.select([
         'ticker',
         'event_date',
         'split_from',
         'split_to',
         'split_ratio',
         'split_is_reverse'
-    ]).sort('event_date', descending=True))
+    ]).sort('event_date', descending=True)
+
+    # Count tickers with forward/reverse splits in a single aggregation
+    counts = splits.group_by('split_is_reverse').agg(
+        pl.col('ticker').n_unique().alias('n')
+    )
+
+    df, counts = pl.collect_all([recent, counts], engine='streaming')
 
-    # Count reverse splits
-    reverse_splits = df.filter(pl.col('split_is_reverse')).select('ticker').n_unique()
-    forward_splits = df.filter(~pl.col('split_is_reverse')).select('ticker').n_unique()
+    print(f"\nTotal splits since {five_years_ago}: {len(df)}")
+    print(f"\nRecent splits:")
+    print(df)
+
+    # counts has at most two rows (forward/reverse); missing groups mean zero
+    reverse_splits = counts.filter(pl.col('split_is_reverse'))['n'].sum()
+    forward_splits = counts.filter(~pl.col('split_is_reverse'))['n'].sum()
 
     print(f"\nForward splits: {forward_splits}")
     print(f"Reverse splits: {reverse_splits}")
@@ -153,17 +238,26 @@ def example_4_ticker_changes():
 
     silver_path = get_quantlake_root() / 'silver' / 'corporate_actions'
 
-    df = pl.scan_parquet(
-        str(silver_path / '*/event_type=ticker_change/*.parquet')
-    ).collect()
+    files = silver_files(silver_path, pl.col('event_type') == 'ticker_change')
+    if not files:
+        print("\nNo matching silver partitions found")
+        return
 
-    print(f"\nTotal ticker changes: {len(df)}")
-    print(f"\nRecent ticker changes:")
-    print(df.select([
+    changes = pl.scan_parquet(files).select([
         'ticker',
         'new_ticker',
         'event_date'
-    ]).sort('event_date', descending=True).head(20))
+    ])
+
+    # Keep the top-20 inside the plan so Polars can run it as a TopK
+    total, recent = pl.collect_all([
+        changes.select(pl.len()),
+        changes.sort('event_date', descending=True).head(20)
+    ], engine='streaming')
+
+    print(f"\nTotal ticker changes: {total.item()}")
+    print(f"\nRecent ticker changes:")
+    print(recent)
 
 
 def example_5_dividend_yield_calculation():
@@ -179,28 +273,34 @@ def example_5_dividend_yield_calculation():
     portfolio = ['ABBV', 'ABT']  # Known dividend payers
     silver_path = get_quantlake_root() / 'silver' / 'corporate_actions'
 
-    paths = [
-        str(silver_path / f'ticker={ticker}' / 'event_type=dividend' / '*.parquet')
-        for ticker in portfolio
-    ]
+    paths = silver_files(
+        silver_path,
+        pl.col('ticker').is_in(portfolio) & (pl.col('event_type') == 'dividend')
+    )
+    if not paths:
+        print("\nNo matching silver partitions found")
+        return
 
     df = (
         pl.scan_parquet(paths)
-          .sort('event_date', descending=True)
+          .select([
+              'ticker',
+              'event_date',
+              'div_cash_amount',
+              'div_frequency',
+              'div_annualized_amount',
+              'div_quarter',
+              'div_is_special'
+          ])
+          .with_columns(pl.col('ticker').cast(pl.Categorical))  # Group on u32 codes
           .group_by('ticker')
-          .first()  # Most recent dividend
-          .collect()
+          .agg(pl.all().get(pl.col('event_date').arg_max()))  # Most recent dividend
+          .with_columns(pl.col('ticker').cast(pl.String))
+          .collect(engine='streaming')
     )
 
     print(f"\nCurrent annualized dividend per share:")
-    print(df.select([
-        'ticker',
-        'div_cash_amount',
-        'div_frequency',
-        'div_annualized_amount',
-        'div_quarter',
-        'div_is_special'
-    ]))
+    print(df.drop('event_date'))
 
     # To calculate yield, you would join with current stock price
     print(f"\nNote: To calculate yield %, join with current stock prices:")
@@ -225,7 +325,12 @@ def example_6_duckdb_integration():
 
     silver_path = get_quantlake_root() / 'silver' / 'corporate_actions'
 
-    # DuckDB can read partitioned parquet with predicate pushdown
+    # hive_partitioning turns the event_type predicate into a "File Filters:"
+    # entry in EXPLAIN, so non-dividend directories are never opened. The
+    # event_date predicate is pushed into read_parquet ("Filters:") and
+    # checked against the event_date min/max statistics the silver writer
+    # stores; a partition (one row group per ticker/event_type) whose
+    # dividends all predate the bound is skipped after reading its footer.
     query = f"""
     SELECT
         ticker,
@@ -233,8 +338,9 @@ def example_6_duckdb_integration():
         div_cash_amount,
         div_annualized_amount,
         div_frequency
-    FROM read_parquet('{silver_path}/*/event_type=dividend/*.parquet')
-    WHERE event_date >= '2024-01-01'
+    FROM read_parquet('{silver_path}/ticker=*/event_type=*/*.parquet', hive_partitioning=1)
+    WHERE event_type = 'dividend'
+      AND event_date >= DATE '2024-01-01'
       AND div_cash_amount > 0.5
     ORDER BY event_date DESC
     LIMIT 20
@@ -259,17 +365,25 @@ def example_7_full_corporate_actions_timeline():
     ticker = 'ABBV'
     silver_path = get_quantlake_root() / 'silver' / 'corporate_actions'
 
-    # Read all event types for this ticker
-    df = pl.scan_parquet(
-        str(silver_path / f'ticker={ticker}' / '*/data.parquet')
-    ).collect()
+    files = silver_files(silver_path, pl.col('ticker') == ticker)
+    if not files:
+        print(f"\nNo silver partitions found for {ticker}")
+        return
+
+    # Read all event types for this ticker, only the columns used below
+    df = pl.scan_parquet(files).select([
+        'event_type',
+        'event_date',
+        'div_cash_amount',
+        'split_ratio'
+    ]).collect(engine='streaming')
 
     print(f"\nAll corporate actions for {ticker}:")
     print(f"Total events: {len(df)}")
 
     # Show summary by event type
     summary = df.group_by('event_type').agg([
-        pl.count().alias('count'),
+        pl.len().alias('count'),
         pl.col('event_date').min().alias('first_event'),
         pl.col('event_date').max().alias('last_event')
     ]).sort('count', descending=True)
@@ -282,7 +396,6 @@ def example_7_full_corporate_actions_timeline():
         df.sort('event_date', descending=True)
           .group_by('event_type')
           .head(2)
-          .select(['event_type', 'event_date', 'div_cash_amount', 'split_ratio'])
           .sort('event_date', descending=True)
     )
 
@@ -472,7 +472,7 @@ if [ "$SKIP_BRONZE" = false ]; then
     # Financial Ratios API (180-day window)
     # Note: For daily updates, we only download ratios for active tickers
     # For full historical download of all 9,900 tickers, use:
-    # python scripts/download/download_financial_ratios_only.py
+    # python scripts/download/download_fundamentals_only.py --endpoints financial_ratios
     run_parallel "bronze_ratios_api" \
         "quantmini polygon ratios $FUNDAMENTAL_TICKERS \
             --start-date $FILING_DATE_GTE \
@@ -12,12 +12,15 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import argparse
+import asyncio
 import duckdb
+import pyarrow as pa
+from src.core.config_loader import ConfigLoader
 from src.utils.paths import get_quantlake_root
 
 
-def get_missing_tickers():
-    """Get list of tickers missing fundamental data"""
+def get_missing_tickers() -> pa.Table:
+    """Get table of tickers (ticker, name) missing fundamental data"""
     bronze = get_quantlake_root() / "bronze"
 
     conn = duckdb.connect(':memory:')
@@ -38,21 +41,136 @@ def get_missing_tickers():
         SELECT DISTINCT tickers[1] as ticker
         FROM read_parquet('{bronze}/fundamentals/balance_sheets/**/*.parquet')
     )
-    SELECT a.ticker, a.name
-    FROM active_stocks a
-    LEFT JOIN has_fundamentals h ON a.ticker = h.ticker
-    WHERE h.ticker IS NULL
-    ORDER BY a.ticker
+    SELECT ticker, name
+    FROM active_stocks
+    ANTI JOIN has_fundamentals USING (ticker)
+    ORDER BY ticker
     """
 
-    result = conn.execute(query).fetchall()
-    return [(row[0], row[1]) for row in result]
+    # Fetch as one Arrow table instead of building a Python tuple per row
+    return pa.table(conn.execute(query).arrow())
+
+
+def iter_tickers(table: pa.Table):
+    """Yield (ticker, name) pairs from a missing-tickers table"""
+    return zip(table.column('ticker').to_pylist(), table.column('name').to_pylist())
+
+
+def get_api_key():
+    """Load the Polygon API key from config/credentials.yaml"""
+    credentials = ConfigLoader().get_credentials('polygon')
+    if not credentials:
+        return None
+    if 'api_key' in credentials:
+        return credentials['api_key']
+    if 'api' in credentials and isinstance(credentials['api'], dict):
+        return credentials['api'].get('key')
+    return credentials.get('key')
+
+
+async def backfill_ticker(downloader, sem, ticker, timeout=60):
+    """
+    Download quarterly fundamentals for one ticker in-process
+
+    Returns:
+        Tuple of (status, message) where status is 'success', 'no_data' or 'failed'
+    """
+    from src.core.exceptions import PolygonAPIError
+
+    params = {
+        'ticker': ticker,
+        'timeframe': 'quarterly',
+        'filing_date_gte': '2010-01-01'
+    }
+
+    async with sem:
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    downloader.download_balance_sheets(**params),
+                    downloader.download_cash_flow_statements(**params),
+                    downloader.download_income_statements(**params),
+                    return_exceptions=True
+                ),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            return 'failed', 'Timeout'
+
+    for result in results:
+        if isinstance(result, PolygonAPIError) and str(result).startswith('Client error 404'):
+            continue
+        if isinstance(result, Exception):
+            return 'failed', f"Failed: {str(result)[:100]}"
+
+    # Many tickers are expected to have no fundamentals available
+    if all(isinstance(result, Exception) or len(result) == 0 for result in results):
+        return 'no_data', 'No fundamentals available'
+    return 'success', 'Success'
+
+
+async def backfill(missing, api_key, concurrency):
+    """
+    Download fundamentals for all missing tickers over one shared client
+
+    Returns:
+        Tuple of (success_count, fail_count)
+    """
+    from src.download import PolygonRESTClient, FundamentalsDownloader
+
+    success_count = 0
+    fail_count = 0
+
+    async with PolygonRESTClient(
+        api_key=api_key,
+        max_concurrent=50,
+        max_connections=100
+    ) as client:
+        downloader = FundamentalsDownloader(
+            client=client,
+            output_dir=get_quantlake_root() / "bronze" / "fundamentals",
+            use_partitioned_structure=True
+        )
+        sem = asyncio.Semaphore(concurrency)
+
+        async def run_one(ticker, name):
+            status, message = await backfill_ticker(downloader, sem, ticker)
+            return ticker, name, status, message
+
+        tasks = [asyncio.create_task(run_one(ticker, name)) for ticker, name in iter_tickers(missing)]
+
+        # Only failures get their own line; everything else is rolled up
+        # into a progress line roughly every 5% of tickers
+        report_every = max(1, missing.num_rows // 20)
+        no_data_count = 0
+
+        for i, fut in enumerate(asyncio.as_completed(tasks), 1):
+            ticker, name, status, message = await fut
+
+            if status == 'success':
+                success_count += 1
+            elif status == 'no_data':
+                fail_count += 1
+                no_data_count += 1
+            else:
+                fail_count += 1
+                print(f"  ❌ {ticker:8s} - {name[:50]} ({message})")
+
+            if i % report_every == 0 or i == missing.num_rows:
+                print(
+                    f"[{i}/{missing.num_rows}] ✅ {success_count} downloaded, "
+                    f"⚠️  {no_data_count} no data, ❌ {fail_count - no_data_count} failed",
+                    flush=True
+                )
+
+    return success_count, fail_count
 
 
 def main():
     parser = argparse.ArgumentParser(description='Backfill missing fundamental data')
     parser.add_argument('--limit', type=int, help='Limit number of tickers to process')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be downloaded without downloading')
+    parser.add_argument('--concurrency', type=int, default=16, help='Number of tickers downloaded concurrently (default: 16)')
     args = parser.parse_args()
 
     print("="*80)
@@ -63,67 +181,35 @@ def main():
     missing = get_missing_tickers()
 
     if args.limit:
-        missing = missing[:args.limit]
+        missing = missing.slice(0, args.limit)
 
-    print(f"\nFound {len(missing)} tickers missing fundamental data")
+    print(f"\nFound {missing.num_rows} tickers missing fundamental data")
 
     if args.dry_run:
         print("\nDRY RUN - Would download fundamentals for:")
-        for ticker, name in missing[:20]:
+        for ticker, name in iter_tickers(missing.slice(0, 20)):
             print(f"  {ticker:8s} - {name}")
-        if len(missing) > 20:
-            print(f"  ... and {len(missing)-20} more")
+        if missing.num_rows > 20:
+            print(f"  ... and {missing.num_rows-20} more")
         return
 
-    # Import here to avoid loading if dry-run
-    import subprocess
+    api_key = get_api_key()
+    if not api_key:
+        print("❌ API key not found. Please configure config/credentials.yaml")
+        return 1
 
-    print(f"\nDownloading fundamentals for {len(missing)} tickers...")
-    print("This may take a while (est. 2-3 hours for 1,000 tickers)\n")
+    print(f"\nDownloading fundamentals for {missing.num_rows} tickers ({args.concurrency} concurrent)...\n")
 
-    success_count = 0
-    fail_count = 0
-
-    for i, (ticker, name) in enumerate(missing, 1):
-        print(f"[{i}/{len(missing)}] {ticker:8s} - {name[:50]}")
-
-        try:
-            # Download fundamentals for this ticker
-            cmd = [
-                "quantmini", "polygon", "fundamentals", ticker,
-                "--timeframe", "quarterly",
-                "--filing-date-gte", "2010-01-01",
-                "--output-dir", str(get_quantlake_root() / "bronze" / "fundamentals")
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-
-            if result.returncode == 0:
-                success_count += 1
-                print(f"  ✅ Success")
-            else:
-                fail_count += 1
-                # Many failures are expected (no fundamentals available)
-                if "No data" in result.stderr or "404" in result.stderr:
-                    print(f"  ⚠️  No fundamentals available")
-                else:
-                    print(f"  ❌ Failed: {result.stderr[:100]}")
-
-        except subprocess.TimeoutExpired:
-            fail_count += 1
-            print(f"  ❌ Timeout")
-        except Exception as e:
-            fail_count += 1
-            print(f"  ❌ Error: {str(e)[:100]}")
+    success_count, fail_count = asyncio.run(backfill(missing, api_key, args.concurrency))
 
     print("\n" + "="*80)
     print("BACKFILL SUMMARY")
     print("="*80)
-    print(f"Total tickers processed: {len(missing)}")
+    print(f"Total tickers processed: {missing.num_rows}")
     print(f"✅ Successfully downloaded: {success_count}")
     print(f"❌ Failed/No data: {fail_count}")
     print("="*80)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -36,6 +36,7 @@ Usage:
 
 import asyncio
 import json
+import os
 import sys
 import time
 from pathlib import Path
@@ -43,9 +44,11 @@ from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import argparse
 import logging
-from concurrent.futures import ProcessPoolExecutor, as_completed
-import multiprocessing as mp
-import polars as pl
+
+try:
+    import orjson  # Faster progress file encode/decode when available
+except ImportError:
+    orjson = None
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -65,13 +68,27 @@ logger = logging.getLogger(__name__)
 class ProgressTracker:
     """Track and persist download progress by date ranges"""
 
+    # Updates are written out every FLUSH_EVERY changes or FLUSH_INTERVAL
+    # seconds, whichever comes first, plus once at the end via flush(force=True).
+    # mark_* only record changes; callers decide when to flush() / aflush()
+    FLUSH_EVERY = 32
+    FLUSH_INTERVAL = 5.0
+
     def __init__(self, progress_file: Path):
         self.progress_file = progress_file
         self.data = self._load()
+        # Sets mirror the completed lists for O(1) membership checks; the
+        # lists are kept as-is for the JSON file
+        self._interest_set = set(self.data['short_interest_completed'])
+        self._volume_set = set(self.data['short_volume_completed'])
+        self._dirty = 0
+        self._last_flush = time.monotonic()
 
     def _load(self) -> Dict:
         """Load progress from file"""
         if self.progress_file.exists():
+            if orjson is not None:
+                return orjson.loads(self.progress_file.read_bytes())
             with open(self.progress_file) as f:
                 return json.load(f)
         return {
@@ -84,26 +101,67 @@ class ProgressTracker:
             'total_volume_records': 0
         }
 
-    def save(self):
-        """Save progress to file"""
+    def _encode(self) -> bytes:
+        """Snapshot progress as JSON and reset the pending-change counters"""
         self.data['last_updated'] = datetime.now().isoformat()
+        if orjson is not None:
+            payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.data, indent=2).encode()
+
+        self._dirty = 0
+        self._last_flush = time.monotonic()
+        return payload
+
+    def _write(self, payload: bytes):
+        """Write a snapshot to the progress file"""
         self.progress_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.progress_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+
+        # Write to a temp file and swap it in so a crash never leaves a torn file
+        tmp_file = self.progress_file.with_suffix('.tmp')
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, self.progress_file)
+
+    def _should_flush(self, force: bool) -> bool:
+        if not self._dirty:
+            return False
+        return (force or self._dirty >= self.FLUSH_EVERY
+                or time.monotonic() - self._last_flush > self.FLUSH_INTERVAL)
+
+    def save(self):
+        """Save progress to file"""
+        self._write(self._encode())
+
+    def flush(self, force: bool = False):
+        """Save pending updates if enough have accumulated (or if forced)"""
+        if self._should_flush(force):
+            self.save()
+
+    async def aflush(self, force: bool = False):
+        """
+        Like flush(), but writes the file from a worker thread
+
+        The snapshot is encoded on the event loop so no download task can
+        mutate it mid-write; only the file I/O is offloaded.
+        """
+        if self._should_flush(force):
+            await asyncio.to_thread(self._write, self._encode())
 
     def mark_interest_completed(self, date_range: str, record_count: int):
         """Mark a short interest date range as completed"""
-        if date_range not in self.data['short_interest_completed']:
+        if date_range not in self._interest_set:
+            self._interest_set.add(date_range)
             self.data['short_interest_completed'].append(date_range)
         self.data['total_interest_records'] += record_count
-        self.save()
+        self._dirty += 1
 
     def mark_volume_completed(self, date_range: str, record_count: int):
         """Mark a short volume date range as completed"""
-        if date_range not in self.data['short_volume_completed']:
+        if date_range not in self._volume_set:
+            self._volume_set.add(date_range)
             self.data['short_volume_completed'].append(date_range)
         self.data['total_volume_records'] += record_count
-        self.save()
+        self._dirty += 1
 
     def mark_failed(self, date_range: str, error: str, data_type: str):
         """Mark a date range as failed"""
@@ -112,21 +170,27 @@ class ProgressTracker:
             'error': str(error),
             'timestamp': datetime.now().isoformat()
         }
-        self.save()
+        self._dirty += 1
 
     def is_interest_completed(self, date_range: str) -> bool:
         """Check if short interest date range is completed"""
-        return date_range in self.data['short_interest_completed']
+        return date_range in self._interest_set
 
     def is_volume_completed(self, date_range: str) -> bool:
         """Check if short volume date range is completed"""
-        return date_range in self.data['short_volume_completed']
+        return date_range in self._volume_set
 
 
 def generate_date_ranges(start_date: str, end_date: str, chunk_months: int = 3) -> List[Tuple[str, str]]:
     """
     Generate list of date ranges for parallel processing
 
+    Chunk boundaries follow calendar months: every chunk after the first
+    starts on the first of a month and ends the day before the next one
+    starts, so their range keys don't drift between runs (and 3-month
+    chunks starting in January are calendar quarters). The first chunk
+    starts at start_date itself, so no days before it are fetched.
+
     Args:
         start_date: Start date (YYYY-MM-DD)
         end_date: End date (YYYY-MM-DD)
@@ -135,156 +199,109 @@ def generate_date_ranges(start_date: str, end_date: str, chunk_months: int = 3)
     Returns:
         List of (start_date, end_date) tuples
     """
-    start = datetime.strptime(start_date, '%Y-%m-%d')
-    end = datetime.strptime(end_date, '%Y-%m-%d')
+    start = datetime.fromisoformat(start_date)
+    end = datetime.fromisoformat(end_date)
 
     ranges = []
     current = start
 
-    while current < end:
-        # Calculate chunk end (3 months later or end_date, whichever is earlier)
-        chunk_end = min(
-            current + timedelta(days=chunk_months * 30),
-            end
+    while current <= end:
+        # First day of the month chunk_months later
+        month_index = current.month - 1 + chunk_months
+        next_start = current.replace(
+            year=current.year + month_index // 12,
+            month=month_index % 12 + 1,
+            day=1
         )
 
+        # Calculate chunk end (day before next chunk or end_date, whichever is earlier)
+        chunk_end = min(next_start - timedelta(days=1), end)
+
         ranges.append((
             current.strftime('%Y-%m-%d'),
             chunk_end.strftime('%Y-%m-%d')
         ))
 
-        current = chunk_end + timedelta(days=1)
+        current = next_start
 
     return ranges
 
 
-async def download_short_interest_range(
+# Per data type: downloader stream method, its date range parameters and
+# the progress tracker method that records a finished range
+SHORT_DATA_SPECS = {
+    'short_interest': {
+        'stream': 'stream_short_interest',
+        'date_params': ('settlement_date_gte', 'settlement_date_lte'),
+        'mark_completed': 'mark_interest_completed',
+    },
+    'short_volume': {
+        'stream': 'stream_short_volume',
+        'date_params': ('date_gte', 'date_lte'),
+        'mark_completed': 'mark_volume_completed',
+    },
+}
+
+
+async def download_range(
+    data_type: str,
     start_date: str,
     end_date: str,
-    output_dir: Path,
-    api_key: str,
+    downloader: FundamentalsDownloader,
     progress: ProgressTracker
 ) -> Dict[str, int]:
     """
-    Download short interest data for a date range
+    Download short interest or short volume data for a date range
 
     Returns:
         Dictionary with 'records' count
     """
+    spec = SHORT_DATA_SPECS[data_type]
+    label = data_type.replace('_', ' ')
     range_key = f"{start_date}_to_{end_date}"
+    date_gte, date_lte = spec['date_params']
+    mark_completed = getattr(progress, spec['mark_completed'])
 
     try:
-        async with PolygonRESTClient(
-            api_key=api_key,
-            max_concurrent=100,
-            max_connections=200
-        ) as client:
+        logger.info(f"📥 Downloading {label}: {start_date} to {end_date}")
 
-            downloader = FundamentalsDownloader(
-                client=client,
-                output_dir=output_dir,
-                use_partitioned_structure=True
-            )
-
-            logger.info(f"📥 Downloading short interest: {start_date} to {end_date}")
-
-            df = await downloader.download_short_interest(
-                ticker=None,  # All tickers
-                settlement_date_gte=start_date,
-                settlement_date_lte=end_date,
-                limit=100
-            )
+        # Rows are saved in batches as pages arrive; only the count comes back
+        record_count = await getattr(downloader, spec['stream'])(
+            ticker=None,  # All tickers
+            limit=100,
+            **{date_gte: start_date, date_lte: end_date}
+        )
 
-            if df is None or len(df) == 0:
-                logger.warning(f"No short interest data for {range_key}")
-                progress.mark_interest_completed(range_key, 0)
-                return {'records': 0}
+        if record_count == 0:
+            logger.warning(f"No {label} data for {range_key}")
+            mark_completed(range_key, 0)
+            return {'records': 0}
 
-            record_count = len(df)
-            logger.info(f"✅ Short interest {range_key}: {record_count:,} records")
+        logger.info(f"✅ {label.capitalize()} {range_key}: {record_count:,} records")
 
-            progress.mark_interest_completed(range_key, record_count)
+        mark_completed(range_key, record_count)
 
-            return {'records': record_count}
+        return {'records': record_count}
 
     except Exception as e:
-        logger.error(f"❌ Failed short interest {range_key}: {e}")
-        progress.mark_failed(range_key, str(e), 'short_interest')
+        logger.error(f"❌ Failed {label} {range_key}: {e}")
+        progress.mark_failed(range_key, str(e), data_type)
         raise
 
 
-async def download_short_volume_range(
-    start_date: str,
-    end_date: str,
-    output_dir: Path,
-    api_key: str,
+async def process_range(
+    range_info: Tuple[str, str],
+    data_type: str,
+    downloader: FundamentalsDownloader,
     progress: ProgressTracker
-) -> Dict[str, int]:
-    """
-    Download short volume data for a date range
-
-    Returns:
-        Dictionary with 'records' count
-    """
-    range_key = f"{start_date}_to_{end_date}"
-
-    try:
-        async with PolygonRESTClient(
-            api_key=api_key,
-            max_concurrent=100,
-            max_connections=200
-        ) as client:
-
-            downloader = FundamentalsDownloader(
-                client=client,
-                output_dir=output_dir,
-                use_partitioned_structure=True
-            )
-
-            logger.info(f"📥 Downloading short volume: {start_date} to {end_date}")
-
-            df = await downloader.download_short_volume(
-                ticker=None,  # All tickers
-                date_gte=start_date,
-                date_lte=end_date,
-                limit=100
-            )
-
-            if df is None or len(df) == 0:
-                logger.warning(f"No short volume data for {range_key}")
-                progress.mark_volume_completed(range_key, 0)
-                return {'records': 0}
-
-            record_count = len(df)
-            logger.info(f"✅ Short volume {range_key}: {record_count:,} records")
-
-            progress.mark_volume_completed(range_key, record_count)
-
-            return {'records': record_count}
-
-    except Exception as e:
-        logger.error(f"❌ Failed short volume {range_key}: {e}")
-        progress.mark_failed(range_key, str(e), 'short_volume')
-        raise
-
-
-def process_range_wrapper(args):
-    """Wrapper for multiprocessing"""
-    range_info, output_dir, api_key, progress_file, data_type = args
+) -> Dict:
+    """Download one date range and report the outcome instead of raising"""
     start_date, end_date = range_info
 
-    # Recreate progress tracker in subprocess
-    progress = ProgressTracker(progress_file)
-
     try:
-        if data_type == 'short_interest':
-            result = asyncio.run(download_short_interest_range(
-                start_date, end_date, output_dir, api_key, progress
-            ))
-        else:  # short_volume
-            result = asyncio.run(download_short_volume_range(
-                start_date, end_date, output_dir, api_key, progress
-            ))
+        result = await download_range(
+            data_type, start_date, end_date, downloader, progress
+        )
 
         return {
             'success': True,
@@ -331,7 +348,21 @@ def main():
         '--workers',
         type=int,
         default=4,
-        help='Number of parallel workers (default: 4)'
+        help='Number of date ranges downloaded concurrently (default: 4)'
+    )
+
+    parser.add_argument(
+        '--max-concurrent',
+        type=int,
+        default=100,
+        help='Max concurrent API requests across all ranges (default: 100)'
+    )
+
+    parser.add_argument(
+        '--max-connections',
+        type=int,
+        default=200,
+        help='Max HTTP connections in the shared pool (default: 200)'
     )
 
     parser.add_argument(
@@ -400,6 +431,7 @@ def main():
     logger.info(f"Date range: {start_date} to {end_date}")
     logger.info(f"Output directory: {output_dir}")
     logger.info(f"Workers: {args.workers}")
+    logger.info(f"API concurrency: {args.max_concurrent} requests / {args.max_connections} connections")
     logger.info(f"Chunk size: {args.chunk_months} months")
     logger.info(f"Progress file: {progress_file}")
     logger.info("=" * 80)
@@ -441,44 +473,85 @@ def main():
 
     if download_interest:
         for range_info in pending_interest:
-            work_items.append((range_info, output_dir, api_key, progress_file, 'short_interest'))
+            work_items.append((range_info, 'short_interest'))
 
     if download_volume:
         for range_info in pending_volume:
-            work_items.append((range_info, output_dir, api_key, progress_file, 'short_volume'))
+            work_items.append((range_info, 'short_volume'))
 
     logger.info(f"\n🚀 Starting {len(work_items)} download tasks with {args.workers} workers...")
 
-    # Process in parallel
+    # All ranges share one event loop and one client connection pool;
+    # the semaphore bounds how many ranges are in flight at once
     start_time = time.time()
     completed = 0
     failed = 0
     total_interest_records = progress.data['total_interest_records']
     total_volume_records = progress.data['total_volume_records']
 
-    with ProcessPoolExecutor(max_workers=args.workers) as executor:
-        futures = [executor.submit(process_range_wrapper, item) for item in work_items]
+    def record(result: Dict):
+        """Update counters and log progress for one finished range"""
+        nonlocal completed, failed, total_interest_records, total_volume_records
+        completed += 1
 
-        for future in as_completed(futures):
-            result = future.result()
-            completed += 1
+        if result['success']:
+            if result['data_type'] == 'short_interest':
+                total_interest_records += result['records']
+            else:
+                total_volume_records += result['records']
 
-            if result['success']:
-                if result['data_type'] == 'short_interest':
-                    total_interest_records += result['records']
-                else:
-                    total_volume_records += result['records']
+            elapsed = time.time() - start_time
+            rate = completed / (elapsed / 60) if elapsed > 0 else 0
+            remaining = len(work_items) - completed
+            eta_minutes = remaining / rate if rate > 0 else 0
 
-                elapsed = time.time() - start_time
-                rate = completed / (elapsed / 60) if elapsed > 0 else 0
-                remaining = len(work_items) - completed
-                eta_minutes = remaining / rate if rate > 0 else 0
+            logger.info(f"Progress: {completed}/{len(work_items)} ({completed/len(work_items)*100:.1f}%) | "
+                       f"Rate: {rate:.1f} ranges/min | ETA: {eta_minutes:.0f}m")
+        else:
+            failed += 1
+            logger.error(f"Failed: {result['range']} ({result['data_type']}): {result['error']}")
 
-                logger.info(f"Progress: {completed}/{len(work_items)} ({completed/len(work_items)*100:.1f}%) | "
-                           f"Rate: {rate:.1f} ranges/min | ETA: {eta_minutes:.0f}m")
-            else:
-                failed += 1
-                logger.error(f"Failed: {result['range']} ({result['data_type']}): {result['error']}")
+    async def run_all():
+        async with PolygonRESTClient(
+            api_key=api_key,
+            max_concurrent=args.max_concurrent,
+            max_connections=args.max_connections
+        ) as client:
+            downloader = FundamentalsDownloader(
+                client=client,
+                output_dir=output_dir,
+                use_partitioned_structure=True
+            )
+            sem = asyncio.Semaphore(args.workers)
+
+            # Group by date range so both endpoints for a range are fetched
+            # together under one semaphore slot
+            data_types_by_range: Dict[Tuple[str, str], List[str]] = {}
+            for range_info, data_type in work_items:
+                data_types_by_range.setdefault(range_info, []).append(data_type)
+
+            async def _guarded(range_info, data_types):
+                async with sem:
+                    return await asyncio.gather(*[
+                        process_range(range_info, data_type, downloader, progress)
+                        for data_type in data_types
+                    ])
+
+            tasks = [
+                asyncio.create_task(_guarded(range_info, data_types))
+                for range_info, data_types in data_types_by_range.items()
+            ]
+
+            # Results arrive in completion order, already in-process
+            for fut in asyncio.as_completed(tasks):
+                for result in await fut:
+                    record(result)
+                await progress.aflush()
+
+    try:
+        asyncio.run(run_all())
+    finally:
+        progress.flush(force=True)
 
     # Final summary
     elapsed = time.time() - start_time
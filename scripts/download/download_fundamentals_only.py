@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Download Fundamentals ONLY for all 9,900 common stock tickers
+
+This script focuses on completing fundamentals downloads with:
+- Progress tracking and resume capability (per endpoint)
+- Controlled parallelism shared by every endpoint in the run
+- Date range filtering (2010-2025)
+- Clear status reporting
+
+All selected endpoints run in one process under one PolygonRESTClient, so
+the connection pool, the ticker list and the concurrency budget are shared.
+
+Usage:
+    # All endpoints
+    python scripts/download/download_fundamentals_only.py
+
+    # Selected endpoints
+    python scripts/download/download_fundamentals_only.py --endpoints cash_flow,income_statements
+
+    # Financial ratios only
+    python scripts/download/download_fundamentals_only.py --endpoints financial_ratios
+
+    # Rebuild the completed-ticker manifests from the files on disk
+    python scripts/download/download_fundamentals_only.py --full-rescan
+"""
+
+import argparse
+import asyncio
+import atexit
+import queue
+import random
+import sys
+from pathlib import Path
+from datetime import datetime
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional, Set
+
+try:
+    import uvloop  # Faster event loop for thousands of short-lived tasks when available
+except ImportError:
+    uvloop = None
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.config_loader import ConfigLoader
+from src.download import PolygonRESTClient, FundamentalsDownloader
+from src.download.ratios import FinancialRatiosAPIDownloader
+from src.download.partition_manifest import manifest_path, read_manifest_tickers, rebuild_manifest
+from src.utils.paths import get_quantlake_root
+import polars as pl
+
+# Configure logging. Records are queued on the event loop thread and
+# written to the file and console by a listener thread, so per-ticker log
+# lines don't block downloads on I/O.
+_log_queue = queue.Queue(-1)
+_log_handlers = [
+    logging.FileHandler('/tmp/fundamentals_download.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+# The queue handler only merges the message args; the listener's handlers
+# apply the real format
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger(__name__)
+
+START_DATE = '2010-01-01'
+END_DATE = '2026-01-01'
+
+
+def _statement_params(start_date: str, end_date: str) -> Dict:
+    return {
+        'filing_date_gte': start_date,
+        'filing_date_lt': end_date,
+        'timeframe': 'quarterly',
+        'limit': 100
+    }
+
+
+def _ratio_params(start_date: str, end_date: str) -> Dict:
+    return {'start_date': start_date, 'limit': 100}
+
+
+# Per endpoint: downloader class, download method, request parameters and
+# the record label used in logs. Keys are also the output folder names
+# under bronze/fundamentals.
+ENDPOINTS = {
+    'balance_sheets': {
+        'downloader': FundamentalsDownloader,
+        'method': 'download_balance_sheets',
+        'params': _statement_params,
+        'label': 'balance sheet',
+    },
+    'cash_flow': {
+        'downloader': FundamentalsDownloader,
+        'method': 'download_cash_flow_statements',
+        'params': _statement_params,
+        'label': 'cash flow',
+    },
+    'income_statements': {
+        'downloader': FundamentalsDownloader,
+        'method': 'download_income_statements',
+        'params': _statement_params,
+        'label': 'income statement',
+    },
+    'financial_ratios': {
+        'downloader': FinancialRatiosAPIDownloader,
+        'method': 'download_ratios',
+        'params': _ratio_params,
+        'label': 'ratio',
+    },
+}
+
+
+def get_active_tickers() -> List[str]:
+    """Load 9,900 active common stocks from reference data"""
+    data_root = get_quantlake_root()
+    tickers_path = data_root / "bronze/reference_data/tickers"
+    cache_file = data_root / "metadata/tickers_cs_us.txt"
+
+    # Reuse the list saved by an earlier run as long as the reference data
+    # hasn't changed since
+    source_mtime = max(
+        (p.stat().st_mtime for p in tickers_path.rglob('*.parquet')),
+        default=0
+    )
+    if cache_file.exists() and cache_file.stat().st_mtime >= source_mtime:
+        tickers = cache_file.read_text().split()
+        logger.info(f"Loaded {len(tickers)} active common stock tickers from {cache_file}")
+        return tickers
+
+    logger.info(f"Loading tickers from: {tickers_path}")
+
+    # Tickers are stored as locale=XX/type=YY/data.parquet, so the filter
+    # prunes on the hive partition paths and only the us/CS file is opened
+    tickers = (
+        pl.scan_parquet(tickers_path, hive_partitioning=True)
+        .filter((pl.col('type') == 'CS') & (pl.col('locale') == 'us'))
+        .select('ticker')
+        .unique()
+        .sort('ticker')
+        .collect(engine='streaming')
+    )['ticker'].to_list()
+    logger.info(f"Loaded {len(tickers)} active common stock tickers")
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text('\n'.join(tickers))
+
+    return tickers
+
+
+def get_completed_tickers(endpoint: str, full_rescan: bool = False) -> Set[str]:
+    """
+    Check which tickers already have data for an endpoint
+
+    Reads the partition manifest the downloaders append to on every save.
+    Without a manifest, or with full_rescan, it is rebuilt from the
+    partition file names.
+    """
+    output_dir = get_quantlake_root() / "bronze/fundamentals"
+    manifest = manifest_path(output_dir, endpoint)
+
+    if manifest.exists() and not full_rescan:
+        completed = read_manifest_tickers(output_dir, endpoint)
+        logger.info(f"Found {len(completed)} tickers with existing {endpoint} in {manifest}")
+        return completed
+
+    endpoint_path = output_dir / endpoint
+    logger.info(f"Checking for existing {endpoint} at: {endpoint_path}")
+
+    if not endpoint_path.exists():
+        logger.info(f"No existing {endpoint} found")
+        return set()
+
+    completed = rebuild_manifest(output_dir, endpoint)
+    logger.info(f"Found {len(completed)} tickers with existing {endpoint}")
+    return completed
+
+
+async def download_for_ticker(
+    ticker: str,
+    endpoint: str,
+    download,
+    params: Dict
+) -> Optional[int]:
+    """
+    Download one endpoint for a single ticker
+
+    Args:
+        ticker: Stock ticker
+        endpoint: Endpoint name (key of ENDPOINTS)
+        download: Bound downloader method for the endpoint
+        params: Request parameters passed to every call
+
+    Returns:
+        Number of records downloaded, or None if failed
+    """
+    try:
+        df = await download(ticker=ticker, **params)
+
+        record_count = len(df) if df is not None else 0
+        logger.info(f"✅ {ticker}: Downloaded {record_count} {ENDPOINTS[endpoint]['label']} records")
+        return record_count
+
+    except Exception as e:
+        logger.error(f"❌ {ticker}: {endpoint} failed - {str(e)}")
+        return None
+
+
+async def download_batch(
+    pending: Dict[str, List[str]],
+    api_key: str,
+    output_dir: Path,
+    concurrency: int = 10,
+    requests_per_second: float = 100
+) -> Dict[str, Dict[str, int]]:
+    """
+    Download every pending (endpoint, ticker) pair in parallel
+
+    Args:
+        pending: Tickers to download, keyed by endpoint
+        api_key: Polygon API key
+        output_dir: Output directory
+        concurrency: Number of concurrent downloads across all endpoints
+        requests_per_second: API request rate shared by all downloads
+
+    Returns:
+        Dictionary of {'successful': n, 'failed': n} counts per endpoint
+    """
+    async with PolygonRESTClient(
+        api_key=api_key,
+        max_concurrent=50,  # Reduced from 100 to avoid connection errors
+        max_connections=100,  # Reduced from 200
+        max_requests_per_second=requests_per_second  # Token bucket; the semaphore caps connections
+    ) as client:
+
+        # One downloader per class, shared by every ticker and endpoint
+        downloaders = {}
+        for endpoint in pending:
+            downloader_cls = ENDPOINTS[endpoint]['downloader']
+            if downloader_cls not in downloaders:
+                downloaders[downloader_cls] = downloader_cls(
+                    client=client,
+                    output_dir=output_dir,
+                    use_partitioned_structure=True
+                )
+
+        # Resolve each endpoint's bound method and request parameters once,
+        # not on every ticker
+        calls = {}
+        for endpoint in pending:
+            spec = ENDPOINTS[endpoint]
+            calls[endpoint] = (
+                getattr(downloaders[spec['downloader']], spec['method']),
+                spec['params'](START_DATE, END_DATE)
+            )
+
+        # Keep `concurrency` downloads in flight at all times, whatever the
+        # endpoint mix, rather than waiting for the slowest of each batch
+        sem = asyncio.Semaphore(concurrency)
+
+        async def run_one(endpoint: str, ticker: str):
+            download, params = calls[endpoint]
+            async with sem:
+                record_count = await download_for_ticker(
+                    ticker=ticker,
+                    endpoint=endpoint,
+                    download=download,
+                    params=params
+                )
+            return endpoint, record_count
+
+        tasks = [
+            asyncio.create_task(run_one(endpoint, ticker))
+            for endpoint, tickers in pending.items()
+            for ticker in tickers
+        ]
+
+        results = {endpoint: {'successful': 0, 'failed': 0} for endpoint in pending}
+        successful = 0
+        failed = 0
+
+        for done, future in enumerate(asyncio.as_completed(tasks), 1):
+            endpoint, record_count = await future
+            if record_count is not None:
+                results[endpoint]['successful'] += 1
+                successful += 1
+            else:
+                results[endpoint]['failed'] += 1
+                failed += 1
+
+            if done % concurrency == 0 or done == len(tasks):
+                logger.info(f"Progress {done}/{len(tasks)}: {successful} successful, {failed} failed so far")
+
+    return results
+
+
+async def main():
+    """Main download orchestrator"""
+    parser = argparse.ArgumentParser(
+        description='Download fundamentals for all active common stocks',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        '--endpoints',
+        type=str,
+        default=','.join(ENDPOINTS),
+        help=f"Comma-separated endpoints (default: all). Choices: {', '.join(ENDPOINTS)}"
+    )
+
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        help='Concurrent ticker downloads across all endpoints (default: 10 per endpoint)'
+    )
+
+    parser.add_argument(
+        '--requests-per-second',
+        type=float,
+        default=100,
+        help='Polygon API request rate across all endpoints (default: 100)'
+    )
+
+    parser.add_argument(
+        '--full-rescan',
+        action='store_true',
+        help='Rebuild the partition manifests from the files on disk'
+    )
+
+    args = parser.parse_args()
+
+    endpoints = [e.strip() for e in args.endpoints.split(',') if e.strip()]
+    unknown = [e for e in endpoints if e not in ENDPOINTS]
+    if unknown:
+        parser.error(f"Unknown endpoints: {', '.join(unknown)}")
+
+    concurrency = args.concurrency or 10 * len(endpoints)
+
+    print("=" * 80)
+    print("FUNDAMENTALS DOWNLOAD - FOCUSED EXECUTION")
+    print("=" * 80)
+    print()
+
+    # Load configuration
+    config = ConfigLoader()
+    credentials = config.get_credentials('polygon')
+
+    # Extract API key (supports multiple formats)
+    api_key = None
+    if credentials:
+        if 'api_key' in credentials:
+            api_key = credentials['api_key']
+        elif 'api' in credentials and isinstance(credentials['api'], dict):
+            api_key = credentials['api'].get('key')
+        elif 'key' in credentials:
+            api_key = credentials['key']
+
+    if not api_key:
+        logger.error(f"❌ Polygon API key not found in credentials: {credentials}")
+        return 1
+
+    data_root = get_quantlake_root()
+    output_dir = data_root / "bronze/fundamentals"
+
+    # Get tickers
+    logger.info("Loading ticker list...")
+    all_tickers = get_active_tickers()
+    active_tickers = set(all_tickers)
+
+    # Check what's already completed, per endpoint
+    pending = {}
+    print()
+    print(f"📊 Status ({len(all_tickers):,} tickers):")
+    for endpoint in endpoints:
+        logger.info(f"Checking existing {endpoint}...")
+        completed_tickers = get_completed_tickers(endpoint, full_rescan=args.full_rescan)
+
+        # Filter to only tickers that need downloading. Shuffle with a fixed
+        # per-endpoint seed so runs of slow, alphabetically adjacent issuers
+        # are spread over the run; the order is still the same on every run,
+        # and the manifest records completions whatever the order.
+        pending_tickers = sorted(active_tickers - completed_tickers)
+        random.Random(endpoint).shuffle(pending_tickers)
+        if pending_tickers:
+            pending[endpoint] = pending_tickers
+
+        print(f"  {endpoint:18s} {len(completed_tickers):,} complete, {len(pending_tickers):,} pending")
+    print()
+
+    if not pending:
+        print("✅ All tickers already have data for every selected endpoint!")
+        return 0
+
+    total_pending = sum(len(tickers) for tickers in pending.values())
+
+    # Download
+    print(f"🚀 Starting download for {total_pending:,} ticker/endpoint pairs...")
+    print(f"   Date Range: {START_DATE} to {END_DATE}")
+    print(f"   Concurrency: {concurrency} tickers at a time")
+    print(f"   Rate Limit: {args.requests_per_second:g} requests/second")
+    print(f"   Output: {output_dir}")
+    print()
+
+    start_time = datetime.now()
+
+    results = await download_batch(
+        pending=pending,
+        api_key=api_key,
+        output_dir=output_dir,
+        concurrency=concurrency,
+        requests_per_second=args.requests_per_second
+    )
+
+    elapsed = datetime.now() - start_time
+
+    successful = sum(r['successful'] for r in results.values())
+    failed = sum(r['failed'] for r in results.values())
+
+    # Final report
+    print()
+    print("=" * 80)
+    print("DOWNLOAD COMPLETE")
+    print("=" * 80)
+    for endpoint, counts in results.items():
+        print(f"  {endpoint:18s} ✅ {counts['successful']:,}  ❌ {counts['failed']:,}")
+    print(f"✅ Successful:  {successful:,} tickers")
+    print(f"❌ Failed:      {failed:,} tickers")
+    print(f"⏱️  Duration:    {elapsed}")
+    print(f"📊 Success Rate: {successful/(successful+failed)*100:.1f}%")
+    print()
+    print(f"📁 Data Location: {output_dir}/")
+    print("📄 Log File: /tmp/fundamentals_download.log")
+    print("=" * 80)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    if uvloop is not None:
+        sys.exit(uvloop.run(main()))
+    sys.exit(asyncio.run(main()))
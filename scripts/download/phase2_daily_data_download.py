@@ -3,7 +3,7 @@
 Phase 2: Download Daily Price Data from S3
 
 Downloads stocks_daily (2020-10-26+) and options_daily (2023-10-24+)
-from Polygon S3 flat files.
+from Polygon S3 flat files. The two data types download concurrently.
 """
 
 import sys
@@ -11,170 +11,141 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-import subprocess
+import calendar
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
+from typing import List, Tuple
 import argparse
 
-
-def download_month(data_type: str, year: int, month: int, log_file):
-    """Download a single month of data"""
-    start_date = f"{year}-{month:02d}-01"
-    # Simple end-of-month: just use day 31 (API will handle invalid dates)
-    end_date = f"{year}-{month:02d}-31"
-
-    print(f"[{datetime.now().strftime('%H:%M:%S')}] Downloading {data_type}: {year}-{month:02d}", flush=True)
-    log_file.write(f"[{datetime.now().strftime('%H:%M:%S')}] Downloading {data_type}: {year}-{month:02d}\n")
-    log_file.flush()
-
-    cmd = [
-        "quantmini", "data", "download",
-        "--data-type", data_type,
-        "--start-date", start_date,
-        "--end-date", end_date
-    ]
-
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-        if result.returncode == 0:
-            print(f"  ✅ Success: {data_type} {year}-{month:02d}", flush=True)
-            log_file.write(f"  ✅ Success\n")
+from src.download.flat_files import download_chunk, last_published_date
+from src.utils.chunk_checkpoint import ChunkCheckpoint
+from src.utils.script_logging import start_script_logging
+
+logger = logging.getLogger(Path(__file__).stem)
+
+
+def month_ranges(start_year: int, start_month: int, end: date) -> List[Tuple[str, str]]:
+    """
+    (first day, last day) of every month from start_year-start_month
+    through the month of `end`, as YYYY-MM-DD strings. The last month
+    ends at `end`.
+    """
+    months = []
+    year, month = start_year, start_month
+    while (year, month) <= (end.year, end.month):
+        last_day = calendar.monthrange(year, month)[1]
+        if (year, month) == (end.year, end.month):
+            last_day = end.day
+        months.append((f"{year}-{month:02d}-01", f"{year}-{month:02d}-{last_day:02d}"))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def download_months(
+    data_type: str,
+    months: List[Tuple[str, str]],
+    use_subprocess: bool = False,
+    checkpoint: ChunkCheckpoint = None
+) -> Tuple[int, int]:
+    """
+    Download months one after another
+
+    Returns:
+        (successful months, failed months)
+    """
+    success = 0
+    fail = 0
+
+    for start_date, end_date in months:
+        if download_chunk(data_type, start_date, end_date, use_subprocess, checkpoint,
+                          label=start_date[:7], log=logger):
+            success += 1
         else:
-            print(f"  ❌ Failed: {result.stderr[:200]}", flush=True)
-            log_file.write(f"  ❌ Failed: {result.stderr[:200]}\n")
-        log_file.flush()
-        return result.returncode == 0
-    except subprocess.TimeoutExpired:
-        print(f"  ⏱️  Timeout: {data_type} {year}-{month:02d}", flush=True)
-        log_file.write(f"  ⏱️  Timeout\n")
-        log_file.flush()
-        return False
-    except Exception as e:
-        print(f"  ❌ Error: {str(e)[:200]}", flush=True)
-        log_file.write(f"  ❌ Error: {str(e)[:200]}\n")
-        log_file.flush()
-        return False
+            fail += 1
+
+    return success, fail
 
 
 def main():
     parser = argparse.ArgumentParser(description='Phase 2: Download daily price data from S3')
     parser.add_argument('--log-file', type=str, help='Log file path')
+    parser.add_argument('--resume', action=argparse.BooleanOptionalAction, default=True,
+                        help='Skip months a previous, unfinished run already downloaded (default: on)')
+    parser.add_argument('--use-subprocess', action='store_true',
+                        help='Run each month through the quantmini CLI in a separate process')
     args = parser.parse_args()
 
-    # Open log file
+    from src.utils.paths import get_quantlake_root
+    quantlake_root = get_quantlake_root()
+
+    # Console and log file output, written from a listener thread
     if args.log_file:
-        log_file = open(args.log_file, 'w', buffering=1)  # Line buffering
+        log_path = Path(args.log_file)
     else:
-        from src.utils.paths import get_quantlake_root
-        quantlake_root = get_quantlake_root()
         log_path = quantlake_root / "logs" / f"phase2_download_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        log_file = open(log_path, 'w', buffering=1)
-
-    print("="*80)
-    print("PHASE 2: DAILY PRICE DATA DOWNLOAD FROM S3")
-    print("="*80)
-    print()
-
-    log_file.write("="*80 + "\n")
-    log_file.write("PHASE 2: DAILY PRICE DATA DOWNLOAD FROM S3\n")
-    log_file.write("="*80 + "\n\n")
-
-    # Current date
-    today = date.today()
-    current_year = today.year
-    current_month = today.month
-
-    # Download stocks_daily: 2020-10-26 to present
-    print("📊 Downloading stocks_daily (2020-10 to present)...")
-    print(f"   Estimated: ~50 months, ~10GB total")
-    print()
-
-    log_file.write("📊 Downloading stocks_daily (2020-10 to present)...\n")
-    log_file.write(f"   Estimated: ~50 months, ~10GB total\n\n")
-
-    stocks_success = 0
-    stocks_fail = 0
-
-    # 2020: October onwards
-    for month in range(10, 13):  # Oct, Nov, Dec
-        if download_month("stocks_daily", 2020, month, log_file):
-            stocks_success += 1
-        else:
-            stocks_fail += 1
-
-    # 2021-2023: Full years
-    for year in range(2021, 2024):
-        for month in range(1, 13):
-            if download_month("stocks_daily", year, month, log_file):
-                stocks_success += 1
-            else:
-                stocks_fail += 1
-
-    # 2024-current: Up to current month
-    for year in range(2024, current_year + 1):
-        end_month = 13 if year < current_year else current_month + 1
-        for month in range(1, end_month):
-            if download_month("stocks_daily", year, month, log_file):
-                stocks_success += 1
-            else:
-                stocks_fail += 1
-
-    print()
-    print(f"Stocks Daily Summary: ✅ {stocks_success} months, ❌ {stocks_fail} failed")
-    print()
-    log_file.write(f"\nStocks Daily Summary: ✅ {stocks_success} months, ❌ {stocks_fail} failed\n\n")
-
-    # Download options_daily: 2023-10-24 to present
-    print("📈 Downloading options_daily (2023-10 to present)...")
-    print(f"   Estimated: ~25 months, ~5GB total")
-    print()
-
-    log_file.write("📈 Downloading options_daily (2023-10 to present)...\n")
-    log_file.write(f"   Estimated: ~25 months, ~5GB total\n\n")
-
-    options_success = 0
-    options_fail = 0
-
-    # 2023: October onwards
-    for month in range(10, 13):
-        if download_month("options_daily", 2023, month, log_file):
-            options_success += 1
-        else:
-            options_fail += 1
-
-    # 2024-current: Up to current month
-    for year in range(2024, current_year + 1):
-        end_month = 13 if year < current_year else current_month + 1
-        for month in range(1, end_month):
-            if download_month("options_daily", year, month, log_file):
-                options_success += 1
-            else:
-                options_fail += 1
-
-    print()
-    print(f"Options Daily Summary: ✅ {options_success} months, ❌ {options_fail} failed")
-    print()
-    log_file.write(f"\nOptions Daily Summary: ✅ {options_success} months, ❌ {options_fail} failed\n\n")
+    _, log_listener = start_script_logging(logger.name, log_path)
+
+    # Months finished by an earlier, incomplete run
+    checkpoint = ChunkCheckpoint(quantlake_root / "logs" / f"{Path(__file__).stem}_checkpoint.sqlite")
+    if not args.resume:
+        checkpoint.clear()
+
+    logger.info("="*80)
+    logger.info("PHASE 2: DAILY PRICE DATA DOWNLOAD FROM S3")
+    logger.info("="*80)
+    logger.info("")
+
+    # Month ranges up to the last day with published files
+    last_day = last_published_date()
+    stocks_months = month_ranges(2020, 10, last_day)
+    options_months = month_ranges(2023, 10, last_day)
+
+    # Download stocks_daily (2020-10-26 to present) and options_daily
+    # (2023-10-24 to present) side by side: they are separate S3 prefixes
+    # with no dependency on each other
+    logger.info("📊 Downloading stocks_daily (2020-10 to present)...")
+    logger.info("   Estimated: ~50 months, ~10GB total")
+    logger.info("📈 Downloading options_daily (2023-10 to present)...")
+    logger.info("   Estimated: ~25 months, ~5GB total")
+    logger.info("")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stocks_future = executor.submit(
+            download_months, "stocks_daily", stocks_months, args.use_subprocess, checkpoint
+        )
+        options_future = executor.submit(
+            download_months, "options_daily", options_months, args.use_subprocess, checkpoint
+        )
+        stocks_success, stocks_fail = stocks_future.result()
+        options_success, options_fail = options_future.result()
+
+    logger.info("")
+    logger.info(f"Stocks Daily Summary: ✅ {stocks_success} months, ❌ {stocks_fail} failed")
+    logger.info(f"Options Daily Summary: ✅ {options_success} months, ❌ {options_fail} failed")
+    logger.info("")
 
     # Overall summary
-    print("="*80)
-    print("PHASE 2 DOWNLOAD SUMMARY")
-    print("="*80)
-    print(f"Stocks Daily:  ✅ {stocks_success}/{stocks_success+stocks_fail} months")
-    print(f"Options Daily: ✅ {options_success}/{options_success+options_fail} months")
-    print(f"Total: ✅ {stocks_success+options_success} months downloaded")
-    print("="*80)
-
-    log_file.write("="*80 + "\n")
-    log_file.write("PHASE 2 DOWNLOAD SUMMARY\n")
-    log_file.write("="*80 + "\n")
-    log_file.write(f"Stocks Daily:  ✅ {stocks_success}/{stocks_success+stocks_fail} months\n")
-    log_file.write(f"Options Daily: ✅ {options_success}/{options_success+options_fail} months\n")
-    log_file.write(f"Total: ✅ {stocks_success+options_success} months downloaded\n")
-    log_file.write("="*80 + "\n")
-
-    log_file.close()
-
-    return 0 if (stocks_fail == 0 and options_fail == 0) else 1
+    logger.info("="*80)
+    logger.info("PHASE 2 DOWNLOAD SUMMARY")
+    logger.info("="*80)
+    logger.info(f"Stocks Daily:  ✅ {stocks_success}/{stocks_success+stocks_fail} months")
+    logger.info(f"Options Daily: ✅ {options_success}/{options_success+options_fail} months")
+    logger.info(f"Total: ✅ {stocks_success+options_success} months downloaded")
+    logger.info("="*80)
+
+    # Drain queued records to the console and log file
+    log_listener.stop()
+
+    all_done = stocks_fail == 0 and options_fail == 0
+
+    # A finished run leaves nothing to resume
+    if all_done:
+        checkpoint.remove()
+    else:
+        checkpoint.close()
+
+    return 0 if all_done else 1
 
 
 if __name__ == "__main__":
@@ -3,7 +3,8 @@
 Phase 3: News Data Download
 
 Downloads news articles for all active stock tickers (10 years of data).
-Uses parallel processing with rate limiting to avoid API throttling.
+All tickers share one event loop and HTTP connection pool; a semaphore
+bounds concurrency and the client's token bucket bounds the request rate.
 """
 
 import sys
@@ -12,176 +13,376 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import subprocess
+import asyncio
+import argparse
+import json
+import logging
+import os
 from datetime import date, timedelta, datetime as dt
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
+from src.core.config_loader import ConfigLoader
+from src.download.news import NewsDownloader
+from src.download.polygon_rest_client import PolygonRESTClient
+from src.utils.chunk_checkpoint import ChunkCheckpoint
+from src.utils.paths import get_quantlake_root
+from src.utils.script_logging import FILE_ONLY, start_script_logging
+from src.utils.subprocess_stream import run_streaming
+from src.utils.workers import default_workers
+from scripts.utils.get_active_tickers import get_active_tickers as load_active_tickers
+
+logger = logging.getLogger(Path(__file__).stem)
+
+
+# The active ticker list changes at most daily; reruns reuse it
+TICKER_CACHE_TTL = 24 * 3600
+
+# Attempts per ticker (or batch) before it counts as failed
+DOWNLOAD_ATTEMPTS = 5
+
 
 def get_active_tickers():
-    """Get list of active stock tickers"""
+    """Get list of active stock tickers (cached on disk for a day)"""
+    cache_file = get_quantlake_root() / "cache" / "active_tickers.json"
+    if cache_file.exists() and time.time() - cache_file.stat().st_mtime < TICKER_CACHE_TTL:
+        return json.loads(cache_file.read_text())
+
     try:
-        result = subprocess.run(
-            ["python", "scripts/utils/get_active_tickers.py"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        tickers = result.stdout.strip().split()
-        return tickers
-    except subprocess.CalledProcessError as e:
-        print(f"Error getting active tickers: {e}")
+        tickers = load_active_tickers()
+    except Exception as e:
+        logger.info(f"Error getting active tickers: {e}")
         return []
 
+    if tickers:
+        # Write then rename, so a crash never leaves a truncated cache
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.json.tmp')
+        tmp_file.write_text(json.dumps(tickers))
+        os.replace(tmp_file, cache_file)
 
-def download_news_for_ticker(ticker: str, start_date: str, end_date: str, log_file) -> tuple:
+    return tickers
+
+
+def get_api_key():
+    """Read the Polygon API key from config/credentials.yaml"""
+    credentials = ConfigLoader().get_credentials('polygon')
+    if not credentials:
+        return None
+
+    if 'api_key' in credentials:
+        return credentials['api_key']
+    if 'api' in credentials and isinstance(credentials['api'], dict):
+        return credentials['api'].get('key')
+    return None
+
+
+async def download_news_for_ticker(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    downloader: NewsDownloader = None,
+    use_subprocess: bool = False
+) -> tuple:
     """Download news for a single ticker"""
     timestamp = dt.now().strftime('%H:%M:%S')
-    print(f"[{timestamp}] Downloading news for {ticker}", flush=True)
-    log_file.write(f"[{timestamp}] Downloading news for {ticker}\n")
-    log_file.flush()
-
-    cmd = [
-        "quantmini", "polygon", "news", ticker,
-        "--start-date", start_date,
-        "--end-date", end_date
-    ]
+    logger.info(f"[{timestamp}] Downloading news for {ticker}")
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)  # 5 min timeout
-        if result.returncode == 0:
-            # Parse output to count articles
-            articles_count = result.stdout.count("✓") if "✓" in result.stdout else 0
-            print(f"  ✅ {ticker}: {articles_count} articles", flush=True)
-            log_file.write(f"  ✅ Success: {articles_count} articles\n")
-            log_file.flush()
+        if use_subprocess:
+            cmd = [
+                "quantmini", "polygon", "news", ticker,
+                "--start-date", start_date,
+                "--end-date", end_date
+            ]
+            articles_count = 0
+
+            def forward(stream, line):
+                nonlocal articles_count
+                # Count articles from the CLI output as it arrives
+                if stream == 'stdout':
+                    articles_count += line.count("✓")
+                logger.info(f"    {line.rstrip()}", extra=FILE_ONLY)
+
+            returncode, _, stderr = await asyncio.to_thread(
+                run_streaming, cmd, timeout=300, on_line=forward  # 5 min timeout
+            )
+            success = returncode == 0
+            error_msg = stderr[-100:].strip() if stderr else "Unknown error"
+        else:
+            df = await asyncio.wait_for(
+                downloader.download_ticker_news(
+                    ticker=ticker,
+                    published_utc_gte=start_date,
+                    published_utc_lte=end_date,
+                    limit=1000
+                ),
+                timeout=300  # 5 min timeout
+            )
+            articles_count = len(df)
+            success = True
+
+        if success:
+            logger.info(f"  ✅ {ticker}: {articles_count} articles")
             return (ticker, True, articles_count)
         else:
-            error_msg = result.stderr[:100] if result.stderr else "Unknown error"
-            print(f"  ❌ {ticker}: {error_msg}", flush=True)
-            log_file.write(f"  ❌ Failed: {error_msg}\n")
-            log_file.flush()
+            logger.info(f"  ❌ {ticker}: {error_msg}")
             return (ticker, False, 0)
-    except subprocess.TimeoutExpired:
-        print(f"  ⏱️  {ticker}: Timeout", flush=True)
-        log_file.write(f"  ⏱️  Timeout\n")
-        log_file.flush()
+    except (subprocess.TimeoutExpired, asyncio.TimeoutError, TimeoutError):
+        logger.info(f"  ⏱️  {ticker}: Timeout")
         return (ticker, False, 0)
     except Exception as e:
         error_msg = str(e)[:100]
-        print(f"  ❌ {ticker}: {error_msg}", flush=True)
-        log_file.write(f"  ❌ Error: {error_msg}\n")
-        log_file.flush()
+        logger.info(f"  ❌ {ticker}: {error_msg}")
         return (ticker, False, 0)
 
 
+async def download_news_for_batch(
+    tickers: list,
+    start_date: str,
+    end_date: str,
+    downloader: NewsDownloader
+) -> list:
+    """Download news for a batch of tickers with one ticker.any_of query"""
+    label = f"{len(tickers)} tickers ({tickers[0]}..{tickers[-1]})"
+    timestamp = dt.now().strftime('%H:%M:%S')
+    logger.info(f"[{timestamp}] Downloading news for {label}")
+
+    try:
+        counts = await asyncio.wait_for(
+            downloader.download_tickers_news(
+                tickers=tickers,
+                published_utc_gte=start_date,
+                published_utc_lte=end_date,
+                limit=1000
+            ),
+            timeout=1800  # 30 min timeout
+        )
+        articles_count = sum(counts.values())
+        logger.info(f"  ✅ {label}: {articles_count} articles")
+        return [(ticker, True, counts.get(ticker, 0)) for ticker in tickers]
+    except (asyncio.TimeoutError, TimeoutError):
+        logger.info(f"  ⏱️  {label}: Timeout")
+    except Exception as e:
+        error_msg = str(e)[:100]
+        logger.info(f"  ❌ {label}: {error_msg}")
+
+    return [(ticker, False, 0) for ticker in tickers]
+
+
+async def download_all_news(
+    tickers: list,
+    start_date: str,
+    end_date: str,
+    api_key: str,
+    workers: int = 16,
+    requests_per_second: float = 100,
+    batch_size: int = 25,
+    use_subprocess: bool = False,
+    checkpoint: ChunkCheckpoint = None
+) -> tuple:
+    """
+    Download news for every ticker on one event loop
+
+    One client (and connection pool) serves all tickers. The semaphore caps
+    requests in flight; the client's token bucket caps the request rate.
+    Tickers are queried `batch_size` at a time when the endpoint supports
+    ticker.any_of, otherwise one at a time.
+
+    Returns:
+        (successful tickers, failed tickers, total articles)
+    """
+    success_count = 0
+    fail_count = 0
+    total_articles = 0
+
+    start_time = time.time()
+
+    async with PolygonRESTClient(
+        api_key=api_key,
+        max_concurrent=workers,
+        max_connections=workers * 2,
+        max_requests_per_second=requests_per_second
+    ) as client:
+        downloader = NewsDownloader(
+            client,
+            get_quantlake_root() / 'bronze' / 'news',
+            use_partitioned_structure=True
+        )
+        batched = False
+        if not use_subprocess and batch_size > 1 and len(tickers) > 1:
+            try:
+                batched = await downloader.supports_ticker_any_of(tickers[:2])
+            except Exception as e:
+                logger.info(f"⚠️  ticker.any_of probe failed: {e}")
+            logger.info(f"Batched queries: {f'{batch_size} tickers per request' if batched else 'unsupported, one ticker per request'}")
+
+        if batched:
+            batches = [tickers[i:i + batch_size] for i in range(0, len(tickers), batch_size)]
+        else:
+            batches = [[ticker] for ticker in tickers]
+
+        sem = asyncio.Semaphore(workers)
+
+        async def run_one(batch: list):
+            label = batch[0] if len(batch) == 1 else f"{batch[0]}..{batch[-1]}"
+            for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+                if attempt > 1:
+                    # Timeouts and 5xx responses usually clear; back off 2, 4, 8... s
+                    # without holding a download slot
+                    delay = min(2 ** (attempt - 1), 60)
+                    logger.info(f"  🔁 Retrying {label} in {delay}s (attempt {attempt}/{DOWNLOAD_ATTEMPTS})")
+                    await asyncio.sleep(delay)
+
+                async with sem:
+                    if len(batch) > 1:
+                        results = await download_news_for_batch(
+                            batch, start_date, end_date, downloader
+                        )
+                    else:
+                        results = [await download_news_for_ticker(
+                            batch[0], start_date, end_date, downloader, use_subprocess
+                        )]
+
+                if all(success for _, success, _ in results):
+                    break
+
+            return results
+
+        tasks = [asyncio.create_task(run_one(batch)) for batch in batches]
+
+        # Process completed tasks
+        i = 0
+        for future in asyncio.as_completed(tasks):
+            for ticker, success, article_count in await future:
+                i += 1
+
+                if checkpoint:
+                    checkpoint.record('news', ticker, success)
+
+                if success:
+                    success_count += 1
+                    total_articles += article_count
+                else:
+                    fail_count += 1
+
+                # Progress update every 100 tickers
+                if i % 100 == 0:
+                    elapsed = time.time() - start_time
+                    rate = i / elapsed
+                    remaining = len(tickers) - i
+                    eta = remaining / rate if rate > 0 else 0
+
+                    logger.info("")
+                    logger.info(f"📊 Progress: {i}/{len(tickers)} tickers ({i/len(tickers)*100:.1f}%)")
+                    logger.info(f"   Success: {success_count} | Failed: {fail_count}")
+                    logger.info(f"   Articles downloaded: {total_articles:,}")
+                    logger.info(f"   ETA: {eta/60:.1f} minutes")
+                    logger.info("")
+
+    return success_count, fail_count, total_articles
+
+
 def main():
-    from src.utils.paths import get_quantlake_root
+    parser = argparse.ArgumentParser(description='Phase 3: Download news for all active tickers')
+    # The API rate limit usually binds before the host does, so
+    # --requests-per-second matters more than --workers
+    parser.add_argument('--workers', type=int, default=default_workers(),
+                        help='Tickers downloaded concurrently (default: 4 per CPU, at most 32)')
+    parser.add_argument('--requests-per-second', type=float, default=100,
+                        help='API request rate across all downloads (default: 100)')
+    parser.add_argument('--batch-size', type=int, default=25,
+                        help='Tickers per news query when ticker.any_of is supported (default: 25)')
+    parser.add_argument('--resume', action=argparse.BooleanOptionalAction, default=True,
+                        help='Skip tickers a previous, unfinished run already downloaded (default: on)')
+    parser.add_argument('--use-subprocess', action='store_true',
+                        help='Run each ticker through the quantmini CLI in a separate process')
+    args = parser.parse_args()
+
+    api_key = get_api_key()
+    if not api_key and not args.use_subprocess:
+        print("ERROR: Polygon API key not found in config/credentials.yaml")
+        return 1
 
     quantlake_root = get_quantlake_root()
     log_path = quantlake_root / "logs" / f"news_download_{dt.now().strftime('%Y%m%d_%H%M%S')}.log"
-    log_file = open(log_path, 'w', buffering=1)
+    # Console and log file output, written from a listener thread
+    _, log_listener = start_script_logging(logger.name, log_path)
 
-    print("=" * 80)
-    print("PHASE 3: NEWS DATA DOWNLOAD")
-    print("=" * 80)
-    print()
-
-    log_file.write("=" * 80 + "\n")
-    log_file.write("PHASE 3: NEWS DATA DOWNLOAD\n")
-    log_file.write("=" * 80 + "\n\n")
+    logger.info("=" * 80)
+    logger.info("PHASE 3: NEWS DATA DOWNLOAD")
+    logger.info("=" * 80)
+    logger.info("")
 
     # Get active tickers
-    print("Loading active stock tickers...")
+    logger.info("Loading active stock tickers...")
     tickers = get_active_tickers()
 
     if not tickers:
-        print("ERROR: No active tickers found")
-        log_file.write("ERROR: No active tickers found\n")
-        log_file.close()
+        logger.info("ERROR: No active tickers found")
+        log_listener.stop()
         return 1
 
-    print(f"Found {len(tickers)} active tickers")
-    print()
+    logger.info(f"Found {len(tickers)} active tickers")
+
+    # Tickers finished by an earlier, incomplete run
+    checkpoint = ChunkCheckpoint(quantlake_root / "logs" / f"{Path(__file__).stem}_checkpoint.sqlite")
+    if not args.resume:
+        checkpoint.clear()
 
-    log_file.write(f"Found {len(tickers)} active tickers\n\n")
+    completed = checkpoint.completed('news')
+    if completed:
+        tickers = [ticker for ticker in tickers if ticker not in completed]
+        logger.info(f"Resuming: {len(completed)} tickers already downloaded, {len(tickers)} remaining")
+
+    logger.info("")
+
+    if not tickers:
+        log_listener.stop()
+        checkpoint.remove()
+        return 0
 
     # Calculate 10 years ago and today
     ten_years_ago = (date.today() - timedelta(days=10*365)).strftime('%Y-%m-%d')
     today = date.today().strftime('%Y-%m-%d')
-    print(f"Downloading news from {ten_years_ago} to {today}")
-    print(f"Using 8 parallel workers with rate limiting")
-    print()
-
-    log_file.write(f"Date range: {ten_years_ago} to {today}\n")
-    log_file.write(f"Parallel workers: 8\n\n")
-
-    # Download news in parallel (8 workers as per script spec)
-    success_count = 0
-    fail_count = 0
-    total_articles = 0
+    logger.info(f"Downloading news from {ten_years_ago} to {today}")
+    logger.info(f"Using {args.workers} concurrent downloads at up to {args.requests_per_second:g} requests/sec")
+    logger.info("")
 
     start_time = time.time()
 
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        # Submit all tasks
-        futures = {
-            executor.submit(download_news_for_ticker, ticker, ten_years_ago, today, log_file): ticker
-            for ticker in tickers
-        }
-
-        # Process completed tasks
-        for i, future in enumerate(as_completed(futures), 1):
-            ticker, success, article_count = future.result()
-
-            if success:
-                success_count += 1
-                total_articles += article_count
-            else:
-                fail_count += 1
-
-            # Progress update every 100 tickers
-            if i % 100 == 0:
-                elapsed = time.time() - start_time
-                rate = i / elapsed
-                remaining = len(tickers) - i
-                eta = remaining / rate if rate > 0 else 0
-
-                print(f"\n📊 Progress: {i}/{len(tickers)} tickers ({i/len(tickers)*100:.1f}%)")
-                print(f"   Success: {success_count} | Failed: {fail_count}")
-                print(f"   Articles downloaded: {total_articles:,}")
-                print(f"   ETA: {eta/60:.1f} minutes\n")
-
-            # Small delay to avoid overwhelming the API
-            time.sleep(0.1)
+    success_count, fail_count, total_articles = asyncio.run(download_all_news(
+        tickers, ten_years_ago, today, api_key,
+        workers=args.workers,
+        requests_per_second=args.requests_per_second,
+        batch_size=args.batch_size,
+        use_subprocess=args.use_subprocess,
+        checkpoint=checkpoint
+    ))
 
     # Final summary
     elapsed = time.time() - start_time
 
-    print()
-    print("=" * 80)
-    print("PHASE 3 SUMMARY")
-    print("=" * 80)
-    print(f"Total tickers processed: {len(tickers)}")
-    print(f"Successful: {success_count}")
-    print(f"Failed: {fail_count}")
-    print(f"Success rate: {success_count/len(tickers)*100:.1f}%")
-    print(f"Total articles downloaded: {total_articles:,}")
-    print(f"Time elapsed: {elapsed/60:.1f} minutes")
-    print(f"Average rate: {len(tickers)/elapsed*60:.1f} tickers/min")
-    print("=" * 80)
-
-    log_file.write("\n" + "=" * 80 + "\n")
-    log_file.write("PHASE 3 SUMMARY\n")
-    log_file.write("=" * 80 + "\n")
-    log_file.write(f"Total tickers: {len(tickers)}\n")
-    log_file.write(f"Successful: {success_count}\n")
-    log_file.write(f"Failed: {fail_count}\n")
-    log_file.write(f"Success rate: {success_count/len(tickers)*100:.1f}%\n")
-    log_file.write(f"Total articles: {total_articles:,}\n")
-    log_file.write(f"Time elapsed: {elapsed/60:.1f} minutes\n")
-    log_file.write("=" * 80 + "\n")
-
-    log_file.close()
+    logger.info("")
+    logger.info("=" * 80)
+    logger.info("PHASE 3 SUMMARY")
+    logger.info("=" * 80)
+    logger.info(f"Total tickers processed: {len(tickers)}")
+    logger.info(f"Successful: {success_count}")
+    logger.info(f"Failed: {fail_count}")
+    logger.info(f"Success rate: {success_count/len(tickers)*100:.1f}%")
+    logger.info(f"Total articles downloaded: {total_articles:,}")
+    logger.info(f"Time elapsed: {elapsed/60:.1f} minutes")
+    logger.info(f"Average rate: {len(tickers)/elapsed*60:.1f} tickers/min")
+    logger.info("=" * 80)
+
+    # Drain queued records to the console and log file
+    log_listener.stop()
+
+    # A finished run leaves nothing to resume
+    if fail_count == 0:
+        checkpoint.remove()
+    else:
+        checkpoint.close()
 
     return 0 if fail_count == 0 else 1
 
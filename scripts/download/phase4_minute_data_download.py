@@ -5,7 +5,8 @@ Phase 4: Download Minute Price Data from S3
 Downloads stocks_minute (2020-10-17+) and options_minute (2020-10-17+)
 from Polygon S3 flat files.
 
-This is a LARGE download (~1TB total, 20-30 hours)
+This is a LARGE download (~1TB total, 20-30 hours). The two data types
+download concurrently.
 """
 
 import sys
@@ -13,44 +14,30 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-import subprocess
-from datetime import date, datetime, timedelta
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 import argparse
 
+from src.download.flat_files import date_chunks, download_chunks, last_published_date
+from src.utils.chunk_checkpoint import ChunkCheckpoint
+from src.utils.script_logging import start_script_logging
+from src.utils.workers import default_workers
 
-def download_date_range(data_type: str, start_date: str, end_date: str, log_file):
-    """Download a date range of minute data"""
-    print(f"[{datetime.now().strftime('%H:%M:%S')}] Downloading {data_type}: {start_date} to {end_date}", flush=True)
-    log_file.write(f"[{datetime.now().strftime('%H:%M:%S')}] Downloading {data_type}: {start_date} to {end_date}\n")
-    log_file.flush()
-
-    cmd = [
-        "quantmini", "data", "download",
-        "--data-type", data_type,
-        "--start-date", start_date,
-        "--end-date", end_date
-    ]
-
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=7200)  # 2 hour timeout
-        if result.returncode == 0:
-            print(f"  ✅ Success: {data_type} {start_date} to {end_date}", flush=True)
-            log_file.write(f"  ✅ Success\n")
-        else:
-            print(f"  ❌ Failed: {result.stderr[:200]}", flush=True)
-            log_file.write(f"  ❌ Failed: {result.stderr[:200]}\n")
-        log_file.flush()
-        return result.returncode == 0
-    except subprocess.TimeoutExpired:
-        print(f"  ⏱️  Timeout: {data_type} {start_date} to {end_date}", flush=True)
-        log_file.write(f"  ⏱️  Timeout\n")
-        log_file.flush()
-        return False
-    except Exception as e:
-        print(f"  ❌ Error: {str(e)[:200]}", flush=True)
-        log_file.write(f"  ❌ Error: {str(e)[:200]}\n")
-        log_file.flush()
-        return False
+logger = logging.getLogger(Path(__file__).stem)
+
+# Each chunk worker holds one whole minute file in memory while saving it
+# (options_minute files reach a few hundred MB compressed, copied once on write)
+WORKER_MEMORY_GB = 1.0
+
+
+def log_slowest_chunks(checkpoint: ChunkCheckpoint, data_type: str, limit: int = 3):
+    """Log the chunks of `data_type` that took longest (stragglers)"""
+    slowest = checkpoint.slowest(data_type, limit)
+    if slowest:
+        logger.info(f"Slowest {data_type} chunks: " + ", ".join(
+            f"{chunk} ({seconds/60:.1f} min)" for chunk, seconds in slowest
+        ))
 
 
 def main():
@@ -58,32 +45,49 @@ def main():
     parser.add_argument('--log-file', type=str, help='Log file path')
     parser.add_argument('--stocks-only', action='store_true', help='Download stocks_minute only')
     parser.add_argument('--options-only', action='store_true', help='Download options_minute only')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Parallel chunk downloads per data type (default: 4 per CPU, at most 32, '
+                             f'capped at {WORKER_MEMORY_GB:g} GB of available memory per worker)')
+    parser.add_argument('--chunk-days', type=int, default=7,
+                        help='Days per download chunk (default: 7)')
+    parser.add_argument('--resume', action=argparse.BooleanOptionalAction, default=True,
+                        help='Skip chunks a previous, unfinished run already downloaded (default: on)')
+    parser.add_argument('--use-subprocess', action='store_true',
+                        help='Run each chunk through the quantmini CLI in a separate process')
     args = parser.parse_args()
 
-    # Open log file
+    if args.workers is None:
+        # Both data types download at once, sharing the available memory
+        data_types = 1 if args.stocks_only or args.options_only else 2
+        args.workers = default_workers(memory_per_worker_gb=WORKER_MEMORY_GB * data_types)
+
+    from src.utils.paths import get_quantlake_root
+    quantlake_root = get_quantlake_root()
+
+    # Console and log file output, written from a listener thread
     if args.log_file:
-        log_file = open(args.log_file, 'w', buffering=1)
+        log_path = Path(args.log_file)
     else:
-        from src.utils.paths import get_quantlake_root
-        quantlake_root = get_quantlake_root()
         log_path = quantlake_root / "logs" / f"phase4_minute_download_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        log_file = open(log_path, 'w', buffering=1)
+    _, log_listener = start_script_logging(logger.name, log_path)
 
-    print("="*80)
-    print("PHASE 4: MINUTE PRICE DATA DOWNLOAD FROM S3")
-    print("="*80)
-    print("⚠️  WARNING: This is a LARGE download (~1TB, 20-30 hours)")
-    print()
+    # Chunks finished by an earlier, incomplete run
+    checkpoint = ChunkCheckpoint(quantlake_root / "logs" / f"{Path(__file__).stem}_checkpoint.sqlite")
+    if not args.resume:
+        checkpoint.clear()
 
-    log_file.write("="*80 + "\n")
-    log_file.write("PHASE 4: MINUTE PRICE DATA DOWNLOAD FROM S3\n")
-    log_file.write("="*80 + "\n")
-    log_file.write("⚠️  WARNING: This is a LARGE download (~1TB, 20-30 hours)\n\n")
+    logger.info("="*80)
+    logger.info("PHASE 4: MINUTE PRICE DATA DOWNLOAD FROM S3")
+    logger.info("="*80)
+    logger.info("⚠️  WARNING: This is a LARGE download (~1TB, 20-30 hours)")
+    logger.info(f"Workers per data type: {args.workers}")
+    logger.info("")
 
-    # Current date
-    today = date.today()
+    # Files are published after each session ends
+    last_day = last_published_date()
 
-    # Download in 3-month chunks to avoid timeouts
+    # Download in short chunks: many small tasks balance across workers and
+    # a failed chunk only costs a few days of data
     # Stocks minute: 2020-10-17 to present
     # Options minute: 2020-10-17 to present
 
@@ -92,92 +96,74 @@ def main():
     options_success = 0
     options_fail = 0
 
+    # stocks_minute and options_minute are separate S3 prefixes with no
+    # dependency on each other, so both download at once
+    futures = {}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if not args.options_only:
+            logger.info("📊 Downloading stocks_minute (2020-10-17 to present)...")
+            logger.info("   Estimated: ~500 GB total, ~12-15 hours")
+            logger.info(f"   Strategy: {args.chunk_days}-day chunks")
+            logger.info("")
+
+            futures['stocks'] = executor.submit(
+                download_chunks, "stocks_minute", date_chunks(date(2020, 10, 17), last_day, args.chunk_days),
+                args.workers, args.use_subprocess, checkpoint,
+                drop_page_cache=True, log=logger
+            )
+
+        if not args.stocks_only:
+            logger.info("📈 Downloading options_minute (2020-10-17 to present)...")
+            logger.info("   Estimated: ~500 GB total, ~12-15 hours")
+            logger.info(f"   Strategy: {args.chunk_days}-day chunks")
+            logger.info("")
+
+            futures['options'] = executor.submit(
+                download_chunks, "options_minute", date_chunks(date(2020, 10, 17), last_day, args.chunk_days),
+                args.workers, args.use_subprocess, checkpoint,
+                drop_page_cache=True, log=logger
+            )
+
+        if 'stocks' in futures:
+            stocks_success, stocks_fail = futures['stocks'].result()
+        if 'options' in futures:
+            options_success, options_fail = futures['options'].result()
+
+    logger.info("")
     if not args.options_only:
-        print("📊 Downloading stocks_minute (2020-10-17 to present)...")
-        print(f"   Estimated: ~500 GB total, ~12-15 hours")
-        print(f"   Strategy: 3-month chunks to avoid timeouts")
-        print()
-
-        log_file.write("📊 Downloading stocks_minute (2020-10-17 to present)...\n")
-        log_file.write(f"   Estimated: ~500 GB total, ~12-15 hours\n\n")
-
-        # Start from 2020-10-17
-        current_start = date(2020, 10, 17)
-
-        while current_start < today:
-            # Download in 3-month chunks
-            current_end = min(current_start + timedelta(days=90), today)
-
-            start_str = current_start.strftime('%Y-%m-%d')
-            end_str = current_end.strftime('%Y-%m-%d')
-
-            if download_date_range("stocks_minute", start_str, end_str, log_file):
-                stocks_success += 1
-            else:
-                stocks_fail += 1
-
-            current_start = current_end + timedelta(days=1)
-
-        print()
-        print(f"Stocks Minute Summary: ✅ {stocks_success} chunks, ❌ {stocks_fail} failed")
-        print()
-        log_file.write(f"\nStocks Minute Summary: ✅ {stocks_success} chunks, ❌ {stocks_fail} failed\n\n")
-
+        logger.info(f"Stocks Minute Summary: ✅ {stocks_success} chunks, ❌ {stocks_fail} failed")
     if not args.stocks_only:
-        print("📈 Downloading options_minute (2020-10-17 to present)...")
-        print(f"   Estimated: ~500 GB total, ~12-15 hours")
-        print(f"   Strategy: 3-month chunks to avoid timeouts")
-        print()
-
-        log_file.write("📈 Downloading options_minute (2020-10-17 to present)...\n")
-        log_file.write(f"   Estimated: ~500 GB total, ~12-15 hours\n\n")
-
-        # Start from 2020-10-17
-        current_start = date(2020, 10, 17)
-
-        while current_start < today:
-            # Download in 3-month chunks
-            current_end = min(current_start + timedelta(days=90), today)
-
-            start_str = current_start.strftime('%Y-%m-%d')
-            end_str = current_end.strftime('%Y-%m-%d')
-
-            if download_date_range("options_minute", start_str, end_str, log_file):
-                options_success += 1
-            else:
-                options_fail += 1
-
-            current_start = current_end + timedelta(days=1)
-
-        print()
-        print(f"Options Minute Summary: ✅ {options_success} chunks, ❌ {options_fail} failed")
-        print()
-        log_file.write(f"\nOptions Minute Summary: ✅ {options_success} chunks, ❌ {options_fail} failed\n\n")
+        logger.info(f"Options Minute Summary: ✅ {options_success} chunks, ❌ {options_fail} failed")
+    logger.info("")
 
     # Overall summary
-    print("="*80)
-    print("PHASE 4 DOWNLOAD SUMMARY")
-    print("="*80)
+    logger.info("="*80)
+    logger.info("PHASE 4 DOWNLOAD SUMMARY")
+    logger.info("="*80)
     if not args.options_only:
-        print(f"Stocks Minute:  ✅ {stocks_success}/{stocks_success+stocks_fail} chunks")
+        logger.info(f"Stocks Minute:  ✅ {stocks_success}/{stocks_success+stocks_fail} chunks")
     if not args.stocks_only:
-        print(f"Options Minute: ✅ {options_success}/{options_success+options_fail} chunks")
-    print(f"Total: ✅ {stocks_success+options_success} chunks downloaded")
-    print("="*80)
+        logger.info(f"Options Minute: ✅ {options_success}/{options_success+options_fail} chunks")
+    logger.info(f"Total: ✅ {stocks_success+options_success} chunks downloaded")
+    logger.info("="*80)
 
-    log_file.write("="*80 + "\n")
-    log_file.write("PHASE 4 DOWNLOAD SUMMARY\n")
-    log_file.write("="*80 + "\n")
     if not args.options_only:
-        log_file.write(f"Stocks Minute:  ✅ {stocks_success}/{stocks_success+stocks_fail} chunks\n")
+        log_slowest_chunks(checkpoint, "stocks_minute")
     if not args.stocks_only:
-        log_file.write(f"Options Minute: ✅ {options_success}/{options_success+options_fail} chunks\n")
-    log_file.write(f"Total: ✅ {stocks_success+options_success} chunks downloaded\n")
-    log_file.write("="*80 + "\n")
+        log_slowest_chunks(checkpoint, "options_minute")
+
+    # Drain queued records to the console and log file
+    log_listener.stop()
 
-    log_file.close()
+    all_done = stocks_fail == 0 and options_fail == 0
+
+    # A finished run leaves nothing to resume
+    if all_done:
+        checkpoint.remove()
+    else:
+        checkpoint.close()
 
-    return 0 if (stocks_fail == 0 and options_fail == 0) else 1
+    return 0 if all_done else 1
 
 
 if __name__ == "__main__":
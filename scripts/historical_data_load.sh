@@ -323,7 +323,7 @@ phase1_corporate_actions_fundamentals() {
 
     log_info "Downloading financial ratios for all tickers (batch mode, smart resume)"
 
-    python "$PROJECT_ROOT/scripts/download/download_financial_ratios_only.py" \
+    python "$PROJECT_ROOT/scripts/download/download_fundamentals_only.py" --endpoints financial_ratios \
         2>&1 | tee -a "$LOG_FILE" &
 
     wait
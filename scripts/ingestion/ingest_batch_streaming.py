@@ -5,7 +5,10 @@ Batch Ingestion Script - Memory-Safe for 24GB Systems
 Ingests Phase 2 (daily) and Phase 4 (minute) data from Landing to Bronze layer
 using streaming mode to minimize memory usage.
 
-Processes data in monthly batches to stay within memory constraints.
+Processes data in monthly batches to stay within memory constraints. Months
+are independent, so a few run at once (--max-parallel) on one in-process
+IngestionOrchestrator; --use-subprocess runs each month through the
+quantmini CLI instead.
 """
 
 import sys
@@ -13,80 +16,167 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import asyncio
+import calendar
+import logging
 import subprocess
-from datetime import date, timedelta, datetime as dt
+from datetime import date, datetime as dt
+from typing import Dict, List, Tuple
 import argparse
 
+import psutil
 
-def ingest_month(data_type: str, year: int, month: int, log_file):
+from src.core.config_loader import ConfigLoader
+from src.orchestration import IngestionOrchestrator
+from src.utils.script_logging import FILE_ONLY, start_script_logging
+from src.utils.subprocess_stream import run_streaming
+from src.utils.workers import available_cpus
+
+logger = logging.getLogger(Path(__file__).stem)
+
+# Rough peak memory of one month in flight (downloaded files plus the
+# ingest working set), used to size the default --max-parallel
+MONTH_MEMORY_GB = 2
+
+
+async def ingest_month(
+    data_type: str,
+    year: int,
+    month: int,
+    orchestrator: IngestionOrchestrator = None,
+    use_subprocess: bool = False
+):
     """Ingest a single month of data using streaming mode"""
     start_date = f"{year}-{month:02d}-01"
-    # Simple end-of-month: day 31 (CLI will handle invalid dates)
-    end_date = f"{year}-{month:02d}-31"
-
-    print(f"[{dt.now().strftime('%H:%M:%S')}] Ingesting {data_type}: {year}-{month:02d}", flush=True)
-    log_file.write(f"[{dt.now().strftime('%H:%M:%S')}] Ingesting {data_type}: {year}-{month:02d}\n")
-    log_file.flush()
+    end_date = f"{year}-{month:02d}-{calendar.monthrange(year, month)[1]:02d}"
+    label = f"{data_type} {year}-{month:02d}"
 
-    cmd = [
-        "quantmini", "data", "ingest",
-        "--data-type", data_type,
-        "--start-date", start_date,
-        "--end-date", end_date,
-        "--mode", "streaming"  # Use streaming mode for low memory
-    ]
+    logger.info(f"[{dt.now().strftime('%H:%M:%S')}] Ingesting {data_type}: {year}-{month:02d}")
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)  # 1 hour timeout
-        if result.returncode == 0:
-            print(f"  ✅ Success: {data_type} {year}-{month:02d}", flush=True)
-            log_file.write(f"  ✅ Success\n")
+        if use_subprocess:
+            cmd = [
+                "quantmini", "data", "ingest",
+                "--data-type", data_type,
+                "--start-date", start_date,
+                "--end-date", end_date,
+                "--mode", "streaming"  # Use streaming mode for low memory
+            ]
+
+            def forward(stream, line):
+                logger.info(f"    {line.rstrip()}", extra=FILE_ONLY)
+
+            returncode, _, stderr = await asyncio.to_thread(
+                run_streaming, cmd, timeout=3600, on_line=forward  # 1 hour timeout
+            )
+            success, error = returncode == 0, stderr[-200:].strip()
+        else:
+            result = await asyncio.wait_for(
+                orchestrator.ingest_date_range(
+                    data_type=data_type,
+                    start_date=start_date,
+                    end_date=end_date,
+                    incremental=True,
+                    use_polars=False  # Streaming mode for low memory
+                ),
+                timeout=3600  # 1 hour timeout
+            )
+            success = result.get('failed', 0) == 0
+            error = f"{result.get('failed', 0)}/{result.get('total_files', 0)} files failed"
+
+        if success:
+            logger.info(f"  ✅ Success: {label}")
         else:
-            print(f"  ❌ Failed: {result.stderr[:200]}", flush=True)
-            log_file.write(f"  ❌ Failed: {result.stderr[:200]}\n")
-        log_file.flush()
-        return result.returncode == 0
-    except subprocess.TimeoutExpired:
-        print(f"  ⏱️  Timeout: {data_type} {year}-{month:02d}", flush=True)
-        log_file.write(f"  ⏱️  Timeout\n")
-        log_file.flush()
+            logger.info(f"  ❌ Failed: {label}: {error}")
+        return success
+    except (subprocess.TimeoutExpired, asyncio.TimeoutError, TimeoutError):
+        logger.info(f"  ⏱️  Timeout: {label}")
         return False
     except Exception as e:
-        print(f"  ❌ Error: {str(e)[:200]}", flush=True)
-        log_file.write(f"  ❌ Error: {str(e)[:200]}\n")
-        log_file.flush()
+        logger.info(f"  ❌ Error: {label}: {str(e)[:200]}")
         return False
 
 
+def month_jobs(data_type: str, start_year: int, start_month: int, end: date) -> List[Tuple[str, int, int]]:
+    """(data_type, year, month) for every month from start_year-start_month through `end`"""
+    jobs = []
+    year, month = start_year, start_month
+    while (year, month) <= (end.year, end.month):
+        jobs.append((data_type, year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return jobs
+
+
+def default_max_parallel() -> int:
+    """
+    Concurrent months that fit in the memory available now
+
+    The orchestrator downloads a whole month into memory before ingesting
+    it, so months in flight are capped at MONTH_MEMORY_GB each, as well as
+    by CPUs (half, at most 4).
+    """
+    by_memory = int(psutil.virtual_memory().available / 1024**3 // MONTH_MEMORY_GB)
+    return max(1, min(4, available_cpus() // 2, by_memory))
+
+
+async def run_jobs_parallel(
+    jobs: List[Tuple[str, int, int]],
+    max_parallel: int,
+    use_subprocess: bool = False
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Ingest months concurrently on one event loop
+
+    One orchestrator (S3 client, metadata manager, imported modules) serves
+    every month; the semaphore caps months in flight.
+
+    Returns:
+        {data_type: (successful months, failed months)}
+    """
+    orchestrator = None if use_subprocess else IngestionOrchestrator(config=ConfigLoader())
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def run_one(data_type: str, year: int, month: int) -> bool:
+        async with semaphore:
+            return await ingest_month(data_type, year, month, orchestrator, use_subprocess)
+
+    results = await asyncio.gather(*(run_one(*job) for job in jobs))
+
+    counts = {data_type: [0, 0] for data_type, _, _ in jobs}
+    for (data_type, _, _), success in zip(jobs, results):
+        counts[data_type][0 if success else 1] += 1
+
+    return {data_type: (success, fail) for data_type, (success, fail) in counts.items()}
+
+
 def main():
     parser = argparse.ArgumentParser(description='Batch ingestion with streaming mode (24GB memory safe)')
     parser.add_argument('--log-file', type=str, help='Log file path')
     parser.add_argument('--daily-only', action='store_true', help='Ingest daily data only')
     parser.add_argument('--minute-only', action='store_true', help='Ingest minute data only')
+    parser.add_argument('--max-parallel', type=int, default=default_max_parallel(),
+                        help=f'Months ingested at once (default: half the CPUs, at most 4, '
+                             f'and {MONTH_MEMORY_GB}GB of available memory per month)')
+    parser.add_argument('--use-subprocess', action='store_true',
+                        help='Run each month through the quantmini CLI in a separate process')
     args = parser.parse_args()
 
-    # Open log file
+    # Console and log file output, written from a listener thread
     if args.log_file:
-        log_file = open(args.log_file, 'w', buffering=1)
+        log_path = Path(args.log_file)
     else:
         from src.utils.paths import get_quantlake_root
         quantlake_root = get_quantlake_root()
         log_path = quantlake_root / "logs" / f"batch_ingestion_{dt.now().strftime('%Y%m%d_%H%M%S')}.log"
-        log_file = open(log_path, 'w', buffering=1)
-
-    print("="*80)
-    print("BATCH INGESTION - STREAMING MODE (24GB MEMORY SAFE)")
-    print("="*80)
-    print()
+    _, log_listener = start_script_logging(logger.name, log_path)
 
-    log_file.write("="*80 + "\n")
-    log_file.write("BATCH INGESTION - STREAMING MODE (24GB MEMORY SAFE)\n")
-    log_file.write("="*80 + "\n\n")
+    logger.info("="*80)
+    logger.info("BATCH INGESTION - STREAMING MODE (24GB MEMORY SAFE)")
+    logger.info("="*80)
+    logger.info("")
 
     # Current date
     today = date.today()
-    current_year = today.year
-    current_month = today.month
 
     stocks_daily_success = 0
     stocks_daily_fail = 0
@@ -94,92 +184,35 @@ def main():
     options_daily_fail = 0
 
     if not args.minute_only:
-        # Ingest stocks_daily: 2020-10 to present
-        print("📊 Ingesting stocks_daily (2020-10 to present)...")
-        print(f"   Using streaming mode for low memory usage")
-        print()
-
-        log_file.write("📊 Ingesting stocks_daily (2020-10 to present)...\n")
-        log_file.write(f"   Using streaming mode for low memory usage\n\n")
-
-        # 2020: October onwards
-        for month in range(10, 13):  # Oct, Nov, Dec
-            if ingest_month("stocks_daily", 2020, month, log_file):
-                stocks_daily_success += 1
-            else:
-                stocks_daily_fail += 1
-
-        # 2021-2023: Full years
-        for year in range(2021, 2024):
-            for month in range(1, 13):
-                if ingest_month("stocks_daily", year, month, log_file):
-                    stocks_daily_success += 1
-                else:
-                    stocks_daily_fail += 1
-
-        # 2024-current: Up to current month
-        for year in range(2024, current_year + 1):
-            end_month = 13 if year < current_year else current_month + 1
-            for month in range(1, end_month):
-                if ingest_month("stocks_daily", year, month, log_file):
-                    stocks_daily_success += 1
-                else:
-                    stocks_daily_fail += 1
-
-        print()
-        print(f"Stocks Daily Summary: ✅ {stocks_daily_success} months, ❌ {stocks_daily_fail} failed")
-        print()
-        log_file.write(f"\nStocks Daily Summary: ✅ {stocks_daily_success} months, ❌ {stocks_daily_fail} failed\n\n")
-
-        # Ingest options_daily: 2023-10 to present
-        print("📈 Ingesting options_daily (2023-10 to present)...")
-        print(f"   Using streaming mode for low memory usage")
-        print()
-
-        log_file.write("📈 Ingesting options_daily (2023-10 to present)...\n")
-        log_file.write(f"   Using streaming mode for low memory usage\n\n")
-
-        # 2023: October onwards
-        for month in range(10, 13):
-            if ingest_month("options_daily", 2023, month, log_file):
-                options_daily_success += 1
-            else:
-                options_daily_fail += 1
-
-        # 2024-current: Up to current month
-        for year in range(2024, current_year + 1):
-            end_month = 13 if year < current_year else current_month + 1
-            for month in range(1, end_month):
-                if ingest_month("options_daily", year, month, log_file):
-                    options_daily_success += 1
-                else:
-                    options_daily_fail += 1
-
-        print()
-        print(f"Options Daily Summary: ✅ {options_daily_success} months, ❌ {options_daily_fail} failed")
-        print()
-        log_file.write(f"\nOptions Daily Summary: ✅ {options_daily_success} months, ❌ {options_daily_fail} failed\n\n")
+        # stocks_daily: 2020-10 to present, options_daily: 2023-10 to present
+        jobs = month_jobs("stocks_daily", 2020, 10, today) + month_jobs("options_daily", 2023, 10, today)
+
+        logger.info("📊 Ingesting stocks_daily (2020-10 to present)...")
+        logger.info("📈 Ingesting options_daily (2023-10 to present)...")
+        logger.info(f"   Using streaming mode for low memory usage, {args.max_parallel} months at a time")
+        logger.info("")
+
+        counts = asyncio.run(run_jobs_parallel(jobs, args.max_parallel, args.use_subprocess))
+        stocks_daily_success, stocks_daily_fail = counts["stocks_daily"]
+        options_daily_success, options_daily_fail = counts["options_daily"]
+
+        logger.info("")
+        logger.info(f"Stocks Daily Summary: ✅ {stocks_daily_success} months, ❌ {stocks_daily_fail} failed")
+        logger.info(f"Options Daily Summary: ✅ {options_daily_success} months, ❌ {options_daily_fail} failed")
+        logger.info("")
 
     # Overall summary
-    print("="*80)
-    print("BATCH INGESTION SUMMARY")
-    print("="*80)
-    if not args.minute_only:
-        print(f"Stocks Daily:  ✅ {stocks_daily_success}/{stocks_daily_success+stocks_daily_fail} months")
-        print(f"Options Daily: ✅ {options_daily_success}/{options_daily_success+options_daily_fail} months")
-    print(f"Total: ✅ {stocks_daily_success+options_daily_success} months ingested")
-    print("="*80)
-
-    log_file.write("="*80 + "\n")
-    log_file.write("BATCH INGESTION SUMMARY\n")
-    log_file.write("="*80 + "\n")
+    logger.info("="*80)
+    logger.info("BATCH INGESTION SUMMARY")
+    logger.info("="*80)
     if not args.minute_only:
-        log_file.write(f"Stocks Daily:  ✅ {stocks_daily_success}/{stocks_daily_success+stocks_daily_fail} months\n")
-        log_file.write(f"Options Daily: ✅ {options_daily_success}/{options_daily_success+options_daily_fail} months\n")
-    log_file.write(f"Total: ✅ {stocks_daily_success+options_daily_success} months ingested\n")
-    log_file.write("="*80 + "\n")
+        logger.info(f"Stocks Daily:  ✅ {stocks_daily_success}/{stocks_daily_success+stocks_daily_fail} months")
+        logger.info(f"Options Daily: ✅ {options_daily_success}/{options_daily_success+options_daily_fail} months")
+    logger.info(f"Total: ✅ {stocks_daily_success+options_daily_success} months ingested")
+    logger.info("="*80)
 
-    log_file.close()
+    # Drain queued records to the console and log file
+    log_listener.stop()
 
     return 0 if (stocks_daily_fail == 0 and options_daily_fail == 0) else 1
 
@@ -5,7 +5,10 @@ Phase 4: Ingest Minute Price Data from Landing to Bronze
 Processes stocks_minute and options_minute data in 3-month chunks
 using streaming mode for memory efficiency (24GB systems).
 
-This is a LARGE ingestion (~22GB raw data, several hours).
+This is a LARGE ingestion (~22GB raw data, several hours). Chunks are
+independent and can run several at once (--max-parallel) on one
+in-process IngestionOrchestrator, memory permitting; --use-subprocess
+runs each chunk through the quantmini CLI instead.
 """
 
 import sys
@@ -13,73 +16,154 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import asyncio
+import logging
 import subprocess
 from datetime import date, timedelta, datetime as dt
+from typing import Dict, List, Tuple
 import argparse
 
+from src.core.config_loader import ConfigLoader
+from src.orchestration import IngestionOrchestrator
+from src.utils.script_logging import FILE_ONLY, start_script_logging
+from src.utils.subprocess_stream import run_streaming
 
-def ingest_date_range(data_type: str, start_date: str, end_date: str, log_file):
+logger = logging.getLogger(Path(__file__).stem)
+
+
+async def ingest_date_range(
+    data_type: str,
+    start_date: str,
+    end_date: str,
+    orchestrator: IngestionOrchestrator = None,
+    use_subprocess: bool = False
+):
     """Ingest a date range of minute data using streaming mode"""
-    print(f"[{dt.now().strftime('%H:%M:%S')}] Ingesting {data_type}: {start_date} to {end_date}", flush=True)
-    log_file.write(f"[{dt.now().strftime('%H:%M:%S')}] Ingesting {data_type}: {start_date} to {end_date}\n")
-    log_file.flush()
-
-    cmd = [
-        "quantmini", "data", "ingest",
-        "--data-type", data_type,
-        "--start-date", start_date,
-        "--end-date", end_date,
-        "--mode", "streaming"  # Use streaming mode for low memory
-    ]
+    label = f"{data_type} {start_date} to {end_date}"
+
+    logger.info(f"[{dt.now().strftime('%H:%M:%S')}] Ingesting {data_type}: {start_date} to {end_date}")
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=7200)  # 2 hour timeout
-        if result.returncode == 0:
-            print(f"  ✅ Success: {data_type} {start_date} to {end_date}", flush=True)
-            log_file.write(f"  ✅ Success\n")
+        if use_subprocess:
+            cmd = [
+                "quantmini", "data", "ingest",
+                "--data-type", data_type,
+                "--start-date", start_date,
+                "--end-date", end_date,
+                "--mode", "streaming"  # Use streaming mode for low memory
+            ]
+
+            def forward(stream, line):
+                logger.info(f"    {line.rstrip()}", extra=FILE_ONLY)
+
+            returncode, _, stderr = await asyncio.to_thread(
+                run_streaming, cmd, timeout=7200, on_line=forward  # 2 hour timeout
+            )
+            success, error = returncode == 0, stderr[-200:].strip()
         else:
-            print(f"  ❌ Failed: {result.stderr[:200]}", flush=True)
-            log_file.write(f"  ❌ Failed: {result.stderr[:200]}\n")
-        log_file.flush()
-        return result.returncode == 0
-    except subprocess.TimeoutExpired:
-        print(f"  ⏱️  Timeout: {data_type} {start_date} to {end_date}", flush=True)
-        log_file.write(f"  ⏱️  Timeout\n")
-        log_file.flush()
+            result = await asyncio.wait_for(
+                orchestrator.ingest_date_range(
+                    data_type=data_type,
+                    start_date=start_date,
+                    end_date=end_date,
+                    incremental=True,
+                    use_polars=False  # Streaming mode for low memory
+                ),
+                timeout=7200  # 2 hour timeout
+            )
+            success = result.get('failed', 0) == 0
+            error = f"{result.get('failed', 0)}/{result.get('total_files', 0)} files failed"
+
+        if success:
+            logger.info(f"  ✅ Success: {label}")
+        else:
+            logger.info(f"  ❌ Failed: {label}: {error}")
+        return success
+    except (subprocess.TimeoutExpired, asyncio.TimeoutError, TimeoutError):
+        logger.info(f"  ⏱️  Timeout: {label}")
         return False
     except Exception as e:
-        print(f"  ❌ Error: {str(e)[:200]}", flush=True)
-        log_file.write(f"  ❌ Error: {str(e)[:200]}\n")
-        log_file.flush()
+        logger.info(f"  ❌ Error: {label}: {str(e)[:200]}")
         return False
 
 
+def chunk_jobs(data_type: str, start: date, end: date) -> List[Tuple[str, str, str]]:
+    """(data_type, start_date, end_date) for 3-month (90 day) chunks from start to end"""
+    jobs = []
+    current_start = start
+    while current_start < end:
+        current_end = min(current_start + timedelta(days=90), end)
+        jobs.append((data_type, current_start.strftime('%Y-%m-%d'), current_end.strftime('%Y-%m-%d')))
+        current_start = current_end + timedelta(days=1)
+    return jobs
+
+
+def default_max_parallel() -> int:
+    """
+    Concurrent chunks by default: one
+
+    The orchestrator downloads a whole chunk (90 days of minute files) into
+    memory before ingesting it, so each extra chunk in flight adds that
+    much to peak memory.
+    """
+    return 1
+
+
+async def run_jobs_parallel(
+    jobs: List[Tuple[str, str, str]],
+    max_parallel: int,
+    use_subprocess: bool = False
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Ingest chunks concurrently on one event loop
+
+    One orchestrator (S3 client, metadata manager, imported modules) serves
+    every chunk; the semaphore caps chunks in flight.
+
+    Returns:
+        {data_type: (successful chunks, failed chunks)}
+    """
+    orchestrator = None if use_subprocess else IngestionOrchestrator(config=ConfigLoader())
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def run_one(data_type: str, start_date: str, end_date: str) -> bool:
+        async with semaphore:
+            return await ingest_date_range(data_type, start_date, end_date, orchestrator, use_subprocess)
+
+    results = await asyncio.gather(*(run_one(*job) for job in jobs))
+
+    counts = {data_type: [0, 0] for data_type, _, _ in jobs}
+    for (data_type, _, _), success in zip(jobs, results):
+        counts[data_type][0 if success else 1] += 1
+
+    return {data_type: (success, fail) for data_type, (success, fail) in counts.items()}
+
+
 def main():
-    parser = argparse.ArgumentParser(description='Phase 4: Ingest minute data (streaming mode, 24GB safe)')
+    parser = argparse.ArgumentParser(description='Phase 4: Ingest minute data (streaming mode)')
     parser.add_argument('--log-file', type=str, help='Log file path')
     parser.add_argument('--stocks-only', action='store_true', help='Ingest stocks_minute only')
     parser.add_argument('--options-only', action='store_true', help='Ingest options_minute only')
+    parser.add_argument('--max-parallel', type=int, default=default_max_parallel(),
+                        help='Chunks ingested at once; each holds up to 90 days of files in memory (default: 1)')
+    parser.add_argument('--use-subprocess', action='store_true',
+                        help='Run each chunk through the quantmini CLI in a separate process')
     args = parser.parse_args()
 
-    # Open log file
+    # Console and log file output, written from a listener thread
     if args.log_file:
-        log_file = open(args.log_file, 'w', buffering=1)
+        log_path = Path(args.log_file)
     else:
         from src.utils.paths import get_quantlake_root
         quantlake_root = get_quantlake_root()
         log_path = quantlake_root / "logs" / f"minute_ingestion_{dt.now().strftime('%Y%m%d_%H%M%S')}.log"
-        log_file = open(log_path, 'w', buffering=1)
+    _, log_listener = start_script_logging(logger.name, log_path)
 
-    print("="*80)
-    print("PHASE 4: MINUTE DATA INGESTION - STREAMING MODE")
-    print("="*80)
-    print("⚠️  This will take several hours (~22GB data)")
-    print()
-
-    log_file.write("="*80 + "\n")
-    log_file.write("PHASE 4: MINUTE DATA INGESTION - STREAMING MODE\n")
-    log_file.write("="*80 + "\n")
-    log_file.write("⚠️  This will take several hours (~22GB data)\n\n")
+    logger.info("="*80)
+    logger.info("PHASE 4: MINUTE DATA INGESTION - STREAMING MODE")
+    logger.info("="*80)
+    logger.info("⚠️  This will take several hours (~22GB data)")
+    logger.info("")
 
     # Current date
     today = date.today()
@@ -90,88 +174,42 @@ def main():
     options_success = 0
     options_fail = 0
 
+    # Both data types start from 2020-10-17
+    jobs = []
     if not args.options_only:
-        print("📊 Ingesting stocks_minute (2020-10-17 to present)...")
-        print(f"   Using 3-month chunks with streaming mode")
-        print()
-
-        log_file.write("📊 Ingesting stocks_minute (2020-10-17 to present)...\n")
-        log_file.write(f"   Using 3-month chunks with streaming mode\n\n")
-
-        # Start from 2020-10-17
-        current_start = date(2020, 10, 17)
-
-        while current_start < today:
-            # Process in 3-month chunks (90 days)
-            current_end = min(current_start + timedelta(days=90), today)
-
-            start_str = current_start.strftime('%Y-%m-%d')
-            end_str = current_end.strftime('%Y-%m-%d')
-
-            if ingest_date_range("stocks_minute", start_str, end_str, log_file):
-                stocks_success += 1
-            else:
-                stocks_fail += 1
-
-            current_start = current_end + timedelta(days=1)
-
-        print()
-        print(f"Stocks Minute Summary: ✅ {stocks_success} chunks, ❌ {stocks_fail} failed")
-        print()
-        log_file.write(f"\nStocks Minute Summary: ✅ {stocks_success} chunks, ❌ {stocks_fail} failed\n\n")
-
+        jobs += chunk_jobs("stocks_minute", date(2020, 10, 17), today)
+        logger.info("📊 Ingesting stocks_minute (2020-10-17 to present)...")
     if not args.stocks_only:
-        print("📈 Ingesting options_minute (2020-10-17 to present)...")
-        print(f"   Using 3-month chunks with streaming mode")
-        print()
-
-        log_file.write("📈 Ingesting options_minute (2020-10-17 to present)...\n")
-        log_file.write(f"   Using 3-month chunks with streaming mode\n\n")
-
-        # Start from 2020-10-17
-        current_start = date(2020, 10, 17)
-
-        while current_start < today:
-            # Process in 3-month chunks (90 days)
-            current_end = min(current_start + timedelta(days=90), today)
+        jobs += chunk_jobs("options_minute", date(2020, 10, 17), today)
+        logger.info("📈 Ingesting options_minute (2020-10-17 to present)...")
 
-            start_str = current_start.strftime('%Y-%m-%d')
-            end_str = current_end.strftime('%Y-%m-%d')
+    logger.info(f"   Using 3-month chunks with streaming mode, {args.max_parallel} chunks at a time")
+    logger.info("")
 
-            if ingest_date_range("options_minute", start_str, end_str, log_file):
-                options_success += 1
-            else:
-                options_fail += 1
+    counts = asyncio.run(run_jobs_parallel(jobs, args.max_parallel, args.use_subprocess))
+    stocks_success, stocks_fail = counts.get("stocks_minute", (0, 0))
+    options_success, options_fail = counts.get("options_minute", (0, 0))
 
-            current_start = current_end + timedelta(days=1)
-
-        print()
-        print(f"Options Minute Summary: ✅ {options_success} chunks, ❌ {options_fail} failed")
-        print()
-        log_file.write(f"\nOptions Minute Summary: ✅ {options_success} chunks, ❌ {options_fail} failed\n\n")
-
-    # Overall summary
-    print("="*80)
-    print("PHASE 4 INGESTION SUMMARY")
-    print("="*80)
+    logger.info("")
     if not args.options_only:
-        print(f"Stocks Minute:  ✅ {stocks_success}/{stocks_success+stocks_fail} chunks")
+        logger.info(f"Stocks Minute Summary: ✅ {stocks_success} chunks, ❌ {stocks_fail} failed")
     if not args.stocks_only:
-        print(f"Options Minute: ✅ {options_success}/{options_success+options_fail} chunks")
-    print(f"Total: ✅ {stocks_success+options_success} chunks ingested")
-    print("="*80)
+        logger.info(f"Options Minute Summary: ✅ {options_success} chunks, ❌ {options_fail} failed")
+    logger.info("")
 
-    log_file.write("="*80 + "\n")
-    log_file.write("PHASE 4 INGESTION SUMMARY\n")
-    log_file.write("="*80 + "\n")
+    # Overall summary
+    logger.info("="*80)
+    logger.info("PHASE 4 INGESTION SUMMARY")
+    logger.info("="*80)
     if not args.options_only:
-        log_file.write(f"Stocks Minute:  ✅ {stocks_success}/{stocks_success+stocks_fail} chunks\n")
+        logger.info(f"Stocks Minute:  ✅ {stocks_success}/{stocks_success+stocks_fail} chunks")
     if not args.stocks_only:
-        log_file.write(f"Options Minute: ✅ {options_success}/{options_success+options_fail} chunks\n")
-    log_file.write(f"Total: ✅ {stocks_success+options_success} chunks ingested\n")
-    log_file.write("="*80 + "\n")
+        logger.info(f"Options Minute: ✅ {options_success}/{options_success+options_fail} chunks")
+    logger.info(f"Total: ✅ {stocks_success+options_success} chunks ingested")
+    logger.info("="*80)
 
-    log_file.close()
+    # Drain queued records to the console and log file
+    log_listener.stop()
 
     return 0 if (stocks_fail == 0 and options_fail == 0) else 1
 
@@ -23,15 +23,22 @@ import argparse
 import sys
 import logging
 import gzip
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from io import BytesIO
+from itertools import groupby
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.core.config_loader import ConfigLoader
 from src.ingest.streaming_ingestor import StreamingIngestor
+from src.ingest.base_ingestor import IngestionError
 from src.ingest.polars_ingestor import PolarsIngestor
 from src.storage.parquet_manager import ParquetManager
 from src.storage.metadata_manager import MetadataManager
@@ -46,6 +53,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Landing files read concurrently ahead of the ones being ingested
+READ_AHEAD = 4
+
+# Landing files ingested at once (each holds its data in memory)
+INGEST_WORKERS = 2
+
+# Ingestion results recorded per metadata write
+METADATA_BATCH = 50
+
 
 def get_landing_files(
     landing_root: Path,
@@ -71,27 +87,128 @@ def get_landing_files(
         logger.warning(f"Landing path does not exist: {landing_path}")
         return []
 
-    # Generate date range
-    start = datetime.strptime(start_date, '%Y-%m-%d')
-    end = datetime.strptime(end_date, '%Y-%m-%d')
+    # Normalized bounds; landing file stems compare as YYYY-MM-DD strings
+    start = datetime.strptime(start_date, '%Y-%m-%d').date()
+    end = datetime.strptime(end_date, '%Y-%m-%d').date()
+    first, last = start.isoformat(), end.isoformat()
 
+    # Read each year/month directory once instead of stat-ing every day
     files = []
-    current = start
-    while current <= end:
-        # Check year/month directory
-        year_month_dir = landing_path / current.strftime('%Y') / current.strftime('%m')
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        year_month_dir = landing_path / f"{year:04d}" / f"{month:02d}"
 
-        if year_month_dir.exists():
-            # Look for file matching this date
-            filename = f"{current.strftime('%Y-%m-%d')}.csv.gz"
-            file_path = year_month_dir / filename
+        try:
+            with os.scandir(year_month_dir) as entries:
+                for entry in entries:
+                    file_date = entry.name[:-len('.csv.gz')]
+                    if (
+                        entry.name.endswith('.csv.gz')
+                        and len(file_date) == 10
+                        and first <= file_date <= last
+                    ):
+                        files.append(Path(entry.path))
+        except FileNotFoundError:
+            pass
+
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
 
-            if file_path.exists():
-                files.append(file_path)
+    return sorted(files)
 
-        current += timedelta(days=1)
 
-    return sorted(files)
+def read_landing_file(path: Path) -> bytes:
+    """
+    Read a whole landing file, asking the kernel for aggressive read-ahead
+
+    Landing files are read once, so their pages are dropped from the page
+    cache afterwards rather than evicting data the Parquet writer needs.
+    """
+    with open(path, 'rb') as f:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        data = f.read()
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        return data
+
+
+def advise_landing_files(paths: Iterable[Path], advice: int):
+    """
+    Pass posix_fadvise advice for whole landing files
+
+    No-op where posix_fadvise is unavailable (macOS).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, advice)
+        finally:
+            os.close(fd)
+
+
+def run_ahead(items: Iterable, fn: Callable, depth: int) -> Iterator[Tuple[Any, Future]]:
+    """
+    Apply fn to items on a thread pool, keeping `depth` calls in flight
+
+    Items are pulled lazily, so stages chain: feeding one run_ahead() into
+    another gives a pipeline where each stage holds at most `depth` results.
+
+    Args:
+        items: Inputs
+        fn: Function to apply
+        depth: Calls in flight
+
+    Yields:
+        (item, future of fn(item)), in the order of `items`
+    """
+    with ThreadPoolExecutor(max_workers=depth) as executor:
+        pending = deque()
+        for item in items:
+            pending.append((item, executor.submit(fn, item)))
+            if len(pending) >= depth:
+                yield pending.popleft()
+
+        while pending:
+            yield pending.popleft()
+
+
+def read_ahead(paths: List[Path], depth: int = READ_AHEAD) -> Iterator[Tuple[Path, Future]]:
+    """
+    Read files on a thread pool, keeping `depth` reads in flight
+
+    Reading one file at a time leaves the disk idle while each file is
+    decompressed and ingested, and gives the kernel a queue depth of one.
+    At most `depth` files' compressed bytes are held in memory.
+
+    Args:
+        paths: Files to read
+        depth: Reads in flight
+
+    Yields:
+        (path, future of the file's bytes), in the order of `paths`
+    """
+    return run_ahead(paths, read_landing_file, depth)
+
+
+def create_ingestor(processing_mode: str, data_type: str, bronze_root: Path, config: ConfigLoader):
+    """Ingestor for the system's recommended processing mode"""
+    if processing_mode == 'batch':
+        return PolarsIngestor(
+            data_type=data_type,
+            output_root=bronze_root,
+            config=config.config
+        )
+    return StreamingIngestor(
+        data_type=data_type,
+        output_root=bronze_root,
+        config=config.config
+    )
 
 
 def process_landing_to_bronze(
@@ -99,7 +216,11 @@ def process_landing_to_bronze(
     start_date: str,
     end_date: str,
     config: ConfigLoader,
-    incremental: bool = True
+    incremental: bool = True,
+    read_depth: int = READ_AHEAD,
+    ingest_workers: int = INGEST_WORKERS,
+    metadata_manager: Optional[MetadataManager] = None,
+    profiler: Optional[SystemProfiler] = None
 ):
     """
     Process landing files to bronze layer
@@ -110,6 +231,12 @@ def process_landing_to_bronze(
         end_date: End date (YYYY-MM-DD)
         config: Config loader
         incremental: Skip already processed files
+        read_depth: Landing files read ahead of the ones being ingested
+        ingest_workers: Landing files decompressed and ingested at once
+            (batch mode always ingests one month at a time)
+        metadata_manager: Metadata manager to reuse (default: a new one for
+            the configured metadata path)
+        profiler: System profiler to reuse (default: profile this host)
     """
     logger.info(f"\n{'='*70}")
     logger.info(f"Processing Landing → Bronze: {data_type}")
@@ -130,28 +257,16 @@ def process_landing_to_bronze(
     logger.info(f"Bronze: {bronze_root}")
 
     # Initialize managers
-    metadata_manager = MetadataManager(metadata_root)
+    if metadata_manager is None:
+        metadata_manager = MetadataManager(metadata_root)
 
     # Get processing mode
-    profiler = SystemProfiler()
+    if profiler is None:
+        profiler = SystemProfiler()
     processing_mode = profiler.profile.get('recommended_mode', 'streaming')
 
     logger.info(f"Processing mode: {processing_mode}")
 
-    # Select ingestor based on mode
-    if processing_mode == 'batch':
-        ingestor = PolarsIngestor(
-            data_type=data_type,
-            output_root=bronze_root,
-            config=config.config
-        )
-    else:
-        ingestor = StreamingIngestor(
-            data_type=data_type,
-            output_root=bronze_root,
-            config=config.config
-        )
-
     # Get landing files
     landing_files = get_landing_files(landing_root, data_type, start_date, end_date)
 
@@ -176,85 +291,186 @@ def process_landing_to_bronze(
     files_processed = 0
     total_rows = 0
 
+    # Skip files before the watermark without reading them
+    to_process = []
     for i, landing_file in enumerate(landing_files):
-        try:
-            # Extract date from filename
-            file_date = landing_file.stem.replace('.csv', '')  # YYYY-MM-DD
+        # Extract date from filename
+        file_date = landing_file.stem.replace('.csv', '')  # YYYY-MM-DD
 
-            # Skip if before watermark
-            if incremental and last_watermark and file_date <= last_watermark:
-                logger.debug(f"Skipping {file_date} (before watermark)")
-                continue
+        if incremental and last_watermark and file_date <= last_watermark:
+            logger.debug(f"Skipping {file_date} (before watermark)")
+            continue
 
-            logger.info(f"Processing {i+1}/{len(landing_files)}: {file_date}")
+        to_process.append((i, landing_file))
 
-            # Read and decompress landing file
-            with gzip.open(landing_file, 'rb') as f:
-                csv_data = f.read()
+    positions = {landing_file: i for i, landing_file in to_process}
 
-            # Ingest to bronze
-            result = ingestor.ingest_date(
-                date=file_date,
-                data=BytesIO(csv_data)
-            )
+    # Ingestors keep unsynchronized statistics, so each worker has its own
+    ingestors = threading.local()
 
-            if result and result.get('status') in ['success', 'skipped']:
-                files_processed += 1
-                rows_written = result.get('records', 0)
-                total_rows += rows_written
+    def ingest(item: Tuple[Path, Future]):
+        landing_file, read = item
+        file_date = landing_file.stem.replace('.csv', '')  # YYYY-MM-DD
 
-                # Record ingestion metadata
-                metadata_manager.record_ingestion(
-                    data_type=data_type,
-                    date=file_date,
-                    status=result.get('status'),
-                    statistics={
-                        'records': rows_written,
-                        'file_size_mb': result.get('file_size_mb', 0),
-                        'processing_time_sec': result.get('processing_time_sec', 0),
-                        'reason': result.get('reason', '')
-                    }
-                )
+        logger.info(f"Processing {positions[landing_file]+1}/{len(landing_files)}: {file_date}")
 
-                # Update watermark
-                metadata_manager.set_watermark(
-                    data_type=data_type,
-                    date=file_date
-                )
+        if not hasattr(ingestors, 'ingestor'):
+            ingestors.ingestor = create_ingestor(processing_mode, data_type, bronze_root, config)
 
-                if result.get('status') == 'skipped':
-                    logger.info(f"  ⊙ Skipped {file_date} ({result.get('reason', 'unknown')})")
-                else:
-                    logger.info(f"  ✓ Ingested {rows_written:,} rows to bronze")
-            else:
-                logger.error(f"  ✗ Failed to ingest {file_date}")
+        # Decompress as the ingestor reads, rather than holding the
+        # whole decompressed CSV next to the compressed bytes
+        csv_stream = gzip.GzipFile(fileobj=BytesIO(read.result()))
 
-                # Record failure
-                metadata_manager.record_ingestion(
-                    data_type=data_type,
-                    date=file_date,
-                    status='failed',
-                    statistics={},
-                    error='Ingestion returned non-success status'
-                )
+        return ingestors.ingestor.ingest_date(
+            date=file_date,
+            data=csv_stream
+        )
 
-        except Exception as e:
-            logger.error(f"Error processing {landing_file}: {e}")
+    def ingest_month(group: List[Path]) -> Dict[str, Dict[str, Any]]:
+        files = {landing_file.stem.replace('.csv', ''): landing_file for landing_file in group}
 
-            # Record error
+        logger.info(
+            f"Processing {positions[group[0]]+1}-{positions[group[-1]]+1}/{len(landing_files)}: "
+            f"{min(files)} to {max(files)}"
+        )
+
+        if not hasattr(ingestors, 'ingestor'):
+            ingestors.ingestor = create_ingestor(processing_mode, data_type, bronze_root, config)
+
+        # Polars opens the files itself: start reading the month in the
+        # background, and drop it from the page cache once it is written
+        if hasattr(os, 'posix_fadvise'):
+            advise_landing_files(group, os.POSIX_FADV_WILLNEED)
+
+        try:
+            return ingestors.ingestor.ingest_many(files)
+        except IngestionError as e:
+            # One unreadable file fails the whole scan; retry file by file
+            # so only that file is lost
+            logger.warning(f"Month scan failed, ingesting files one by one: {e}")
+        finally:
+            if hasattr(os, 'posix_fadvise'):
+                advise_landing_files(group, os.POSIX_FADV_DONTNEED)
+
+        results = {}
+        for file_date, landing_file in files.items():
             try:
-                file_date = landing_file.stem.replace('.csv', '')
-                metadata_manager.record_ingestion(
-                    data_type=data_type,
+                results[file_date] = ingestors.ingestor.ingest_date(
                     date=file_date,
-                    status='failed',
-                    statistics={},
-                    error=str(e)
+                    # Polars decompresses gzip input itself
+                    data=BytesIO(read_landing_file(landing_file))
                 )
-            except:
-                pass  # Don't let metadata errors block the pipeline
+            except Exception as e:
+                logger.error(f"Error processing {landing_file}: {e}")
+                results[file_date] = {'date': file_date, 'status': 'error', 'error': str(e)}
+        return results
+
+    def ingested_by_month() -> Iterator[Tuple[Path, Future]]:
+        # One Polars scan per year/month directory, reported per file
+        groups = [list(group) for _, group in groupby(to_process_files, key=lambda f: f.parent)]
+
+        # A month scan holds the whole month in memory (see ingest_many),
+        # so months are ingested one at a time whatever ingest_workers is
+        for group, ingested in run_ahead(groups, ingest_month, 1):
+            for landing_file in group:
+                result = Future()
+                try:
+                    result.set_result(ingested.result()[landing_file.stem.replace('.csv', '')])
+                except Exception as e:
+                    result.set_exception(e)
+                yield landing_file, result
+
+    # Read, ingest and record run as overlapping stages: files are read
+    # ahead, ingested on worker threads, and recorded here in date order
+    # so the watermark only advances past finished files
+    to_process_files = [f for _, f in to_process]
 
-            continue
+    if processing_mode == 'batch':
+        # Polars reads the files itself, a month per multi-file scan
+        ingested_files = ingested_by_month()
+    else:
+        reads = read_ahead(to_process_files, read_depth)
+        ingested_files = (
+            (landing_file, ingested)
+            for (landing_file, _), ingested in run_ahead(reads, ingest, ingest_workers)
+        )
+
+    # Metadata is written METADATA_BATCH results at a time, with the
+    # watermark advanced once per batch
+    pending = []
+    pending_watermark = None
+
+    def flush_metadata():
+        nonlocal pending, pending_watermark
+        batch, watermark = pending, pending_watermark
+        pending, pending_watermark = [], None
+
+        if not batch and not watermark:
+            return
+        try:
+            metadata_manager.record_ingestion_batch(data_type, batch, watermark=watermark)
+        except Exception as e:
+            logger.error(f"Failed to record metadata for {len(batch)} files: {e}")
+
+    try:
+        for landing_file, ingested in ingested_files:
+            try:
+                file_date = landing_file.stem.replace('.csv', '')  # YYYY-MM-DD
+
+                # Ingest to bronze (on the worker pool)
+                result = ingested.result()
+
+                if result and result.get('status') in ['success', 'skipped']:
+                    files_processed += 1
+                    rows_written = result.get('records', 0)
+                    total_rows += rows_written
+
+                    # Record ingestion metadata
+                    pending.append({
+                        'date': file_date,
+                        'status': result.get('status'),
+                        'statistics': {
+                            'records': rows_written,
+                            'file_size_mb': result.get('file_size_mb', 0),
+                            'processing_time_sec': result.get('processing_time_sec', 0),
+                            'reason': result.get('reason', '')
+                        }
+                    })
+
+                    # Update watermark
+                    pending_watermark = file_date
+
+                    if result.get('status') == 'skipped':
+                        logger.info(f"  ⊙ Skipped {file_date} ({result.get('reason', 'unknown')})")
+                    else:
+                        logger.info(f"  ✓ Ingested {rows_written:,} rows to bronze")
+                else:
+                    logger.error(f"  ✗ Failed to ingest {file_date}")
+
+                    # Record failure
+                    pending.append({
+                        'date': file_date,
+                        'status': 'failed',
+                        'statistics': {},
+                        'error': 'Ingestion returned non-success status'
+                    })
+
+            except Exception as e:
+                logger.error(f"Error processing {landing_file}: {e}")
+
+                # Record error
+                pending.append({
+                    'date': landing_file.stem.replace('.csv', ''),
+                    'status': 'failed',
+                    'statistics': {},
+                    'error': str(e)
+                })
+
+            if len(pending) >= METADATA_BATCH:
+                flush_metadata()
+    finally:
+        # Keep the progress made so far, even if the run is interrupted
+        flush_metadata()
 
     # Summary
     summary = {
@@ -308,6 +524,14 @@ def main():
         help='Reprocess all files (ignore watermarks)'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=INGEST_WORKERS,
+        help=f'Landing files ingested at once (default: {INGEST_WORKERS}; '
+             'batch mode ingests one month at a time)'
+    )
+
     args = parser.parse_args()
 
     # Load config
@@ -319,6 +543,10 @@ def main():
     else:
         data_types = [args.data_type]
 
+    # Profile the host and open metadata once for every data type
+    metadata_manager = MetadataManager(config.get_metadata_path())
+    profiler = SystemProfiler()
+
     # Process each data type
     results = {}
     for data_type in data_types:
@@ -328,7 +556,10 @@ def main():
                 args.start_date,
                 args.end_date,
                 config,
-                incremental=not args.no_incremental
+                incremental=not args.no_incremental,
+                ingest_workers=args.workers,
+                metadata_manager=metadata_manager,
+                profiler=profiler
             )
             results[data_type] = result
         except Exception as e:
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Build File Index for the Corporate Actions Silver Layer
+
+Crawls the ticker/event_type partitions once and writes a small
+_index.parquet at the root of the silver layer. Queries can then build
+their exact file list from the index instead of globbing thousands of
+partition directories, and prune files on event_date min/max.
+
+Index columns:
+    ticker, event_type, file_path (relative to the silver root),
+    n_rows, event_date_min, event_date_max
+
+Only parquet footers are read, never the data pages.
+
+Usage:
+    python scripts/transformation/build_silver_index.py
+    python scripts/transformation/build_silver_index.py --silver-dir /path/to/silver/corporate_actions
+"""
+
+import sys
+from pathlib import Path
+import logging
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import polars as pl
+import pyarrow.parquet as pq
+from src.utils.paths import get_quantlake_root
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = '_index.parquet'
+
+
+def _event_date_range(metadata: pq.FileMetaData):
+    """Return (min, max) event_date from row group statistics"""
+    date_min, date_max = None, None
+
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            if column.path_in_schema != 'event_date':
+                continue
+
+            stats = column.statistics
+            if stats is None or not stats.has_min_max:
+                # Without statistics the file can't be pruned on date
+                return None, None
+
+            date_min = stats.min if date_min is None else min(date_min, stats.min)
+            date_max = stats.max if date_max is None else max(date_max, stats.max)
+
+    return date_min, date_max
+
+
+def build_silver_index(silver_path: Path) -> pl.DataFrame:
+    """
+    Write _index.parquet listing every partition file in the silver layer
+
+    Args:
+        silver_path: Root path of the corporate actions silver layer
+
+    Returns:
+        The index DataFrame that was written
+    """
+    rows = []
+
+    for parquet_file in sorted(silver_path.glob('ticker=*/event_type=*/*.parquet')):
+        metadata = pq.read_metadata(parquet_file)
+        date_min, date_max = _event_date_range(metadata)
+
+        rows.append({
+            'ticker': parquet_file.parent.parent.name.split('=', 1)[1],
+            'event_type': parquet_file.parent.name.split('=', 1)[1],
+            'file_path': str(parquet_file.relative_to(silver_path)),
+            'n_rows': metadata.num_rows,
+            'event_date_min': date_min,
+            'event_date_max': date_max,
+        })
+
+    index_df = pl.DataFrame(rows, schema={
+        'ticker': pl.String,
+        'event_type': pl.String,
+        'file_path': pl.String,
+        'n_rows': pl.Int64,
+        'event_date_min': pl.Date,
+        'event_date_max': pl.Date,
+    })
+
+    index_df.write_parquet(silver_path / INDEX_FILE, compression='zstd')
+
+    return index_df
+
+
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Build the file index for the corporate actions silver layer',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        '--silver-dir',
+        type=Path,
+        help='Silver layer path (default: $QUANTLAKE_ROOT/silver/corporate_actions)'
+    )
+
+    args = parser.parse_args()
+
+    silver_path = args.silver_dir or get_quantlake_root() / 'silver' / 'corporate_actions'
+
+    if not silver_path.exists():
+        logger.error(f"Silver path not found: {silver_path}")
+        return 1
+
+    logger.info(f"Indexing {silver_path}...")
+
+    index_df = build_silver_index(silver_path)
+
+    logger.info(f"✓ Wrote {silver_path / INDEX_FILE}")
+    logger.info(f"  Files: {len(index_df):,}")
+    logger.info(f"  Tickers: {index_df['ticker'].n_unique():,}")
+    logger.info(f"  Total records: {index_df['n_rows'].sum():,}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
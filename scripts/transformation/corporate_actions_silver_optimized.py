@@ -36,6 +36,7 @@ import polars as pl
 from src.utils.paths import get_quantlake_root
 from src.storage.metadata_manager import MetadataManager
 from src.core.config_loader import ConfigLoader
+from scripts.transformation.build_silver_index import build_silver_index, INDEX_FILE
 
 logging.basicConfig(
     level=logging.INFO,
@@ -599,6 +600,12 @@ def main():
     logger.info(f"  Optimization: Sorted by event_date DESC, no dictionary encoding")
     logger.info("")
 
+    # Queries resolve partitions from the index, so it must be rebuilt
+    # whenever partitions are (re)written
+    index_df = build_silver_index(silver_path)
+    logger.info(f"✓ Rebuilt {silver_path / INDEX_FILE} ({len(index_df):,} files)")
+    logger.info("")
+
     # Record metadata for silver layer
     try:
         config = ConfigLoader()
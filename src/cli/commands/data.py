@@ -6,7 +6,9 @@ from pathlib import Path
 from datetime import datetime, timedelta
 
 from src.core import ConfigLoader
-from src.download import AsyncS3Downloader, S3Catalog
+from src.core.exceptions import ConfigurationError
+from src.download import S3Catalog
+from src.download.flat_files import download_flat_files, get_s3_credentials
 from src.ingest import PolarsIngestor, StreamingIngestor
 from src.features import FeatureEngineer
 from src.transform import QlibBinaryWriter
@@ -63,24 +65,19 @@ def data():
 @click.option('--start-date', '-s', required=True, help='Start date (YYYY-MM-DD)')
 @click.option('--end-date', '-e', required=True, help='End date (YYYY-MM-DD)')
 @click.option('--output', '-o', type=click.Path(), help='Output directory')
-def download(data_type, start_date, end_date, output):
+@click.option('--force', '-f', is_flag=True, help='Re-download files already in landing')
+def download(data_type, start_date, end_date, output, force):
     """Download data from Polygon.io S3."""
 
     # Validate date range and show calendar info
     validate_date_range(data_type, start_date, end_date)
 
-    config = ConfigLoader()
-    polygon_creds = config.get_credentials('polygon')
-
-    if not polygon_creds or 's3' not in polygon_creds:
-        click.echo("❌ Error: Polygon S3 credentials not found. Check config/credentials.yaml", err=True)
+    try:
+        credentials = get_s3_credentials()
+    except ConfigurationError as e:
+        click.echo(f"❌ Error: {e}", err=True)
         return
 
-    credentials = {
-        'access_key_id': polygon_creds['s3']['access_key_id'],
-        'secret_access_key': polygon_creds['s3']['secret_access_key'],
-    }
-
     catalog = S3Catalog()
     # Use configured landing path if no output specified
     if output:
@@ -93,35 +90,20 @@ def download(data_type, start_date, end_date, output):
 
     click.echo(f"📥 Downloading {data_type} from {start_date} to {end_date}...")
 
-    async def download_data():
-        downloader = AsyncS3Downloader(credentials)
-        keys = catalog.get_date_range_keys(data_type, start_date, end_date)
-
-        click.echo(f"   Found {len(keys)} files to download")
+    keys = catalog.get_date_range_keys(data_type, start_date, end_date)
+    click.echo(f"   Found {len(keys)} files to download")
 
-        with click.progressbar(keys, label='Downloading') as bar:
-            for key in bar:
-                try:
-                    # Extract date from filename
-                    date = key.split('/')[-1].replace('.csv.gz', '')
+    with click.progressbar(length=len(keys), label='Downloading') as bar:
+        result = asyncio.run(download_flat_files(
+            data_type, keys, output_dir, credentials,
+            on_file=lambda key: bar.update(1), force=force
+        ))
 
-                    # Parse date for partitioning: YYYY-MM-DD
-                    year, month, day = date.split('-')
-
-                    # Create partitioned path: landing/{data_type}/year={YYYY}/month={MM}/{YYYY-MM-DD}.csv.gz
-                    partition_dir = output_dir / data_type / f"year={year}" / f"month={month}"
-                    partition_dir.mkdir(parents=True, exist_ok=True)
-
-                    output_file = partition_dir / f"{date}.csv.gz"
-                    await downloader.download_to_file('flatfiles', key, output_file, decompress=False)
-                except Exception as e:
-                    click.echo(f"\n❌ Failed to download {key}: {e}", err=True)
-        
-        stats = downloader.get_statistics()
-        click.echo(f"\n✅ Downloaded {stats['download_count']} files")
-        click.echo(f"   Success rate: {stats['success_rate']:.1%}")
-    
-    asyncio.run(download_data())
+    click.echo(f"\n✅ Downloaded {result['downloaded']} files")
+    if result['skipped']:
+        click.echo(f"   ⏭️  Skipped: {result['skipped']} files already in landing")
+    if result['failed']:
+        click.echo(f"   ❌ Failed: {result['failed']} files", err=True)
 
 
 @data.command()
@@ -8,13 +8,38 @@ Based on: pipeline_design/mac-optimized-pipeline.md
 """
 
 import os
+import copy
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import yaml
 import logging
 
 logger = logging.getLogger(__name__)
 
+# C-accelerated loader when libyaml is available
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed config files keyed by path, invalidated when the file's mtime changes
+_yaml_cache: Dict[Path, Tuple[float, Any]] = {}
+
+
+def _load_yaml(path: Path) -> Any:
+    """
+    Parse a YAML config file, reusing the cached result while it is unchanged
+
+    Returns a copy, so callers are free to modify the loaded config.
+    """
+    path = Path(path).resolve()
+    mtime = path.stat().st_mtime
+
+    cached = _yaml_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path) as f:
+            cached = (mtime, yaml.load(f, Loader=_YAML_LOADER))
+        _yaml_cache[path] = cached
+
+    return copy.deepcopy(cached[1])
+
 
 class ConfigLoader:
     """
@@ -104,63 +129,59 @@ class ConfigLoader:
         # Load paths configuration FIRST (highest priority for paths)
         paths_config_path = self.config_dir / 'paths.yaml'
         if paths_config_path.exists():
-            with open(paths_config_path) as f:
-                paths_config = yaml.safe_load(f)
-
-                # Determine active environment
-                active_env = self.environment or paths_config.get('active_environment', 'production')
-
-                # Resolve environment aliases
-                env_aliases = paths_config.get('environments', {})
-                active_env = env_aliases.get(active_env, active_env)
-
-                # Get environment-specific paths
-                if active_env in paths_config:
-                    env_paths = paths_config[active_env]
-                    config.update(env_paths)
-                    logger.info(f"Loaded {active_env} environment paths from {paths_config_path}")
-                else:
-                    logger.warning(f"Environment '{active_env}' not found in paths.yaml")
+            paths_config = _load_yaml(paths_config_path)
+
+            # Determine active environment
+            active_env = self.environment or paths_config.get('active_environment', 'production')
+
+            # Resolve environment aliases
+            env_aliases = paths_config.get('environments', {})
+            active_env = env_aliases.get(active_env, active_env)
+
+            # Get environment-specific paths
+            if active_env in paths_config:
+                env_paths = paths_config[active_env]
+                config.update(env_paths)
+                logger.info(f"Loaded {active_env} environment paths from {paths_config_path}")
+            else:
+                logger.warning(f"Environment '{active_env}' not found in paths.yaml")
         else:
             logger.warning(f"Paths config not found at {paths_config_path}")
 
         # Load user config (lower priority than paths.yaml)
         pipeline_config_path = self.config_dir / 'pipeline_config.yaml'
         if pipeline_config_path.exists():
-            with open(pipeline_config_path) as f:
-                user_config = yaml.safe_load(f)
-                # Merge but don't override paths from paths.yaml
-                for key, value in user_config.items():
-                    if key not in ['data_lake_root', 'bronze_path', 'silver_path', 'gold_path', 'metadata_path', 'logs_path']:
-                        if key in config and isinstance(config[key], dict) and isinstance(value, dict):
-                            config[key] = self._merge_dicts(config[key], value)
-                        else:
-                            config[key] = value
-                logger.info(f"Loaded pipeline config from {pipeline_config_path}")
+            user_config = _load_yaml(pipeline_config_path)
+            # Merge but don't override paths from paths.yaml
+            for key, value in user_config.items():
+                if key not in ['data_lake_root', 'bronze_path', 'silver_path', 'gold_path', 'metadata_path', 'logs_path']:
+                    if key in config and isinstance(config[key], dict) and isinstance(value, dict):
+                        config[key] = self._merge_dicts(config[key], value)
+                    else:
+                        config[key] = value
+            logger.info(f"Loaded pipeline config from {pipeline_config_path}")
         else:
             logger.warning(f"Pipeline config not found at {pipeline_config_path}")
 
         # Load system profile (higher priority - overrides pipeline_config)
         system_profile_path = self.config_dir / 'system_profile.yaml'
         if system_profile_path.exists():
-            with open(system_profile_path) as f:
-                system_profile = yaml.safe_load(f)
-                config['system_profile'] = system_profile
-                # Override data_root from system_profile if present
-                if 'data_root' in system_profile:
-                    config['data_root'] = system_profile['data_root']
-                    logger.info(f"Using data_root from system_profile: {system_profile['data_root']}")
-                logger.info(f"Loaded system profile from {system_profile_path}")
+            system_profile = _load_yaml(system_profile_path)
+            config['system_profile'] = system_profile
+            # Override data_root from system_profile if present
+            if 'data_root' in system_profile:
+                config['data_root'] = system_profile['data_root']
+                logger.info(f"Using data_root from system_profile: {system_profile['data_root']}")
+            logger.info(f"Loaded system profile from {system_profile_path}")
         else:
             logger.warning(f"System profile not found at {system_profile_path}")
 
         # Load credentials
         credentials_path = self.config_dir / 'credentials.yaml'
         if credentials_path.exists():
-            with open(credentials_path) as f:
-                credentials = yaml.safe_load(f)
-                config['credentials'] = credentials
-                logger.info(f"Loaded credentials from {credentials_path}")
+            credentials = _load_yaml(credentials_path)
+            config['credentials'] = credentials
+            logger.info(f"Loaded credentials from {credentials_path}")
         else:
             logger.warning(f"Credentials not found at {credentials_path}")
 
@@ -381,17 +402,15 @@ class ConfigLoader:
         """
         paths_config_path = self.config_dir / 'paths.yaml'
         if paths_config_path.exists():
-            with open(paths_config_path) as f:
-                paths_config = yaml.safe_load(f)
-                active_env = self.environment or paths_config.get('active_environment', 'production')
-                env_aliases = paths_config.get('environments', {})
-                return env_aliases.get(active_env, active_env)
+            paths_config = _load_yaml(paths_config_path)
+            active_env = self.environment or paths_config.get('active_environment', 'production')
+            env_aliases = paths_config.get('environments', {})
+            return env_aliases.get(active_env, active_env)
         return self.environment or 'production'
 
     @staticmethod
     def _deep_copy(d: Dict) -> Dict:
         """Deep copy a dictionary"""
-        import copy
         return copy.deepcopy(d)
 
     @staticmethod
@@ -1,25 +1,68 @@
-"""Data download utilities"""
-
-from .async_downloader import AsyncS3Downloader
-from .s3_catalog import S3Catalog
-from .sync_downloader import SyncS3Downloader
-from .delisted_stocks import DelistedStocksDownloader
-from .polygon_rest_client import PolygonRESTClient
-from .reference_data import ReferenceDataDownloader
-from .corporate_actions import CorporateActionsDownloader
-from .fundamentals import FundamentalsDownloader
-from .financial_ratios_downloader import FinancialRatiosDownloader
-from .economy import EconomyDataDownloader
-from .bars import AggregatesDownloader
-from .snapshots import SnapshotsDownloader
-from .market_status import MarketStatusDownloader
-from .indicators import TechnicalIndicatorsDownloader
-from .options import OptionsDownloader
-from .trades_quotes import TradesQuotesDownloader
-from .indices import IndicesDownloader
-from .news import NewsDownloader
-from .forex import ForexDownloader
-from .crypto import CryptoDownloader
+"""Data download utilities
+
+Downloaders are imported lazily on first attribute access, so scripts that
+only need the REST downloaders don't pay for the S3 stack (aioboto3, pandas)
+at startup.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+_LAZY_IMPORTS = {
+    'AsyncS3Downloader': '.async_downloader',
+    'S3Catalog': '.s3_catalog',
+    'SyncS3Downloader': '.sync_downloader',
+    'DelistedStocksDownloader': '.delisted_stocks',
+    'PolygonRESTClient': '.polygon_rest_client',
+    'ReferenceDataDownloader': '.reference_data',
+    'CorporateActionsDownloader': '.corporate_actions',
+    'FundamentalsDownloader': '.fundamentals',
+    'FinancialRatiosDownloader': '.financial_ratios_downloader',
+    'EconomyDataDownloader': '.economy',
+    'AggregatesDownloader': '.bars',
+    'SnapshotsDownloader': '.snapshots',
+    'MarketStatusDownloader': '.market_status',
+    'TechnicalIndicatorsDownloader': '.indicators',
+    'OptionsDownloader': '.options',
+    'TradesQuotesDownloader': '.trades_quotes',
+    'IndicesDownloader': '.indices',
+    'NewsDownloader': '.news',
+    'ForexDownloader': '.forex',
+    'CryptoDownloader': '.crypto',
+}
+
+if TYPE_CHECKING:
+    from .async_downloader import AsyncS3Downloader
+    from .s3_catalog import S3Catalog
+    from .sync_downloader import SyncS3Downloader
+    from .delisted_stocks import DelistedStocksDownloader
+    from .polygon_rest_client import PolygonRESTClient
+    from .reference_data import ReferenceDataDownloader
+    from .corporate_actions import CorporateActionsDownloader
+    from .fundamentals import FundamentalsDownloader
+    from .financial_ratios_downloader import FinancialRatiosDownloader
+    from .economy import EconomyDataDownloader
+    from .bars import AggregatesDownloader
+    from .snapshots import SnapshotsDownloader
+    from .market_status import MarketStatusDownloader
+    from .indicators import TechnicalIndicatorsDownloader
+    from .options import OptionsDownloader
+    from .trades_quotes import TradesQuotesDownloader
+    from .indices import IndicesDownloader
+    from .news import NewsDownloader
+    from .forex import ForexDownloader
+    from .crypto import CryptoDownloader
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'AsyncS3Downloader',
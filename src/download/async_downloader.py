@@ -12,7 +12,9 @@ from botocore.config import Config
 from botocore.exceptions import ClientError
 import aiofiles
 import gzip
+import os
 import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
 from io import BytesIO
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -24,6 +26,26 @@ from ..core.exceptions import S3DownloadError
 logger = logging.getLogger(__name__)
 
 
+def drop_page_cache(path: Path):
+    """
+    Write a file back to disk and evict it from the page cache
+
+    Landing files are written once and not read again until ingestion, so
+    caching them only pushes hot data out of memory. No-op where
+    posix_fadvise is unavailable (macOS).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Dirty pages can't be dropped; write them back first
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
 class AsyncS3Downloader:
     """
     High-performance async S3 downloader
@@ -34,6 +56,9 @@ class AsyncS3Downloader:
     - Exponential backoff retry
     - Progress tracking
     - 3-5x faster than sync downloader
+
+    Used as an async context manager, one S3 client (and its connection
+    pool) serves every download; otherwise each call opens its own client.
     """
 
     def __init__(
@@ -43,7 +68,8 @@ class AsyncS3Downloader:
         max_retries: int = 5,
         timeout: int = 60,
         max_pool_connections: int = 50,
-        max_concurrent: int = 8
+        max_concurrent: int = 8,
+        drop_page_cache: bool = False
     ):
         """
         Initialize async S3 downloader
@@ -55,12 +81,15 @@ class AsyncS3Downloader:
             timeout: Request timeout in seconds
             max_pool_connections: Max connections in pool
             max_concurrent: Max concurrent downloads
+            drop_page_cache: Evict files saved by download_to_file() from
+                the page cache
         """
         self.credentials = credentials
         self.endpoint_url = endpoint_url
         self.max_retries = max_retries
         self.timeout = timeout
         self.max_concurrent = max_concurrent
+        self.drop_page_cache = drop_page_cache
 
         # Configure aioboto3 client
         self.config = Config(
@@ -82,11 +111,53 @@ class AsyncS3Downloader:
         # Semaphore for limiting concurrency
         self.semaphore = asyncio.Semaphore(max_concurrent)
 
+        # Shared S3 client, open between __aenter__ and close()
+        self._s3 = None
+        self._exit_stack = None
+
         logger.info(
             f"AsyncS3Downloader initialized "
             f"(endpoint: {endpoint_url}, max_concurrent: {max_concurrent})"
         )
 
+    async def __aenter__(self):
+        """Open one S3 client shared by all downloads until close()"""
+        self._exit_stack = AsyncExitStack()
+        self._s3 = await self._exit_stack.enter_async_context(self._new_client())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Close the shared S3 client"""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._exit_stack = None
+        self._s3 = None
+
+    def _new_client(self):
+        """Create an S3 client context manager"""
+        session = aioboto3.Session(
+            aws_access_key_id=self.credentials['access_key_id'],
+            aws_secret_access_key=self.credentials['secret_access_key'],
+        )
+        return session.client(
+            's3',
+            endpoint_url=self.endpoint_url,
+            config=self.config
+        )
+
+    @asynccontextmanager
+    async def _client(self):
+        """The shared S3 client if open, otherwise a client for this call"""
+        if self._s3 is not None:
+            yield self._s3
+            return
+
+        async with self._new_client() as s3:
+            yield s3
+
     async def download_one(
         self,
         bucket: str,
@@ -114,17 +185,7 @@ class AsyncS3Downloader:
                 try:
                     logger.debug(f"Downloading s3://{bucket}/{key} (attempt {attempt})")
 
-                    # Create session and client
-                    session = aioboto3.Session(
-                        aws_access_key_id=self.credentials['access_key_id'],
-                        aws_secret_access_key=self.credentials['secret_access_key'],
-                    )
-
-                    async with session.client(
-                        's3',
-                        endpoint_url=self.endpoint_url,
-                        config=self.config
-                    ) as s3:
+                    async with self._client() as s3:
                         # Download from S3
                         response = await s3.get_object(Bucket=bucket, Key=key)
 
@@ -244,6 +305,10 @@ class AsyncS3Downloader:
         """
         Download file from S3 and save to disk (async)
 
+        The file is written to a .part sibling and renamed into place once
+        complete, so an interrupted download never leaves a truncated file
+        at local_path.
+
         Args:
             bucket: S3 bucket name
             key: S3 object key
@@ -255,9 +320,18 @@ class AsyncS3Downloader:
         # Create parent directory
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to file (async)
-        async with aiofiles.open(local_path, 'wb') as f:
-            await f.write(content.getvalue())
+        # Write to a temporary file (async), then rename atomically
+        part_path = local_path.with_name(local_path.name + '.part')
+        try:
+            async with aiofiles.open(part_path, 'wb') as f:
+                await f.write(content.getvalue())
+            os.replace(part_path, local_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+        if self.drop_page_cache:
+            await asyncio.to_thread(drop_page_cache, local_path)
 
         logger.info(f"Saved to {local_path}")
 
@@ -279,16 +353,7 @@ class AsyncS3Downloader:
             List of object keys
         """
         try:
-            session = aioboto3.Session(
-                aws_access_key_id=self.credentials['access_key_id'],
-                aws_secret_access_key=self.credentials['secret_access_key'],
-            )
-
-            async with session.client(
-                's3',
-                endpoint_url=self.endpoint_url,
-                config=self.config
-            ) as s3:
+            async with self._client() as s3:
                 response = await s3.list_objects_v2(
                     Bucket=bucket,
                     Prefix=prefix,
@@ -0,0 +1,435 @@
+"""
+Flat File Downloads - Polygon S3 flat files to the landing layer
+
+Library form of `quantmini data download`, so batch scripts can download
+date ranges in-process instead of starting the CLI once per chunk.
+
+Files are saved to:
+  landing/{data_type}/year={YYYY}/month={MM}/{YYYY-MM-DD}.csv.gz
+
+Set QUANTMINI_FADV_DONTNEED=1 to keep landing files out of the page cache
+(also for `quantmini data download` run as a subprocess).
+
+Batch scripts split long ranges into chunks (date_chunks) and download
+each with download_chunk / download_chunks, which retry with backoff and
+record outcomes in a ChunkCheckpoint so an interrupted run can resume.
+"""
+
+import asyncio
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+from .async_downloader import AsyncS3Downloader
+from .s3_catalog import S3Catalog
+from ..core.config_loader import ConfigLoader
+from ..core.exceptions import ConfigurationError
+from ..utils.chunk_checkpoint import ChunkCheckpoint, range_key
+from ..utils.script_logging import FILE_ONLY
+from ..utils.subprocess_stream import run_streaming
+
+logger = logging.getLogger(__name__)
+
+# A chunk is abandoned after this many seconds without progress (a finished
+# file, or any CLI output with use_subprocess), however long it has run
+CHUNK_IDLE_TIMEOUT = 600
+
+# Attempts per chunk before it counts as failed
+CHUNK_ATTEMPTS = 5
+
+
+def get_s3_credentials() -> Dict[str, str]:
+    """
+    Load Polygon S3 credentials from config/credentials.yaml
+
+    Raises:
+        ConfigurationError: If the credentials are missing
+    """
+    polygon_creds = ConfigLoader().get_credentials('polygon')
+
+    if not polygon_creds or 's3' not in polygon_creds:
+        raise ConfigurationError("Polygon S3 credentials not found. Check config/credentials.yaml")
+
+    return {
+        'access_key_id': polygon_creds['s3']['access_key_id'],
+        'secret_access_key': polygon_creds['s3']['secret_access_key'],
+    }
+
+
+def landing_path(output_dir: Path, data_type: str, key: str) -> Path:
+    """
+    Landing file for an S3 key
+
+    landing/{data_type}/year={YYYY}/month={MM}/{YYYY-MM-DD}.csv.gz
+    """
+    # Extract date from filename
+    date = key.split('/')[-1].replace('.csv.gz', '')
+
+    # Parse date for partitioning: YYYY-MM-DD
+    year, month, day = date.split('-')
+
+    return Path(output_dir) / data_type / f"year={year}" / f"month={month}" / f"{date}.csv.gz"
+
+
+def last_published_date(today: Optional[date] = None) -> date:
+    """
+    Latest date a flat file may exist for
+
+    Polygon publishes a day's files after that session ends, so ranges
+    that reach today or later would only request missing keys.
+    """
+    return (today or date.today()) - timedelta(days=1)
+
+
+def is_downloaded(
+    data_type: str,
+    start_date: str,
+    end_date: str,
+    output_dir: Optional[Path] = None
+) -> bool:
+    """
+    Check that every landing file of a date range exists and is non-empty
+
+    Args:
+        data_type: Data type ('stocks_daily', 'stocks_minute', 'options_daily', 'options_minute')
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        output_dir: Landing directory (default: $QUANTLAKE_ROOT/landing)
+    """
+    if output_dir is None:
+        from ..utils.paths import get_quantlake_root
+        output_dir = get_quantlake_root() / 'landing'
+
+    for key in S3Catalog().get_date_range_keys(data_type, start_date, end_date):
+        path = landing_path(output_dir, data_type, key)
+        if not path.exists() or path.stat().st_size == 0:
+            return False
+
+    return True
+
+
+async def download_flat_files(
+    data_type: str,
+    keys: List[str],
+    output_dir: Path,
+    credentials: Dict[str, str],
+    on_file: Optional[Callable[[str], None]] = None,
+    drop_page_cache: Optional[bool] = None,
+    force: bool = False
+) -> Dict[str, int]:
+    """
+    Download flat files into the partitioned landing layout
+
+    Keys whose landing file already exists and is non-empty are skipped,
+    so a retried range only fetches what is still missing. Files are
+    only renamed into place once fully written (see
+    AsyncS3Downloader.download_to_file), so an existing file is complete.
+
+    Args:
+        data_type: Data type ('stocks_daily', 'stocks_minute', 'options_daily', 'options_minute')
+        keys: S3 keys to download (see S3Catalog.get_date_range_keys)
+        output_dir: Landing directory
+        credentials: Dict with 'access_key_id' and 'secret_access_key'
+        on_file: Called with each key once it has been processed
+        drop_page_cache: Evict saved files from the page cache
+            (default: QUANTMINI_FADV_DONTNEED=1)
+        force: Re-download files that already exist
+
+    Returns:
+        Dictionary with 'files', 'downloaded', 'skipped' and 'failed' counts
+    """
+    if drop_page_cache is None:
+        drop_page_cache = os.environ.get('QUANTMINI_FADV_DONTNEED') == '1'
+
+    failed = 0
+    skipped = 0
+
+    # One S3 client and connection pool for every file
+    async with AsyncS3Downloader(credentials, drop_page_cache=drop_page_cache) as downloader:
+        for key in keys:
+            try:
+                output_file = landing_path(output_dir, data_type, key)
+
+                # Saved by an earlier attempt (same check as is_downloaded)
+                if not force and output_file.exists() and output_file.stat().st_size > 0:
+                    skipped += 1
+                    if on_file:
+                        on_file(key)
+                    continue
+
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+
+                await downloader.download_to_file('flatfiles', key, output_file, decompress=False)
+            except Exception as e:
+                logger.error(f"Failed to download {key}: {e}")
+                failed += 1
+
+            if on_file:
+                on_file(key)
+
+    return {
+        'files': len(keys),
+        'downloaded': len(keys) - failed - skipped,
+        'skipped': skipped,
+        'failed': failed,
+    }
+
+
+async def _download_with_watchdog(
+    data_type: str,
+    keys: List[str],
+    output_dir: Path,
+    credentials: Dict[str, str],
+    idle_timeout: float,
+    drop_page_cache: Optional[bool] = None
+) -> Dict[str, int]:
+    """download_flat_files(), cancelled once no file has finished for `idle_timeout` seconds"""
+    last_progress = time.monotonic()
+
+    def on_file(key: str):
+        nonlocal last_progress
+        last_progress = time.monotonic()
+
+    task = asyncio.create_task(
+        download_flat_files(
+            data_type, keys, output_dir, credentials,
+            on_file=on_file, drop_page_cache=drop_page_cache
+        )
+    )
+
+    while not task.done():
+        await asyncio.wait({task}, timeout=min(idle_timeout, 5.0))
+        if not task.done() and time.monotonic() - last_progress >= idle_timeout:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            raise TimeoutError(f"No {data_type} file finished in {idle_timeout:.0f}s")
+
+    return task.result()
+
+
+def run_download(
+    data_type: str,
+    start_date: str,
+    end_date: str,
+    output_dir: Optional[Path] = None,
+    timeout: Optional[float] = None,
+    idle_timeout: Optional[float] = None,
+    drop_page_cache: Optional[bool] = None
+) -> Dict[str, int]:
+    """
+    Download a date range of flat files to the landing layer (blocking)
+
+    Safe to call from worker threads; each call runs its own event loop.
+    A slow range that keeps finishing files can be allowed to run as long
+    as it needs by giving `idle_timeout` instead of `timeout`.
+
+    Args:
+        data_type: Data type ('stocks_daily', 'stocks_minute', 'options_daily', 'options_minute')
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        output_dir: Landing directory (default: $QUANTLAKE_ROOT/landing)
+        timeout: Seconds before the download is cancelled
+        idle_timeout: Seconds without a finished file before the download
+            is cancelled
+        drop_page_cache: Evict saved files from the page cache
+            (default: QUANTMINI_FADV_DONTNEED=1)
+
+    Returns:
+        Dictionary with 'files', 'downloaded', 'skipped' and 'failed' counts
+
+    Raises:
+        ConfigurationError: If the S3 credentials are missing
+        TimeoutError: If the download takes longer than `timeout` or stalls
+            for `idle_timeout`
+    """
+    if output_dir is None:
+        from ..utils.paths import get_quantlake_root
+        output_dir = get_quantlake_root() / 'landing'
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    credentials = get_s3_credentials()
+    keys = S3Catalog().get_date_range_keys(data_type, start_date, end_date)
+
+    logger.info(f"Downloading {len(keys)} {data_type} files ({start_date} to {end_date})")
+
+    if idle_timeout is None:
+        download = download_flat_files(
+            data_type, keys, output_dir, credentials, drop_page_cache=drop_page_cache
+        )
+    else:
+        download = _download_with_watchdog(
+            data_type, keys, output_dir, credentials, idle_timeout, drop_page_cache
+        )
+
+    return asyncio.run(asyncio.wait_for(download, timeout=timeout))
+
+
+def date_chunks(start: date, end: date, days: int = 7) -> List[Tuple[str, str]]:
+    """Split start..end into consecutive (start, end) date strings of `days` days"""
+    chunks = []
+    current_start = start
+
+    while current_start <= end:
+        current_end = min(current_start + timedelta(days=days - 1), end)
+        chunks.append((current_start.strftime('%Y-%m-%d'), current_end.strftime('%Y-%m-%d')))
+        current_start = current_end + timedelta(days=1)
+
+    return chunks
+
+
+def _download_chunk_once(
+    data_type: str,
+    start_date: str,
+    end_date: str,
+    label: str,
+    log: logging.Logger,
+    use_subprocess: bool,
+    drop_page_cache: bool
+) -> bool:
+    """One download attempt for a chunk; logs the outcome"""
+    try:
+        if use_subprocess:
+            cmd = [
+                "quantmini", "data", "download",
+                "--data-type", data_type,
+                "--start-date", start_date,
+                "--end-date", end_date
+            ]
+
+            # The CLI honours this through the environment
+            env = {**os.environ, 'QUANTMINI_FADV_DONTNEED': '1'} if drop_page_cache else None
+
+            def forward(stream, line):
+                log.info(f"    {line.rstrip()}", extra=FILE_ONLY)
+
+            returncode, _, stderr = run_streaming(
+                cmd, on_line=forward, idle_timeout=CHUNK_IDLE_TIMEOUT, env=env
+            )
+            success, error = returncode == 0, stderr[-200:].strip()
+        else:
+            result = run_download(
+                data_type, start_date, end_date,
+                idle_timeout=CHUNK_IDLE_TIMEOUT, drop_page_cache=drop_page_cache
+            )
+            success, error = result['failed'] == 0, f"{result['failed']}/{result['files']} files failed"
+
+        if success:
+            log.info(f"  ✅ Success: {data_type} {label}")
+        else:
+            log.info(f"  ❌ Failed: {data_type} {label}: {error}")
+        return success
+    except (subprocess.TimeoutExpired, asyncio.TimeoutError, TimeoutError):
+        log.info(f"  ⏱️  Timeout (no progress in {CHUNK_IDLE_TIMEOUT // 60} min): {data_type} {label}")
+        return False
+    except Exception as e:
+        log.info(f"  ❌ Error: {data_type} {label}: {str(e)[:200]}")
+        return False
+
+
+def download_chunk(
+    data_type: str,
+    start_date: str,
+    end_date: str,
+    use_subprocess: bool = False,
+    checkpoint: Optional[ChunkCheckpoint] = None,
+    drop_page_cache: bool = False,
+    label: Optional[str] = None,
+    log: Optional[logging.Logger] = None
+) -> bool:
+    """
+    Download one chunk of a batch run, retrying failures with backoff
+
+    A chunk the checkpoint already records as done is skipped if its
+    landing files are all present.
+
+    Args:
+        data_type: Data type ('stocks_daily', 'stocks_minute', 'options_daily', 'options_minute')
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        use_subprocess: Run `quantmini data download` instead of run_download()
+        checkpoint: Records each chunk's outcome and duration
+        drop_page_cache: Evict saved files from the page cache
+        label: How the chunk is named in log lines (default: "start to end")
+        log: Logger for progress lines (default: this module's logger)
+
+    Returns:
+        True if the chunk downloaded (or was already downloaded)
+    """
+    label = label or f"{start_date} to {end_date}"
+    log = log or logger
+
+    chunk = range_key(start_date, end_date)
+    if checkpoint and chunk in checkpoint.completed(data_type) and is_downloaded(data_type, start_date, end_date):
+        log.info(f"  ⏭️  Skipping {data_type} {label} (already downloaded)")
+        return True
+
+    log.info(f"[{datetime.now().strftime('%H:%M:%S')}] Downloading {data_type}: {label}")
+
+    success = False
+    started = time.monotonic()
+    try:
+        for attempt in range(1, CHUNK_ATTEMPTS + 1):
+            if attempt > 1:
+                # Transient S3 errors and stalls usually clear; back off 2, 4, 8... s
+                delay = min(2 ** (attempt - 1), 60)
+                log.info(f"  🔁 Retrying {data_type} {label} in {delay}s (attempt {attempt}/{CHUNK_ATTEMPTS})")
+                time.sleep(delay)
+
+            success = _download_chunk_once(
+                data_type, start_date, end_date, label, log, use_subprocess, drop_page_cache
+            )
+            if success:
+                break
+
+        return success
+    finally:
+        if checkpoint:
+            checkpoint.record(data_type, chunk, success, time.monotonic() - started)
+
+
+def download_chunks(
+    data_type: str,
+    chunks: List[Tuple[str, str]],
+    workers: int,
+    use_subprocess: bool = False,
+    checkpoint: Optional[ChunkCheckpoint] = None,
+    drop_page_cache: bool = False,
+    log: Optional[logging.Logger] = None
+) -> Tuple[int, int]:
+    """
+    Download date-range chunks in parallel with download_chunk()
+
+    The chunks are independent S3 downloads, so they run side by side
+    instead of each one waiting for the last.
+
+    Returns:
+        (successful chunks, failed chunks)
+    """
+    success = 0
+    fail = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                download_chunk, data_type, start_str, end_str, use_subprocess, checkpoint,
+                drop_page_cache, log=log
+            )
+            for start_str, end_str in chunks
+        ]
+
+        for future in as_completed(futures):
+            if future.result():
+                success += 1
+            else:
+                fail += 1
+
+    return success, fail
@@ -16,15 +16,52 @@ in src/features/financial_ratios.py
 
 import polars as pl
 import asyncio
+import shutil
+import tempfile
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import logging
 
 from .polygon_rest_client import PolygonRESTClient, format_date
+from .partition_manifest import append_manifest
 
 logger = logging.getLogger(__name__)
 
+# Known column types for the short data endpoints. Passed as schema overrides
+# when building DataFrames so batches skip type inference; any extra fields
+# the API returns are still inferred and kept. Dates stay strings to match
+# the files already on disk.
+SHORT_INTEREST_SCHEMA = {
+    'ticker': pl.String,
+    'settlement_date': pl.String,
+    'short_interest': pl.Int64,
+    'avg_daily_volume': pl.Int64,
+    'days_to_cover': pl.Float64,
+}
+
+SHORT_VOLUME_SCHEMA = {
+    'ticker': pl.String,
+    'date': pl.String,
+    'short_volume': pl.Int64,
+    'short_volume_ratio': pl.Float64,
+    'total_volume': pl.Int64,
+    'exempt_volume': pl.Int64,
+    'non_exempt_volume': pl.Int64,
+    'adf_short_volume': pl.Int64,
+    'adf_short_volume_exempt': pl.Int64,
+    'nasdaq_carteret_short_volume': pl.Int64,
+    'nasdaq_carteret_short_volume_exempt': pl.Int64,
+    'nasdaq_chicago_short_volume': pl.Int64,
+    'nasdaq_chicago_short_volume_exempt': pl.Int64,
+    'nyse_short_volume': pl.Int64,
+    'nyse_short_volume_exempt': pl.Int64,
+}
+
+
+# Streamed short data is staged here until its whole range has downloaded
+STAGING_DIR = '_staging'
+
 
 class FundamentalsDownloader:
     """
@@ -114,6 +151,7 @@ class FundamentalsDownloader:
 
         # Get unique year/month/ticker combinations
         partitions = df.select(['year', 'month', 'ticker_extracted']).unique()
+        written = []
 
         for row in partitions.iter_rows(named=True):
             year = row['year']
@@ -141,6 +179,16 @@ class FundamentalsDownloader:
             partition_df.write_parquet(str(output_file), compression='zstd')
             logger.info(f"Saved {len(partition_df)} records to {output_file}")
 
+            written.append({
+                'ticker': ticker_name,
+                'year': year,
+                'month': month,
+                'path': str(output_file.relative_to(self.output_dir)),
+            })
+
+        # Record the files so callers can find completed tickers without a scan
+        append_manifest(self.output_dir, statement_type, written)
+
     def _save_partitioned_short_data(
         self,
         df: pl.DataFrame,
@@ -152,6 +200,9 @@ class FundamentalsDownloader:
 
         Structure: output_dir/{data_type}/year=YYYY/month=MM/ticker=SYMBOL.parquet
 
+        Rows are unique per ticker and date: re-downloaded dates replace the
+        rows already on disk instead of duplicating them.
+
         Args:
             df: DataFrame to save
             data_type: Type of data (short_interest, short_volume)
@@ -215,6 +266,9 @@ class FundamentalsDownloader:
                 existing_df = pl.read_parquet(output_file)
                 partition_df = pl.concat([existing_df, partition_df], how="diagonal_relaxed")
 
+            # One row per date; the latest download wins
+            partition_df = partition_df.unique(subset=[date_column], keep='last', maintain_order=True)
+
             partition_df.write_parquet(str(output_file), compression='zstd')
             logger.info(f"Saved {len(partition_df)} records to {output_file}")
 
@@ -766,6 +820,184 @@ class FundamentalsDownloader:
 
         return df
 
+    async def _stream_short_data(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        data_type: str,
+        date_column: str,
+        schema: Dict[str, pl.DataType],
+        flush_rows: int
+    ) -> int:
+        """
+        Page through a short data endpoint, staging every flush_rows records
+
+        Batches are spilled to a staging directory as pages arrive and only
+        merged into the partitioned layout once the last page has been
+        fetched, so a range that fails partway leaves nothing behind.
+
+        Returns:
+            Number of records downloaded
+        """
+        if not self.use_partitioned_structure:
+            raise ValueError("Streaming short data requires use_partitioned_structure=True")
+
+        staging_root = self.output_dir / STAGING_DIR
+        staging_root.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(prefix=f'{data_type}_', dir=staging_root))
+
+        buffer = []
+        batches = 0
+        total = 0
+        # Spill writes run in a worker thread while the next pages are
+        # fetched, at most one at a time
+        pending_write = None
+
+        try:
+            try:
+                async for page in self.client.iter_pages(endpoint, params):
+                    buffer.extend(page)
+                    if len(buffer) >= flush_rows:
+                        if pending_write is not None:
+                            await pending_write
+                        pending_write = asyncio.create_task(asyncio.to_thread(
+                            self._spill_short_data, buffer, staging_dir / f'part-{batches:05d}.parquet', schema
+                        ))
+                        batches += 1
+                        total += len(buffer)
+                        buffer = []
+            finally:
+                if pending_write is not None:
+                    await pending_write
+
+            if buffer:
+                await asyncio.to_thread(
+                    self._spill_short_data, buffer, staging_dir / f'part-{batches:05d}.parquet', schema
+                )
+                total += len(buffer)
+
+            # Every page arrived: merge the staged batches
+            await asyncio.to_thread(self._commit_short_data, staging_dir, data_type, date_column)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        logger.info(f"Downloaded {total} {data_type.replace('_', ' ')} records")
+        return total
+
+    def _spill_short_data(
+        self,
+        rows: List[Dict[str, Any]],
+        output_file: Path,
+        schema: Dict[str, pl.DataType]
+    ) -> None:
+        """Write one buffered batch of short data rows to a staging file"""
+        # A value that does not fit its known type fails the batch rather
+        # than being stored as null
+        df = pl.DataFrame(rows, schema_overrides=schema, strict=True).with_columns([
+            pl.lit(datetime.now()).alias('downloaded_at')
+        ])
+        df.write_parquet(output_file)
+
+    def _commit_short_data(self, staging_dir: Path, data_type: str, date_column: str) -> None:
+        """Merge staged short data batches into the partitioned layout, a month at a time"""
+        files = sorted(staging_dir.glob('part-*.parquet'))
+        if not files:
+            return
+
+        # Batches may carry different extra fields
+        staged = pl.concat([pl.scan_parquet(f) for f in files], how='diagonal_relaxed')
+
+        months = staged.select(
+            pl.col(date_column).str.slice(0, 7).unique().drop_nulls()
+        ).collect()[date_column]
+
+        for month in sorted(months):
+            self._save_partitioned_short_data(
+                staged.filter(pl.col(date_column).str.starts_with(month)).collect(),
+                data_type,
+                date_column
+            )
+
+    async def stream_short_interest(
+        self,
+        ticker: Optional[str] = None,
+        settlement_date_gte: Optional[str] = None,
+        settlement_date_lte: Optional[str] = None,
+        limit: int = 100,
+        flush_rows: int = 50_000
+    ) -> int:
+        """
+        Download short interest, saving it in batches as pages arrive
+
+        Same data and partitioned output as download_short_interest, but
+        records are staged to disk every flush_rows rows instead of being
+        collected into one DataFrame, so memory stays bounded on large date
+        ranges. Nothing reaches the partitioned output unless every page
+        downloads.
+
+        Args:
+            ticker: Ticker symbol to filter for (None = all tickers)
+            settlement_date_gte: Settlement date greater than or equal (YYYY-MM-DD)
+            settlement_date_lte: Settlement date less than or equal (YYYY-MM-DD)
+            limit: Results per page
+            flush_rows: Number of buffered records that triggers a save
+
+        Returns:
+            Number of records downloaded
+        """
+        params = {'limit': limit}
+        if ticker:
+            params['ticker'] = ticker.upper()
+        if settlement_date_gte:
+            params['settlement_date.gte'] = settlement_date_gte
+        if settlement_date_lte:
+            params['settlement_date.lte'] = settlement_date_lte
+
+        return await self._stream_short_data(
+            '/stocks/v1/short-interest', params, 'short_interest', 'settlement_date',
+            SHORT_INTEREST_SCHEMA, flush_rows
+        )
+
+    async def stream_short_volume(
+        self,
+        ticker: Optional[str] = None,
+        date_gte: Optional[str] = None,
+        date_lte: Optional[str] = None,
+        limit: int = 100,
+        flush_rows: int = 50_000
+    ) -> int:
+        """
+        Download short volume, saving it in batches as pages arrive
+
+        Same data and partitioned output as download_short_volume, but
+        records are staged to disk every flush_rows rows instead of being
+        collected into one DataFrame, so memory stays bounded on large date
+        ranges. Nothing reaches the partitioned output unless every page
+        downloads.
+
+        Args:
+            ticker: Ticker symbol to filter for (None = all tickers)
+            date_gte: Date greater than or equal (YYYY-MM-DD)
+            date_lte: Date less than or equal (YYYY-MM-DD)
+            limit: Results per page
+            flush_rows: Number of buffered records that triggers a save
+
+        Returns:
+            Number of records downloaded
+        """
+        params = {'limit': limit}
+        if ticker:
+            params['ticker'] = ticker.upper()
+        if date_gte:
+            params['date.gte'] = date_gte
+        if date_lte:
+            params['date.lte'] = date_lte
+
+        return await self._stream_short_data(
+            '/stocks/v1/short-volume', params, 'short_volume', 'date',
+            SHORT_VOLUME_SCHEMA, flush_rows
+        )
+
     async def download_short_data_batch(
         self,
         tickers: Optional[List[str]] = None,
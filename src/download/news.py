@@ -57,7 +57,8 @@ class NewsDownloader:
     def _save_partitioned(
         self,
         df: pl.DataFrame,
-        ticker: Optional[str] = None
+        ticker: Optional[str] = None,
+        tickers: Optional[List[str]] = None
     ) -> None:
         """
         Save DataFrame in date-first partitioned structure.
@@ -69,6 +70,7 @@ class NewsDownloader:
         Args:
             df: DataFrame to save (must have 'published_utc' and 'tickers' columns)
             ticker: Optional ticker filter (if provided, only save news for this ticker)
+            tickers: Optional ticker list filter (only save news for these tickers)
         """
         if len(df) == 0:
             return
@@ -98,6 +100,8 @@ class NewsDownloader:
         # Filter by ticker if specified
         if ticker:
             df = df.filter(pl.col('ticker') == ticker.upper())
+        if tickers:
+            df = df.filter(pl.col('ticker').is_in([t.upper() for t in tickers]))
 
         # Filter out null tickers and dates
         df = df.filter(
@@ -222,6 +226,100 @@ class NewsDownloader:
 
         return df
 
+    async def supports_ticker_any_of(self, tickers: List[str]) -> bool:
+        """
+        Check whether the news endpoint applies the ticker.any_of filter
+
+        Requests one small page filtered to `tickers`. If the filter were
+        ignored, the page would hold articles about other tickers.
+
+        Args:
+            tickers: Two or more ticker symbols to probe with
+
+        Returns:
+            True if every returned article mentions one of `tickers`
+        """
+        wanted = {t.upper() for t in tickers}
+        response = await self.client.make_request(
+            '/v2/reference/news',
+            {'ticker.any_of': ','.join(sorted(wanted)), 'limit': 50}
+        )
+
+        return all(
+            wanted & set(article.get('tickers') or [])
+            for article in response.get('results', [])
+        )
+
+    async def download_tickers_news(
+        self,
+        tickers: List[str],
+        limit: int = 1000,
+        published_utc_gte: Optional[str] = None,
+        published_utc_lte: Optional[str] = None,
+        order: str = 'desc',
+        sort: str = 'published_utc'
+    ) -> Dict[str, int]:
+        """
+        Download news for several tickers with one ticker.any_of query
+
+        Each article is fetched once even when it mentions several of the
+        tickers, and saved under each of them. Use supports_ticker_any_of()
+        first; without the filter this query returns all news.
+
+        Args:
+            tickers: Ticker symbols
+            limit: Results per page (max 1000)
+            published_utc_gte: Filter news published on or after this date (YYYY-MM-DD)
+            published_utc_lte: Filter news published on or before this date (YYYY-MM-DD)
+            order: Sort order ('asc' or 'desc')
+            sort: Sort field (default: 'published_utc')
+
+        Returns:
+            Dictionary of {ticker: articles downloaded}
+        """
+        wanted = sorted({t.upper() for t in tickers})
+        logger.info(f"Downloading news for {len(wanted)} tickers ({wanted[0]}..{wanted[-1]})")
+
+        params = {
+            'ticker.any_of': ','.join(wanted),
+            'limit': limit,
+            'order': order,
+            'sort': sort
+        }
+        if published_utc_gte:
+            params['published_utc.gte'] = published_utc_gte
+        if published_utc_lte:
+            params['published_utc.lte'] = published_utc_lte
+
+        counts = dict.fromkeys(wanted, 0)
+
+        results = await self.client.paginate_all('/v2/reference/news', params)
+        if not results:
+            return counts
+
+        df = pl.DataFrame(results)
+        df = df.with_columns(pl.lit(datetime.now()).alias('downloaded_at'))
+
+        if 'tickers' in df.columns:
+            per_ticker = (
+                df.select(pl.col('tickers').explode().alias('ticker'))
+                .filter(pl.col('ticker').is_in(wanted))
+                .group_by('ticker')
+                .len()
+            )
+            counts.update(dict(per_ticker.iter_rows()))
+
+        logger.info(f"Downloaded {len(df)} news articles")
+
+        if self.use_partitioned_structure:
+            self._save_partitioned(df, tickers=wanted)
+        else:
+            output_file = self.output_dir / f"news_{wanted[0]}-{wanted[-1]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
+            df.write_parquet(output_file, compression='zstd')
+            logger.info(f"Saved to {output_file}")
+
+        return counts
+
     async def download_news_batch(
         self,
         tickers: List[str],
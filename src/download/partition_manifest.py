@@ -0,0 +1,106 @@
+"""
+Partition Manifest - Record which partition files a downloader has written
+
+Partitioned downloaders write output_dir/{data_type}/year=YYYY/month=MM/ticker=SYMBOL.parquet.
+Each save also appends one JSON line per file to
+output_dir/_manifest/{data_type}.jsonl, so callers can tell which tickers
+already have data by reading one small file instead of walking the lake.
+
+Lines are append-only and may repeat when a partition file is rewritten;
+readers deduplicate. The first save into a lake without a manifest seeds it
+from the files already on disk, so an existing manifest always covers the
+whole lake.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Set
+import logging
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_DIR = '_manifest'
+
+# Saves may run in worker threads; keep each batch of lines contiguous
+_manifest_lock = threading.Lock()
+
+
+def manifest_path(output_dir: Path, data_type: str) -> Path:
+    """Path of the manifest for one data type"""
+    return Path(output_dir) / MANIFEST_DIR / f'{data_type}.jsonl'
+
+
+def append_manifest(output_dir: Path, data_type: str, entries: List[Dict]) -> None:
+    """
+    Append written partition files to the manifest
+
+    Args:
+        output_dir: Downloader output directory
+        data_type: Data type folder (balance_sheets, cash_flow, ...)
+        entries: One dict per file with ticker, year, month and path
+            (relative to output_dir)
+    """
+    if not entries:
+        return
+
+    path = manifest_path(output_dir, data_type)
+    payload = ''.join(json.dumps(entry) + '\n' for entry in entries)
+
+    with _manifest_lock:
+        if not path.exists():
+            # Partitions written before the manifest existed (including
+            # these entries, already saved) must be listed too
+            _write_manifest(path, _scan_partitions(Path(output_dir), data_type))
+            return
+
+        with open(path, 'a') as f:
+            f.write(payload)
+
+
+def read_manifest_tickers(output_dir: Path, data_type: str) -> Set[str]:
+    """Tickers with at least one partition file recorded in the manifest"""
+    with open(manifest_path(output_dir, data_type)) as f:
+        return {json.loads(line)['ticker'] for line in f if line.strip()}
+
+
+def rebuild_manifest(output_dir: Path, data_type: str) -> Set[str]:
+    """
+    Rewrite the manifest from the partition files on disk
+
+    Only file names are read, never parquet data.
+
+    Returns:
+        Tickers found
+    """
+    output_dir = Path(output_dir)
+    path = manifest_path(output_dir, data_type)
+
+    with _manifest_lock:
+        entries = _scan_partitions(output_dir, data_type)
+        _write_manifest(path, entries)
+
+    return {entry['ticker'] for entry in entries}
+
+
+def _scan_partitions(output_dir: Path, data_type: str) -> List[Dict]:
+    """Manifest entries for the partition files on disk"""
+    entries = []
+    for file_path in sorted((output_dir / data_type).glob('year=*/month=*/ticker=*.parquet')):
+        entries.append({
+            'ticker': file_path.stem.split('=', 1)[1],
+            'year': int(file_path.parent.parent.name.split('=', 1)[1]),
+            'month': int(file_path.parent.name.split('=', 1)[1]),
+            'path': str(file_path.relative_to(output_dir)),
+        })
+    return entries
+
+
+def _write_manifest(path: Path, entries: List[Dict]) -> None:
+    """Replace a manifest with `entries` (caller holds _manifest_lock)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_text(''.join(json.dumps(entry) + '\n' for entry in entries))
+    tmp_path.replace(path)
+
+    logger.info(f"Rebuilt {path} ({len(entries)} files)")
@@ -45,7 +45,8 @@ class PolygonRESTClient:
         max_retries: int = 3,
         timeout: int = 30,
         enable_http2: bool = True,
-        enable_adaptive_throttling: bool = True
+        enable_adaptive_throttling: bool = True,
+        max_requests_per_second: Optional[float] = None
     ):
         """
         Initialize Polygon REST API client
@@ -59,6 +60,8 @@ class PolygonRESTClient:
             timeout: Request timeout in seconds
             enable_http2: Enable HTTP/2 for better performance
             enable_adaptive_throttling: Enable automatic concurrency reduction on errors
+            max_requests_per_second: Token bucket rate for request admission
+                (None = no rate limit, only the concurrency cap applies)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
@@ -66,10 +69,13 @@ class PolygonRESTClient:
         self.max_retries = max_retries
         self.enable_adaptive_throttling = enable_adaptive_throttling
 
-        # Create async HTTP client with connection pooling
+        # Create async HTTP client with connection pooling. Keep every pooled
+        # connection alive between bursts so batch runs don't pay repeated
+        # DNS lookups and TLS handshakes after the pool drains.
         limits = httpx.Limits(
             max_connections=max_connections,
-            max_keepalive_connections=max_connections // 2
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=60.0
         )
 
         self.client = httpx.AsyncClient(
@@ -85,6 +91,12 @@ class PolygonRESTClient:
         self._min_concurrent = max(1, max_concurrent // 10)  # Never go below 10% of max
         self.semaphore = asyncio.Semaphore(max_concurrent)
 
+        # Token bucket rate limiting (bucket holds up to one second of requests)
+        self.max_requests_per_second = max_requests_per_second
+        self._tokens = max_requests_per_second or 0.0
+        self._last_refill = None
+        self._rate_lock = asyncio.Lock()
+
         # Adaptive throttling tracking
         self._connection_errors = 0
         self._error_threshold = 5  # Throttle after 5 connection errors
@@ -103,7 +115,8 @@ class PolygonRESTClient:
         logger.info(
             f"PolygonRESTClient initialized "
             f"(max_concurrent={max_concurrent}, http2={enable_http2}, "
-            f"adaptive_throttling={enable_adaptive_throttling})"
+            f"adaptive_throttling={enable_adaptive_throttling}, "
+            f"max_requests_per_second={max_requests_per_second})"
         )
 
     async def close(self):
@@ -184,6 +197,31 @@ class PolygonRESTClient:
                 # Create new semaphore with increased limit
                 self.semaphore = asyncio.Semaphore(new_concurrent)
 
+    async def _acquire_token(self):
+        """Wait for a token from the rate limiter bucket"""
+        if self.max_requests_per_second is None:
+            return
+
+        async with self._rate_lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+
+            if self._last_refill is not None:
+                elapsed = now - self._last_refill
+                self._tokens = min(
+                    self.max_requests_per_second,
+                    self._tokens + elapsed * self.max_requests_per_second
+                )
+            self._last_refill = now
+
+            if self._tokens < 1:
+                # Hold the lock while waiting so callers are admitted in order
+                await asyncio.sleep((1 - self._tokens) / self.max_requests_per_second)
+                self._tokens = 1.0
+                self._last_refill = loop.time()
+
+            self._tokens -= 1
+
     async def _make_request(
         self,
         endpoint: str,
@@ -213,6 +251,8 @@ class PolygonRESTClient:
         async with self.semaphore:
             for attempt in range(1, self.max_retries + 1):
                 try:
+                    await self._acquire_token()
+
                     async with self._stats_lock:
                         self.total_requests += 1
 
@@ -355,6 +395,8 @@ class PolygonRESTClient:
             url = f"{url}{separator}apiKey={self.api_key}"
 
         async with self.semaphore:
+            await self._acquire_token()
+
             async with self._stats_lock:
                 self.total_requests += 1
 
@@ -453,6 +495,40 @@ class PolygonRESTClient:
         logger.info(f"Pagination complete: {pages_fetched} pages, {len(all_results)} total items")
         return all_results
 
+    async def iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield the results of each page as it arrives
+
+        Unlike paginate_all, pages are not accumulated, so callers can
+        process large result sets in memory bounded by what they buffer.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            max_pages: Maximum pages to fetch (None = all)
+
+        Yields:
+            List of result items for one page
+        """
+        response = await self._make_request(endpoint, params or {})
+        pages_fetched = 1
+        yield response.get('results', [])
+
+        next_url = response.get('next_url')
+        while next_url and (max_pages is None or pages_fetched < max_pages):
+            response = await self._make_request_raw_url(next_url)
+            pages_fetched += 1
+            yield response.get('results', [])
+
+            next_url = response.get('next_url')
+
+        logger.info(f"Pagination complete: {pages_fetched} pages")
+
     async def batch_request(
         self,
         requests: List[Dict[str, Any]]
@@ -23,6 +23,7 @@ from datetime import datetime
 import logging
 
 from .polygon_rest_client import PolygonRESTClient
+from .partition_manifest import append_manifest
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +119,7 @@ class FinancialRatiosAPIDownloader:
 
         # Get unique year/month/ticker combinations
         partitions = df.select(['year', 'month', 'ticker_extracted']).unique()
+        written = []
 
         for row in partitions.iter_rows(named=True):
             year = row['year']
@@ -145,6 +147,16 @@ class FinancialRatiosAPIDownloader:
             partition_df.write_parquet(str(output_file), compression='zstd')
             logger.info(f"Saved {len(partition_df)} records to {output_file}")
 
+            written.append({
+                'ticker': ticker_name,
+                'year': year,
+                'month': month,
+                'path': str(output_file.relative_to(self.output_dir)),
+            })
+
+        # Record the files so callers can find completed tickers without a scan
+        append_manifest(self.output_dir, 'financial_ratios', written)
+
     async def download_ratios(
         self,
         ticker: Optional[str] = None,
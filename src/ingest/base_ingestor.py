@@ -124,7 +124,8 @@ class BaseIngestor(ABC):
 
         Args:
             date: Date string (YYYY-MM-DD)
-            data: CSV data as BytesIO
+            data: CSV data as BytesIO, or a binary stream such as
+                gzip.GzipFile that decompresses as it is read
             symbols: Optional symbol filter
 
         Returns:
@@ -135,6 +136,18 @@ class BaseIngestor(ABC):
         """
         pass
 
+    @staticmethod
+    def _input_bytes(data) -> int:
+        """
+        Size of CSV data that has been ingested
+
+        BytesIO reports its buffer size; other streams report how far they
+        were read (the decompressed size for gzip.GzipFile).
+        """
+        if hasattr(data, 'getbuffer'):
+            return data.getbuffer().nbytes
+        return data.tell()
+
     def _read_csv(
         self,
         data: BytesIO,
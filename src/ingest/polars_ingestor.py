@@ -75,7 +75,7 @@ class PolarsIngestor(BaseIngestor):
 
         Args:
             date: Date string (YYYY-MM-DD)
-            data: CSV data as BytesIO
+            data: CSV data as BytesIO or a binary stream (e.g. gzip.GzipFile)
             symbols: Optional symbol filter
 
         Returns:
@@ -125,65 +125,192 @@ class PolarsIngestor(BaseIngestor):
                     schema_overrides=schema_overrides,
                 )
 
-            # Normalize column names (Polars)
-            df = self._normalize_columns_polars(df, date)
+            result = self._write_date(df, date, output_path, symbols)
+            self.bytes_processed += self._input_bytes(data)
 
-            # Filter symbols if provided
-            if symbols and 'symbol' in df.columns:
-                df = df.filter(pl.col('symbol').is_in(symbols))
+            return result
 
-            # Add partition columns
-            df = self._add_partition_columns_polars(df, date)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Polars ingestion failed for {date}: {e}")
+            raise IngestionError(f"Polars ingestion failed: {e}")
 
-            # Convert types to match schema
-            df = self._optimize_dtypes_polars(df)
+    def _write_date(
+        self,
+        df: pl.DataFrame,
+        date: str,
+        output_path: Path,
+        symbols: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Normalize one date's parsed CSV and write it to Parquet
 
-            # Convert to PyArrow
-            table = df.to_arrow()
+        Args:
+            df: Raw CSV rows for the date
+            date: Date string (YYYY-MM-DD)
+            output_path: Parquet file to write
+            symbols: Optional symbol filter
 
-            # Write Parquet with consistent schema (no dictionary encoding)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            pq.write_table(
-                table,
-                output_path,
-                compression='snappy',
-                use_dictionary=False,  # Disable for schema consistency
-                write_statistics=True,
-                row_group_size=100000,
-            )
+        Returns:
+            Dictionary with ingestion statistics
+        """
+        # Normalize column names (Polars)
+        df = self._normalize_columns_polars(df, date)
+
+        # Filter symbols if provided
+        if symbols and 'symbol' in df.columns:
+            df = df.filter(pl.col('symbol').is_in(symbols))
+
+        # Add partition columns
+        df = self._add_partition_columns_polars(df, date)
+
+        # Convert types to match schema
+        df = self._optimize_dtypes_polars(df)
+
+        # Convert to PyArrow
+        table = df.to_arrow()
+
+        # Write Parquet with consistent schema (no dictionary encoding)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(
+            table,
+            output_path,
+            compression='snappy',
+            use_dictionary=False,  # Disable for schema consistency
+            write_statistics=True,
+            row_group_size=100000,
+        )
 
-            # Statistics
-            num_records = len(df)
-            file_size = output_path.stat().st_size / 1024**2
+        # Statistics
+        num_records = len(df)
+        file_size = output_path.stat().st_size / 1024**2
 
-            self.records_processed += num_records
-            self.files_processed += 1
-            self.bytes_processed += data.getbuffer().nbytes
+        self.records_processed += num_records
+        self.files_processed += 1
 
-            # Memory cleanup
-            del df, table
-            gc.collect()
+        # Memory cleanup
+        del df, table
+        gc.collect()
 
-            # Final memory check
-            mem_status = self.memory_monitor.check_and_wait()
+        # Final memory check
+        mem_status = self.memory_monitor.check_and_wait()
 
-            logger.info(
-                f"Polars ingestion complete: {date} "
-                f"({num_records:,} records, {file_size:.1f} MB)"
-            )
+        logger.info(
+            f"Polars ingestion complete: {date} "
+            f"({num_records:,} records, {file_size:.1f} MB)"
+        )
 
-            return {
-                'date': date,
-                'records': num_records,
-                'file_size_mb': file_size,
-                'status': 'success',
-                'memory_peak_percent': mem_status['system_percent'],
-            }
+        return {
+            'date': date,
+            'records': num_records,
+            'file_size_mb': file_size,
+            'status': 'success',
+            'memory_peak_percent': mem_status['system_percent'],
+        }
+
+    def ingest_many(
+        self,
+        files: Dict[str, Path],
+        symbols: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Process several date files with one multi-file Polars scan
+
+        Polars parses (and decompresses) all files in one pass on its
+        thread pool instead of once per file. Each date is still written to
+        its own Parquet file, exactly as ingest_date() would.
+
+        The scan is collected rather than streamed with sink_parquet():
+        each date goes through the same eager normalization and pyarrow
+        writer settings as ingest_date(), so the two paths produce
+        identical files. Peak memory is therefore about twice the parsed
+        rows of every file passed (the scan result plus its per-file
+        partitions), so callers should pass a bounded group (e.g. one
+        month) and run one group at a time.
+
+        Args:
+            files: Dictionary mapping dates (YYYY-MM-DD) to CSV or CSV.GZ paths
+            symbols: Optional symbol filter
+
+        Returns:
+            Dictionary mapping dates to ingestion statistics
+
+        Raises:
+            IngestionError: If the scan fails or its rows cannot be matched to
+                the files (no date is written)
+        """
+        results = {}
+        pending = {}
+
+        for date, path in files.items():
+            output_path = self._get_output_path(date)
+
+            # Check if output already exists
+            if output_path.exists():
+                logger.warning(f"Output exists, skipping: {output_path}")
+                results[date] = {
+                    'date': date,
+                    'records': 0,
+                    'status': 'skipped',
+                    'reason': 'output_exists'
+                }
+            else:
+                pending[str(path)] = date
+
+        if not pending:
+            return results
+
+        try:
+            logger.info(f"Polars multi-file ingestion: {len(pending)} files")
+
+            # Check memory before starting
+            mem_status = self.memory_monitor.check_and_wait()
+            if mem_status['action'] == 'critical':
+                logger.warning("Memory pressure is critical before ingestion")
+
+            df = pl.scan_csv(
+                list(pending),
+                has_header=True,
+                null_values=['', 'NA', 'NULL', 'NaN'],
+                try_parse_dates=False,  # We'll handle dates explicitly
+                low_memory=self.streaming,
+                schema_overrides=self._get_schema_overrides(),
+                include_file_paths='_source_file',
+            ).collect(engine='streaming' if self.streaming else 'auto')
+
+            by_file = df.partition_by('_source_file', as_dict=True, include_key=False)
+            empty = df.clear().drop('_source_file')
+            del df
+
+            # Every row must map back to a requested file; otherwise a file
+            # with rows would look header-only and be written empty
+            unmatched = set(by_file) - {(path,) for path in pending}
+            if unmatched:
+                raise ValueError(
+                    f"rows from unrequested source files: {sorted(key[0] for key in unmatched)}"
+                )
 
         except Exception as e:
             self.errors += 1
-            logger.error(f"Polars ingestion failed for {date}: {e}")
-            raise IngestionError(f"Polars ingestion failed: {e}")
+            logger.error(f"Polars multi-file ingestion failed: {e}")
+            raise IngestionError(f"Polars multi-file ingestion failed: {e}")
+
+        for path, date in pending.items():
+            try:
+                # Every row was matched above, so a file without a
+                # partition had a header and no rows
+                date_df = by_file.pop((path,), empty)
+                results[date] = self._write_date(date_df, date, self._get_output_path(date), symbols)
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Polars ingestion failed for {date}: {e}")
+                results[date] = {
+                    'date': date,
+                    'status': 'error',
+                    'error': str(e)
+                }
+
+        return results
 
     def ingest_batch(
         self,
@@ -74,7 +74,7 @@ class StreamingIngestor(BaseIngestor):
 
         Args:
             date: Date string (YYYY-MM-DD)
-            data: CSV data as BytesIO
+            data: CSV data as BytesIO or a binary stream (e.g. gzip.GzipFile)
             symbols: Optional symbol filter
 
         Returns:
@@ -184,7 +184,7 @@ class StreamingIngestor(BaseIngestor):
             # Update statistics
             self.records_processed += total_records
             self.files_processed += 1
-            self.bytes_processed += data.getbuffer().nbytes
+            self.bytes_processed += self._input_bytes(data)
 
             # Final memory check
             mem_status = self.memory_monitor.check_and_wait()
@@ -8,6 +8,7 @@ Based on: pipeline_design/mac-optimized-pipeline.md
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -74,16 +75,7 @@ class MetadataManager:
         """
         try:
             # Build metadata record
-            record = {
-                'data_type': data_type,
-                'date': date,
-                'symbol': symbol,
-                'status': status,
-                'layer': layer,
-                'timestamp': datetime.now().isoformat(),
-                'statistics': statistics,
-                'error': error,
-            }
+            record = self._build_record(data_type, date, status, statistics, symbol, error, layer)
 
             # Save to file
             metadata_file = self._get_metadata_file(data_type, date, symbol, layer)
@@ -97,6 +89,79 @@ class MetadataManager:
         except Exception as e:
             raise MetadataManagerError(f"Failed to record ingestion: {e}")
 
+    def record_ingestion_batch(
+        self,
+        data_type: str,
+        results: List[Dict[str, Any]],
+        watermark: Optional[str] = None,
+        layer: str = 'bronze'
+    ):
+        """
+        Record several ingestion results and advance the watermark once
+
+        Equivalent to record_ingestion() per result followed by one
+        set_watermark(), but each metadata directory is created once and the
+        watermark file is written once for the whole batch.
+
+        Args:
+            data_type: Data type ('stocks_daily', etc.)
+            results: One dict per result with 'date', 'status' and
+                'statistics', and optionally 'symbol' and 'error'
+            watermark: Optional date to set as the watermark
+            layer: Medallion layer ('landing', 'bronze', 'silver', 'gold')
+        """
+        try:
+            created = set()
+
+            for result in results:
+                record = self._build_record(
+                    data_type,
+                    result['date'],
+                    result['status'],
+                    result['statistics'],
+                    result.get('symbol'),
+                    result.get('error'),
+                    layer
+                )
+
+                metadata_file = self._get_metadata_file(data_type, record['date'], record['symbol'], layer)
+                if metadata_file.parent not in created:
+                    metadata_file.parent.mkdir(parents=True, exist_ok=True)
+                    created.add(metadata_file.parent)
+
+                with open(metadata_file, 'w') as f:
+                    json.dump(record, f, indent=2)
+
+            logger.debug(f"Recorded {len(results)} ingestions: {layer}/{data_type}")
+
+        except Exception as e:
+            raise MetadataManagerError(f"Failed to record ingestion batch: {e}")
+
+        if watermark:
+            self.set_watermark(data_type, watermark, layer=layer)
+
+    @staticmethod
+    def _build_record(
+        data_type: str,
+        date: str,
+        status: str,
+        statistics: Dict[str, Any],
+        symbol: Optional[str],
+        error: Optional[str],
+        layer: str
+    ) -> Dict[str, Any]:
+        """Metadata record for one ingestion result"""
+        return {
+            'data_type': data_type,
+            'date': date,
+            'symbol': symbol,
+            'status': status,
+            'layer': layer,
+            'timestamp': datetime.now().isoformat(),
+            'statistics': statistics,
+            'error': error,
+        }
+
     def get_ingestion_status(
         self,
         data_type: str,
@@ -252,6 +317,9 @@ class MetadataManager:
         """
         Set watermark for incremental processing
 
+        Each data type (and symbol) has its own small watermark file, replaced
+        atomically.
+
         Args:
             data_type: Data type
             date: Date string
@@ -270,8 +338,11 @@ class MetadataManager:
                 'timestamp': datetime.now().isoformat(),
             }
 
-            with open(watermark_file, 'w') as f:
+            # Write then rename, so a crash never leaves a truncated watermark
+            tmp_file = watermark_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w') as f:
                 json.dump(watermark, f, indent=2)
+            os.replace(tmp_file, watermark_file)
 
             logger.debug(f"Set watermark: {data_type} / {date}")
 
@@ -0,0 +1,107 @@
+"""
+Chunk Checkpoint - Remember finished chunks of a long download run
+
+Batch download scripts split their work into chunks (date ranges, tickers).
+ChunkCheckpoint records the outcome of each chunk in a small SQLite file so
+a rerun after a crash or partial failure only redoes what did not finish.
+
+Chunks are keyed by (data_type, chunk), where chunk is a date-range key
+such as '2024-01-01_to_2024-03-31' or a ticker. The time each chunk took
+is kept too, so stragglers can be reported.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+
+def range_key(start_date: str, end_date: str) -> str:
+    """Checkpoint key for a date range"""
+    return f"{start_date}_to_{end_date}"
+
+
+class ChunkCheckpoint:
+    """
+    SQLite-backed record of finished download chunks
+
+    Safe to share between threads; writes are serialized.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) a checkpoint
+
+        Args:
+            path: SQLite file path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        # WAL without per-commit fsync: one commit per chunk stays cheap
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS chunks ('
+            ' data_type TEXT NOT NULL,'
+            ' chunk TEXT NOT NULL,'
+            ' status TEXT NOT NULL,'
+            ' updated_at TEXT NOT NULL,'
+            ' seconds REAL,'
+            ' PRIMARY KEY (data_type, chunk))'
+        )
+        # Checkpoints left by older runs predate the seconds column
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(chunks)')}
+        if 'seconds' not in columns:
+            self._conn.execute('ALTER TABLE chunks ADD COLUMN seconds REAL')
+        self._conn.commit()
+
+    def completed(self, data_type: str) -> Set[str]:
+        """Chunks of `data_type` that finished successfully"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT chunk FROM chunks WHERE data_type = ? AND status = 'ok'",
+                (data_type,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def record(self, data_type: str, chunk: str, success: bool, seconds: Optional[float] = None):
+        """Record the outcome of one chunk and, optionally, how long it took"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO chunks (data_type, chunk, status, updated_at, seconds)'
+                ' VALUES (?, ?, ?, ?, ?)',
+                (data_type, chunk, 'ok' if success else 'failed', datetime.now().isoformat(), seconds)
+            )
+            self._conn.commit()
+
+    def slowest(self, data_type: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """The `limit` slowest timed chunks of `data_type`, as (chunk, seconds)"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT chunk, seconds FROM chunks'
+                ' WHERE data_type = ? AND seconds IS NOT NULL'
+                ' ORDER BY seconds DESC LIMIT ?',
+                (data_type, limit)
+            ).fetchall()
+        return [(chunk, seconds) for chunk, seconds in rows]
+
+    def clear(self):
+        """Forget every recorded chunk"""
+        with self._lock:
+            self._conn.execute('DELETE FROM chunks')
+            self._conn.commit()
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
+
+    def remove(self):
+        """Close and delete the checkpoint (the run finished)"""
+        self.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(f"{self.path}{suffix}").unlink(missing_ok=True)
@@ -0,0 +1,59 @@
+"""
+Script Logging - Console and log file output for batch scripts
+
+Batch download and ingestion scripts report progress from several workers
+at once. Writing each line to the log file and flushing it from the worker
+costs a syscall per line and lets concurrent lines interleave. start_script_logging()
+instead gives the script a logger whose records are queued and written by
+a single QueueListener thread that owns the console and file handlers.
+
+Records logged with extra=FILE_ONLY (e.g. forwarded CLI output) go to the
+log file but not the console.
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+import sys
+from typing import Tuple
+
+# Pass as extra= to keep a record out of the console
+FILE_ONLY = {'file_only': True}
+
+
+def start_script_logging(name: str, log_path: Path) -> Tuple[logging.Logger, QueueListener]:
+    """
+    Create a queued logger writing to the console and a log file
+
+    Args:
+        name: Logger name
+        log_path: Log file (overwritten)
+
+    Returns:
+        (logger, listener). Call listener.stop() before exiting to flush
+        queued records.
+    """
+    log_path = Path(log_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Scripts format their own lines (timestamps, indentation, emoji)
+    formatter = logging.Formatter('%(message)s')
+
+    file_handler = logging.FileHandler(log_path, mode='w', encoding='utf-8')
+    file_handler.setFormatter(formatter)
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    console_handler.addFilter(lambda record: not getattr(record, 'file_only', False))
+
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, console_handler, file_handler)
+
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.handlers = [QueueHandler(log_queue)]
+    logger.propagate = False
+
+    listener.start()
+    return logger, listener
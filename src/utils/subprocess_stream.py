@@ -0,0 +1,101 @@
+"""
+Subprocess Streaming - Run a command without buffering all of its output
+
+subprocess.run(capture_output=True) holds a child's entire stdout/stderr in
+memory until it exits. For long downloads that log heavily, run_streaming()
+reads both pipes line by line as they are written, hands each line to a
+callback, and keeps only the last few lines for error reporting.
+
+A chunk that is slow but still working should not be killed by a fixed
+wall-clock limit, so run_streaming() can instead kill a child that has
+printed nothing for `idle_timeout` seconds.
+"""
+
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def run_streaming(
+    cmd: List[str],
+    timeout: Optional[float] = None,
+    on_line: Optional[Callable[[str, str], None]] = None,
+    tail_lines: int = 200,
+    idle_timeout: Optional[float] = None,
+    env: Optional[Dict[str, str]] = None
+) -> Tuple[int, str, str]:
+    """
+    Run a command, streaming its output
+
+    Args:
+        cmd: Command and arguments
+        timeout: Seconds before the process is killed
+        on_line: Called as on_line(stream, line) for every output line, with
+            stream 'stdout' or 'stderr'. Called from reader threads.
+        tail_lines: Lines of each stream kept for the return value
+        idle_timeout: Seconds without any output before the process is killed
+        env: Environment for the process (default: inherit)
+
+    Returns:
+        (return code, last stdout lines, last stderr lines)
+
+    Raises:
+        subprocess.TimeoutExpired: If the process ran longer than `timeout`
+            or was silent for `idle_timeout`
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+        env=env
+    )
+
+    tails = {'stdout': deque(maxlen=tail_lines), 'stderr': deque(maxlen=tail_lines)}
+    started = time.monotonic()
+    last_output = [started]
+
+    def drain(stream_name: str, pipe):
+        for line in pipe:
+            last_output[0] = time.monotonic()
+            tails[stream_name].append(line)
+            if on_line:
+                on_line(stream_name, line)
+        pipe.close()
+
+    readers = [
+        threading.Thread(target=drain, args=('stdout', proc.stdout), daemon=True),
+        threading.Thread(target=drain, args=('stderr', proc.stderr), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    # Without an idle timeout a single wait covers the wall-clock limit
+    poll = timeout if idle_timeout is None else min(idle_timeout, 5.0)
+
+    try:
+        while True:
+            wait = poll
+            if timeout is not None:
+                wait = min(wait, max(started + timeout - time.monotonic(), 0))
+            try:
+                returncode = proc.wait(timeout=wait)
+                break
+            except subprocess.TimeoutExpired:
+                now = time.monotonic()
+                if timeout is not None and now - started >= timeout:
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                if idle_timeout is not None and now - last_output[0] >= idle_timeout:
+                    raise subprocess.TimeoutExpired(cmd, idle_timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join()
+
+    return returncode, ''.join(tails['stdout']), ''.join(tails['stderr'])
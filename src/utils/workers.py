@@ -0,0 +1,44 @@
+"""
+Worker Pool Sizing - Default concurrency for batch scripts
+
+Download scripts mostly wait on the network, so they can run several
+workers per CPU. Sizing from the CPUs this process may actually use (not
+the host total) keeps small containers and CI runners from oversubscribing.
+Workers that each buffer a large file can also be capped by the memory
+available now.
+"""
+
+import os
+from typing import Optional
+
+import psutil
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (honours affinity masks where supported)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def default_workers(io_bound: bool = True, memory_per_worker_gb: Optional[float] = None) -> int:
+    """
+    Default worker count for this host
+
+    Args:
+        io_bound: Work mostly waits on I/O (4 workers per CPU, at most 32);
+            otherwise one worker per CPU
+        memory_per_worker_gb: Memory each worker may hold at once; if given,
+            no more workers than fit in the available memory
+
+    Returns:
+        Number of workers (at least 1)
+    """
+    cpus = available_cpus()
+    workers = min(32, cpus * 4) if io_bound else cpus
+
+    if memory_per_worker_gb:
+        by_memory = int(psutil.virtual_memory().available / 1024**3 // memory_per_worker_gb)
+        workers = min(workers, by_memory)
+
+    return max(1, workers)
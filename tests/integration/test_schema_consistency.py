@@ -14,12 +14,35 @@ import pyarrow.parquet as pq
 import struct
 from pathlib import Path
 from collections import defaultdict
-from typing import Dict, List, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _read_schema_columns(parquet_file: Path) -> Tuple[Path, Optional[List[str]]]:
+    """
+    Read one parquet footer and return its column signature
+
+    Runs in a worker thread; pyarrow releases the GIL while reading and
+    parsing the footer. Errors are logged and reported as None.
+    """
+    try:
+        # Read parquet metadata without loading data
+        # This avoids schema merging issues. Memory-mapping serves the footer
+        # from the page cache instead of buffered reads (fine on local disks).
+        with pq.ParquetFile(parquet_file, memory_map=True) as pf:
+            schema = pf.metadata.schema.to_arrow_schema()
+
+        # Get column names and types
+        return parquet_file, [f"{field.name}:{field.type}" for field in schema]
+
+    except Exception as e:
+        logger.warning(f"Could not read {parquet_file}: {e}")
+        return parquet_file, None
+
+
 class TestSchemaConsistency:
     """Test schema consistency across all datasets and dates"""
 
@@ -326,19 +349,13 @@ class TestSchemaConsistency:
         if not root_dir.exists():
             return schemas
 
-        for parquet_file in root_dir.rglob('*.parquet'):
-            try:
-                # Read parquet metadata without loading data
-                # This avoids schema merging issues
-                parquet_meta = pq.read_metadata(parquet_file)
-                schema = parquet_meta.schema.to_arrow_schema()
-
-                # Get column names and types
-                columns = [f"{field.name}:{field.type}" for field in schema]
-                schemas[parquet_file] = columns
+        files = list(root_dir.rglob('*.parquet'))
 
-            except Exception as e:
-                logger.warning(f"Could not read {parquet_file}: {e}")
+        # Footer reads are independent, so fan them out across threads
+        with ThreadPoolExecutor() as executor:
+            for parquet_file, columns in executor.map(_read_schema_columns, files):
+                if columns is not None:
+                    schemas[parquet_file] = columns
 
         return schemas
 
@@ -0,0 +1,70 @@
+"""
+Unit tests for the flat file chunk download helpers
+
+Run with: pytest tests/unit/test_flat_files.py
+"""
+
+import pytest
+from datetime import date
+
+from src.download import flat_files
+from src.download.flat_files import CHUNK_ATTEMPTS, date_chunks, download_chunk, download_chunks
+from src.utils.chunk_checkpoint import ChunkCheckpoint, range_key
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    """Skip the retry delays"""
+    monkeypatch.setattr(flat_files.time, 'sleep', lambda seconds: None)
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    """Create temporary chunk checkpoint"""
+    checkpoint = ChunkCheckpoint(tmp_path / 'checkpoint.sqlite')
+    yield checkpoint
+    checkpoint.close()
+
+
+def test_date_chunks():
+    """Test a range is split into consecutive chunks ending at the range end"""
+    assert date_chunks(date(2024, 1, 1), date(2024, 1, 10), 7) == [
+        ('2024-01-01', '2024-01-07'),
+        ('2024-01-08', '2024-01-10'),
+    ]
+    assert date_chunks(date(2024, 1, 2), date(2024, 1, 1)) == []
+
+
+def test_download_chunk_retries(monkeypatch, checkpoint):
+    """Test a timed-out attempt is retried and the success is checkpointed"""
+    calls = []
+
+    def fake_download(data_type, start_date, end_date, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise TimeoutError()
+        return {'files': 5, 'failed': 0}
+
+    monkeypatch.setattr(flat_files, 'run_download', fake_download)
+
+    assert download_chunk('stocks_daily', '2024-01-01', '2024-01-07',
+                          checkpoint=checkpoint, drop_page_cache=True)
+
+    assert len(calls) == 2
+    assert calls[0]['drop_page_cache'] is True
+    assert range_key('2024-01-01', '2024-01-07') in checkpoint.completed('stocks_daily')
+
+
+def test_download_chunks_counts_failures(monkeypatch):
+    """Test chunks that fail every attempt are counted as failed"""
+    calls = []
+
+    def fake_download(data_type, start_date, end_date, **kwargs):
+        calls.append(start_date)
+        return {'files': 5, 'failed': 1 if start_date == '2024-01-08' else 0}
+
+    monkeypatch.setattr(flat_files, 'run_download', fake_download)
+
+    chunks = date_chunks(date(2024, 1, 1), date(2024, 1, 21), 7)
+    assert download_chunks('stocks_minute', chunks, workers=2) == (2, 1)
+    assert calls.count('2024-01-08') == CHUNK_ATTEMPTS
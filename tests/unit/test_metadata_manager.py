@@ -4,6 +4,7 @@ Unit tests for MetadataManager
 Run with: pytest tests/unit/test_metadata_manager.py
 """
 
+import json
 import pytest
 from pathlib import Path
 from datetime import datetime
@@ -79,6 +80,26 @@ def test_record_ingestion_with_symbol(metadata_manager):
     assert status['symbol'] == 'AAPL'
 
 
+def test_record_ingestion_batch(metadata_manager):
+    """Test recording several results and the watermark at once"""
+    metadata_manager.record_ingestion_batch(
+        'stocks_daily',
+        [
+            {'date': '2025-09-30', 'status': 'success', 'statistics': {'records': 1000}},
+            {'date': '2025-10-01', 'status': 'failed', 'statistics': {}, 'error': 'Bad file'},
+        ],
+        watermark='2025-10-01'
+    )
+
+    assert metadata_manager.get_ingestion_status('stocks_daily', '2025-09-30')['status'] == 'success'
+    failed = metadata_manager.get_ingestion_status('stocks_daily', '2025-10-01')
+    assert failed['status'] == 'failed'
+    assert failed['error'] == 'Bad file'
+
+    watermark_file = metadata_manager._get_watermark_file('stocks_daily')
+    assert watermark_file.exists()
+
+
 def test_get_ingestion_status_not_found(metadata_manager):
     """Test getting status for non-existent ingestion"""
     status = metadata_manager.get_ingestion_status('stocks_daily', '2020-01-01')
@@ -168,6 +189,21 @@ def test_set_watermark(metadata_manager):
     assert watermark_file.exists()
 
 
+def test_set_watermark_replaces_file(metadata_manager):
+    """Test updating a watermark rewrites its file in place"""
+    metadata_manager.set_watermark('stocks_daily', '2025-09-30')
+    metadata_manager.set_watermark('stocks_daily', '2025-10-01')
+    metadata_manager.set_watermark('options_daily', '2025-09-29')
+
+    watermark_file = metadata_manager._get_watermark_file('stocks_daily')
+    assert json.loads(watermark_file.read_text())['date'] == '2025-10-01'
+    assert list(watermark_file.parent.glob('*.tmp')) == []
+
+    # Data types keep separate watermarks
+    options_file = metadata_manager._get_watermark_file('options_daily')
+    assert json.loads(options_file.read_text())['date'] == '2025-09-29'
+
+
 def test_get_missing_dates(metadata_manager):
     """Test finding missing dates"""
     expected_dates = ['2025-09-26', '2025-09-27', '2025-09-29', '2025-09-30']
@@ -0,0 +1,69 @@
+"""
+Unit tests for the partition manifest
+
+Run with: pytest tests/unit/test_partition_manifest.py
+"""
+
+import pytest
+from pathlib import Path
+
+from src.download.partition_manifest import (
+    append_manifest,
+    manifest_path,
+    read_manifest_tickers,
+    rebuild_manifest,
+)
+
+
+def write_partition(output_dir: Path, data_type: str, ticker: str, year: int, month: int) -> dict:
+    """Create an (empty) partition file and return its manifest entry"""
+    file_path = output_dir / data_type / f'year={year}' / f'month={month:02d}' / f'ticker={ticker}.parquet'
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.touch()
+    return {
+        'ticker': ticker,
+        'year': year,
+        'month': month,
+        'path': str(file_path.relative_to(output_dir)),
+    }
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    """Create temporary downloader output directory"""
+    return tmp_path / 'fundamentals'
+
+
+def test_append_manifest(output_dir):
+    """Test appended entries are read back as tickers"""
+    append_manifest(output_dir, 'balance_sheets', [write_partition(output_dir, 'balance_sheets', 'AAPL', 2024, 3)])
+    append_manifest(output_dir, 'balance_sheets', [write_partition(output_dir, 'balance_sheets', 'MSFT', 2024, 3)])
+
+    assert read_manifest_tickers(output_dir, 'balance_sheets') == {'AAPL', 'MSFT'}
+
+
+def test_append_manifest_seeds_existing_lake(output_dir):
+    """Test the first append into a lake without a manifest lists existing partitions"""
+    write_partition(output_dir, 'balance_sheets', 'AAPL', 2023, 12)
+    write_partition(output_dir, 'balance_sheets', 'MSFT', 2024, 3)
+    assert not manifest_path(output_dir, 'balance_sheets').exists()
+
+    # e.g. a daily update saving one ticker
+    append_manifest(output_dir, 'balance_sheets', [write_partition(output_dir, 'balance_sheets', 'NVDA', 2024, 6)])
+
+    assert read_manifest_tickers(output_dir, 'balance_sheets') == {'AAPL', 'MSFT', 'NVDA'}
+
+    # Later appends only add their own entries
+    append_manifest(output_dir, 'balance_sheets', [write_partition(output_dir, 'balance_sheets', 'TSLA', 2024, 6)])
+    lines = manifest_path(output_dir, 'balance_sheets').read_text().splitlines()
+    assert len(lines) == 4
+
+
+def test_rebuild_manifest(output_dir):
+    """Test rebuilding replaces the manifest with the files on disk"""
+    append_manifest(output_dir, 'cash_flow', [write_partition(output_dir, 'cash_flow', 'AAPL', 2024, 3)])
+    (output_dir / 'cash_flow' / 'year=2024' / 'month=03' / 'ticker=AAPL.parquet').unlink()
+    write_partition(output_dir, 'cash_flow', 'MSFT', 2024, 3)
+
+    assert rebuild_manifest(output_dir, 'cash_flow') == {'MSFT'}
+    assert read_manifest_tickers(output_dir, 'cash_flow') == {'MSFT'}
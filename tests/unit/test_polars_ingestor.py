@@ -0,0 +1,144 @@
+"""
+Unit tests for PolarsIngestor
+
+Run with: pytest tests/unit/test_polars_ingestor.py
+"""
+
+import gzip
+import pytest
+import pandas as pd
+import pyarrow.parquet as pq
+from pathlib import Path
+from io import BytesIO
+
+from src.ingest.polars_ingestor import PolarsIngestor
+from src.ingest.base_ingestor import IngestionError
+
+
+@pytest.fixture
+def test_config():
+    """Configuration for testing"""
+    return {
+        'resource_limits': {
+            'max_memory_gb': 14.0,
+            'max_memory_percent': 70,
+            'chunk_size_mb': 100,
+        }
+    }
+
+
+@pytest.fixture
+def test_ingestor(tmp_path, test_config):
+    """Create test ingestor instance"""
+    return PolarsIngestor(
+        data_type='stocks_daily',
+        output_root=tmp_path / 'parquet',
+        config=test_config
+    )
+
+
+def make_csv(n_rows: int, date: str = '2025-09-29') -> bytes:
+    """Create sample CSV bytes"""
+    df = pd.DataFrame({
+        'ticker': [f'T{i}' for i in range(n_rows)],
+        'volume': [1000000 + i for i in range(n_rows)],
+        'open': [100.0 + i * 0.1 for i in range(n_rows)],
+        'close': [101.0 + i * 0.1 for i in range(n_rows)],
+        'high': [102.0 + i * 0.1 for i in range(n_rows)],
+        'low': [99.0 + i * 0.1 for i in range(n_rows)],
+        'window_start': [int(pd.Timestamp(f'{date} 09:30', tz='UTC').value)] * n_rows,
+        'transactions': [1000 + i for i in range(n_rows)],
+    })
+    return df.to_csv(index=False).encode()
+
+
+@pytest.fixture
+def landing_files(tmp_path):
+    """Two gzipped days and one header-only day"""
+    landing = tmp_path / 'landing'
+    landing.mkdir()
+
+    files = {}
+    for date, n_rows in [('2025-09-29', 250), ('2025-09-30', 120), ('2025-10-01', 0)]:
+        path = landing / f'{date}.csv.gz'
+        path.write_bytes(gzip.compress(make_csv(n_rows, date)))
+        files[date] = path
+
+    return files
+
+
+def test_ingest_many(test_ingestor, landing_files):
+    """Test one multi-file scan writes each date like ingest_date"""
+    results = test_ingestor.ingest_many(landing_files)
+
+    assert results['2025-09-29']['status'] == 'success'
+    assert results['2025-09-29']['records'] == 250
+    assert results['2025-09-30']['records'] == 120
+
+    # Header-only files still get an (empty) output
+    assert results['2025-10-01']['status'] == 'success'
+    assert results['2025-10-01']['records'] == 0
+
+    # Rows land in their own date's file
+    table = pq.read_table(test_ingestor._get_output_path('2025-09-30'))
+    assert table.num_rows == 120
+    assert '_source_file' not in table.column_names
+
+    # Same output as ingest_date
+    reference = PolarsIngestor(
+        data_type='stocks_daily',
+        output_root=test_ingestor.output_root.parent / 'reference',
+        config=test_ingestor.config
+    )
+    reference.ingest_date('2025-09-29', BytesIO(landing_files['2025-09-29'].read_bytes()))
+    assert table.schema == pq.read_schema(reference._get_output_path('2025-09-29'))
+
+
+def test_ingest_many_skips_existing(test_ingestor, landing_files):
+    """Test dates whose output already exists are skipped"""
+    test_ingestor.ingest_date('2025-09-29', BytesIO(landing_files['2025-09-29'].read_bytes()))
+
+    results = test_ingestor.ingest_many(landing_files)
+
+    assert results['2025-09-29']['status'] == 'skipped'
+    assert results['2025-09-29']['reason'] == 'output_exists'
+    assert results['2025-09-30']['status'] == 'success'
+
+
+def test_ingest_many_relative_paths(test_ingestor, landing_files, monkeypatch):
+    """Test files given as relative paths are matched to their rows"""
+    monkeypatch.chdir(landing_files['2025-09-29'].parent.parent)
+    relative = {date: Path('landing') / path.name for date, path in landing_files.items()}
+
+    results = test_ingestor.ingest_many(relative)
+
+    assert results['2025-09-29']['records'] == 250
+    assert results['2025-09-30']['records'] == 120
+
+
+def test_ingest_many_scan_error(test_ingestor, landing_files):
+    """Test a file that cannot be parsed fails the whole scan"""
+    landing_files['2025-09-30'].write_bytes(gzip.compress(b'a,b\n1,2\n'))
+
+    with pytest.raises(IngestionError):
+        test_ingestor.ingest_many(landing_files)
+
+    assert not test_ingestor._get_output_path('2025-09-29').exists()
+
+
+def test_ingest_many_unmatched_rows(test_ingestor, landing_files, monkeypatch):
+    """Test rows that cannot be matched to a file fail instead of writing empty output"""
+    import polars as pl
+
+    partition_by = pl.DataFrame.partition_by
+
+    def renamed_partitions(self, *args, **kwargs):
+        # Simulate source paths reported in a different form than requested
+        return {('other/' + key[0],): df for key, df in partition_by(self, *args, **kwargs).items()}
+
+    monkeypatch.setattr(pl.DataFrame, 'partition_by', renamed_partitions)
+
+    with pytest.raises(IngestionError):
+        test_ingestor.ingest_many(landing_files)
+
+    assert not test_ingestor._get_output_path('2025-09-29').exists()
@@ -4,6 +4,7 @@ Unit tests for StreamingIngestor
 Run with: pytest tests/unit/test_streaming_ingestor.py
 """
 
+import gzip
 import pytest
 import pandas as pd
 from pathlib import Path
@@ -166,6 +167,18 @@ def test_statistics_tracking(test_ingestor, sample_csv_data):
     assert stats['errors'] == 0
 
 
+def test_ingest_gzip_stream(test_ingestor, sample_csv_data):
+    """Test ingesting from a stream that decompresses as it is read"""
+    csv_size = len(sample_csv_data.getvalue())
+    stream = gzip.GzipFile(fileobj=BytesIO(gzip.compress(sample_csv_data.getvalue())))
+
+    result = test_ingestor.ingest_date('2025-09-29', stream)
+
+    assert result['status'] == 'success'
+    assert result['records'] == 250
+    assert test_ingestor.get_statistics()['bytes_processed'] == csv_size
+
+
 def test_symbol_filtering(test_ingestor):
     """Test symbol filtering during ingestion"""
     # Create data with multiple symbols